@@ -34,6 +34,7 @@ from m8.api.phrase import M8Phrase, M8PhraseStep, M8Note
 from m8.api.chain import M8Chain, M8ChainStep
 from m8.api.fx import M8FXTuple, M8SequenceFX, M8SamplerFX
 from m8.tools.chain_builder import ChainBuilder
+from m8.tools.sample_cache import SampleCache
 
 from demos.patterns.acid_909 import (
     get_random_kick_pattern,
@@ -46,6 +47,7 @@ from demos.patterns.acid_909 import (
 PROJECT_NAME = "ACID-BANG-909-CHAIN"
 OUTPUT_DIR = Path("tmp/demos/acid_909_chain")
 SAMPLES_BASE = Path("tmp/erica-pico-samples")
+SAMPLE_CACHE = Path("tmp/sample-cache")
 BPM = 130
 SEED = 42
 NUM_ROWS = 16
@@ -209,7 +211,8 @@ def create_sample_chain(samples_by_type: Dict[str, List[Path]], rng: random.Rand
     builder = ChainBuilder(
         slice_duration_ms=slice_duration_ms,
         fade_ms=3,
-        frame_rate=44100
+        frame_rate=44100,
+        cache=SampleCache(SAMPLE_CACHE)
     )
 
     chain_wav_io, _ = builder.build_chain(selected_samples)
@@ -82,3 +82,21 @@ def load_presets_yaml(preset_dir, instrument_class=None):
         presets[preset_name] = load_preset_yaml(filepath, instrument_class)
 
     return presets
+
+
+def pack_presets_yaml(preset_dir, bank_path, instrument_class=None):
+    """Pack a directory of YAML presets into a single preset bank.
+
+    Banks open without parsing anything, so browsers over thousands of
+    presets should read the bank rather than the YAML directory.
+
+    Args:
+        preset_dir: Directory containing YAML preset files
+        bank_path: Bank file to write (see m8.tools.preset_bank)
+        instrument_class: Optional instrument class, as for load_presets_yaml
+
+    Returns:
+        Number of presets packed
+    """
+    from m8.tools.preset_bank import write_bank
+    return write_bank(bank_path, load_presets_yaml(preset_dir, instrument_class))
@@ -25,7 +25,7 @@ EQ list; 0xFF means "no EQ assigned".
 
 from enum import IntEnum
 
-from m8.api.fields import ByteField, iter_fields
+from m8.api.fields import ByteField, field_layout
 
 
 EQ_BAND_BYTES = 6
@@ -36,6 +36,16 @@ EQ_BYTES = EQ_BAND_BYTES * EQ_BANDS_PER_EQ  # 18
 EQ_COUNT_V4_1 = 132
 EQ_COUNT = EQ_COUNT_V4_1
 
+# mode_byte packing: type in bits 0-2, stereo mode in bits 5-7.
+EQ_TYPE_MASK = 0x07
+EQ_MODE_SHIFT = 5
+EQ_MODE_MASK = 0x07
+
+
+def unpack_mode_byte(mode_byte):
+    """Split a band's mode_byte into (eq_type, eq_mode)."""
+    return mode_byte & EQ_TYPE_MASK, (mode_byte >> EQ_MODE_SHIFT) & EQ_MODE_MASK
+
 
 class M8EqType(IntEnum):
     """EQ filter type (stored in low 3 bits of mode_byte)."""
@@ -77,31 +87,30 @@ class M8EqBand:
     q          = ByteField(5)
 
     def __init__(self, **kwargs):
-        self._data = bytearray(self.BYTES)
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self._data = field_layout(type(self)).new_data()
         for key, value in kwargs.items():
             setattr(self, key, value)
 
     @property
     def eq_type(self):
-        return self.mode_byte & 0x07
+        return unpack_mode_byte(self.mode_byte)[0]
 
     @eq_type.setter
     def eq_type(self, value):
         if hasattr(value, "value"):
             value = value.value
-        self.mode_byte = (self.mode_byte & 0xF8) | (int(value) & 0x07)
+        self.mode_byte = (self.mode_byte & ~EQ_TYPE_MASK & 0xFF) | (int(value) & EQ_TYPE_MASK)
 
     @property
     def eq_mode(self):
-        return (self.mode_byte >> 5) & 0x07
+        return unpack_mode_byte(self.mode_byte)[1]
 
     @eq_mode.setter
     def eq_mode(self, value):
         if hasattr(value, "value"):
             value = value.value
-        self.mode_byte = (self.mode_byte & 0x1F) | ((int(value) & 0x07) << 5)
+        mask = EQ_MODE_MASK << EQ_MODE_SHIFT
+        self.mode_byte = (self.mode_byte & ~mask & 0xFF) | ((int(value) & EQ_MODE_MASK) << EQ_MODE_SHIFT)
 
     def frequency(self):
         """Combined 16-bit unsigned frequency."""
@@ -145,22 +154,24 @@ class M8EqBand:
         return f"M8EqBand({t}/{m}, freq={self.frequency()}, gain={self.gain_db():+.2f}dB, q={self.q})"
 
     def to_dict(self):
+        mode_byte, freq_fin, freq, level_fin, level, q = field_layout(type(self)).record(self._data)
+        eq_type, eq_mode = unpack_mode_byte(mode_byte)
         try:
-            type_name = M8EqType(self.eq_type).name
+            type_name = M8EqType(eq_type).name
         except ValueError:
-            type_name = self.eq_type
+            type_name = eq_type
         try:
-            mode_name = M8EqMode(self.eq_mode).name
+            mode_name = M8EqMode(eq_mode).name
         except ValueError:
-            mode_name = self.eq_mode
+            mode_name = eq_mode
         return {
             "eq_type": type_name,
             "eq_mode": mode_name,
-            "freq": self.freq,
-            "freq_fin": self.freq_fin,
-            "level": self.level,
-            "level_fin": self.level_fin,
-            "q": self.q,
+            "freq": freq,
+            "freq_fin": freq_fin,
+            "level": level,
+            "level_fin": level_fin,
+            "q": q,
         }
 
     @classmethod
@@ -11,6 +11,8 @@ unchanged, which is what makes the format-faithful read/write work even when
 pym8 doesn't yet model every byte.
 """
 
+import struct
+
 from m8.api import _read_fixed_string, _write_fixed_string
 
 
@@ -36,6 +38,10 @@ class ByteField:
         return obj._data[self.offset]
 
     def __set__(self, obj, value):
+        obj._data[self.offset] = self.check(value)
+
+    def check(self, value):
+        """Validated int for `value` (int or enum member)."""
         if hasattr(value, "value"):
             value = value.value
         value = int(value)
@@ -43,13 +49,13 @@ class ByteField:
             raise ValueError(
                 f"{self.name}={value} out of range [{self.min}, {self.max}]"
             )
-        obj._data[self.offset] = value
+        return value
 
     def apply_default(self, obj):
         obj._data[self.offset] = self.default & 0xFF
 
-    def to_dict(self, obj):
-        value = obj._data[self.offset]
+    def decode(self, value):
+        """Dict form of a raw byte: the enum member name, else the int."""
         if self.enum is not None:
             try:
                 return self.enum(value).name
@@ -57,10 +63,17 @@ class ByteField:
                 pass
         return value
 
-    def from_dict(self, obj, value):
+    def encode(self, value):
+        """Validated raw byte for a dict value (enum name, member or int)."""
         if isinstance(value, str) and self.enum is not None:
             value = self.enum[value].value
-        self.__set__(obj, value)
+        return self.check(value)
+
+    def to_dict(self, obj):
+        return self.decode(obj._data[self.offset])
+
+    def from_dict(self, obj, value):
+        obj._data[self.offset] = self.encode(value)
 
 
 class StringField:
@@ -236,13 +249,7 @@ class IndexedBytesField:
 _FIELD_TYPES = (ByteField, StringField, BytesField, IndexedBytesField)
 
 
-def iter_fields(cls):
-    """Yield (name, descriptor) for every field descriptor on cls and its bases.
-
-    Subclass declarations win when a name is declared in both subclass and base.
-    Resolution order: subclass fields first (in declaration order), then each
-    successive base, skipping names already collected.
-    """
+def _collect_fields(cls):
     seen = set()
     subclass_order = []
     inherited_order = []
@@ -253,3 +260,176 @@ def iter_fields(cls):
                 target = subclass_order if index == 0 else inherited_order
                 target.append((name, attr))
     return subclass_order + inherited_order
+
+
+class _DataHolder:
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+
+class FieldLayout:
+    """Compiled field table of one descriptor class, built once per class.
+
+    Attributes:
+        fields: (name, descriptor) tuples in `iter_fields` order
+        by_name: {name: descriptor}
+        byte_fields: (name, ByteField) tuples, a subset of `fields`
+        struct: `struct.Struct` of every byte from the first to the last
+                ByteField offset (`span_start` on), so a whole record is
+                unpacked — and packed back, bytes between fields included —
+                in one call; `byte_index[name]` is a field's index into it
+        template: default `_data` — the class's blank block (`_blank_data()`
+                  or `BYTES` zero bytes) with every field default applied,
+                  so construction is a single `bytearray(layout.template)`
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fields = tuple(_collect_fields(cls))
+        self.by_name = dict(self.fields)
+        self.byte_fields = tuple((n, f) for n, f in self.fields if type(f) is ByteField)
+        self.other_fields = tuple((n, f) for n, f in self.fields if type(f) is not ByteField)
+        offsets = [f.offset for _, f in self.byte_fields]
+        self.span_start = min(offsets) if offsets else 0
+        span = max(offsets) + 1 - self.span_start if offsets else 0
+        self.struct = struct.Struct("<%dB" % span)
+        self.byte_index = {n: f.offset - self.span_start for n, f in self.byte_fields}
+        self._record_index = tuple(self.byte_index[n] for n, _ in self.byte_fields)
+        self._template = None
+        self._plans = {}
+        self._encoders = None
+
+    @property
+    def template(self):
+        if self._template is None:
+            blank = getattr(self.cls, "_blank_data", None)
+            holder = _DataHolder(bytearray(blank() if blank else self.cls.BYTES))
+            for _, fld in self.fields:
+                fld.apply_default(holder)
+            self._template = bytes(holder._data)
+        return self._template
+
+    def new_data(self):
+        """A fresh, default-initialised `_data` bytearray."""
+        return bytearray(self.template)
+
+    def unpack_bytes(self, data):
+        """The ByteField span of `data` as a tuple, indexed by `byte_index`."""
+        return self.struct.unpack_from(data, self.span_start)
+
+    def record(self, data):
+        """ByteField values of `data` as a tuple, in `byte_fields` order."""
+        span = self.struct.unpack_from(data, self.span_start)
+        return tuple([span[i] for i in self._record_index])
+
+    def pack_record(self, data, values):
+        """Write a `record()`-ordered tuple of raw byte values into `data`.
+
+        Values are written as-is (no range checks) in a single pack.
+        """
+        span = list(self.struct.unpack_from(data, self.span_start))
+        for i, value in zip(self._record_index, values):
+            span[i] = value
+        self.struct.pack_into(data, self.span_start, *span)
+
+    def _decode_plan(self, skip):
+        plan = self._plans.get(skip)
+        if plan is None:
+            plan = []
+            for name, fld in self.fields:
+                if name in skip:
+                    continue
+                index = self.byte_index.get(name)
+                table = None
+                if index is not None and fld.enum is not None:
+                    # byte -> dict value for all 256 bytes, so decoding is a lookup
+                    table = tuple(fld.decode(v) for v in range(256))
+                plan.append((name, fld, index, table))
+            plan = self._plans[skip] = tuple(plan)
+        return plan
+
+    def to_dict(self, obj, skip=()):
+        """{name: dict value} for every field, ByteFields decoded in one unpack."""
+        span = self.struct.unpack_from(obj._data, self.span_start)
+        result = {}
+        for name, fld, index, table in self._decode_plan(skip):
+            if index is None:
+                result[name] = fld.to_dict(obj)
+            elif table is None:
+                result[name] = span[index]
+            else:
+                result[name] = table[span[index]]
+        return result
+
+    @property
+    def _encode_plan(self):
+        plan = self._encoders
+        if plan is None:
+            plan = {}
+            for name, fld in self.fields:
+                index = self.byte_index.get(name)
+                if index is None:
+                    plan[name] = (None, fld, None, 0, 0)
+                    continue
+                names = None
+                if fld.enum is not None:
+                    names = {n: m.value for n, m in fld.enum.__members__.items()}
+                plan[name] = (index, fld, names, fld.min, fld.max)
+            self._encoders = plan
+        return plan
+
+    def from_dict(self, obj, values):
+        """Apply a name-keyed dict; unknown keys are ignored.
+
+        ByteField values are validated, then written back with one pack;
+        other fields go through their descriptors afterwards.
+        """
+        plan = self._encode_plan
+        span = None
+        others = []
+        for key, value in values.items():
+            entry = plan.get(key)
+            if entry is None:
+                continue  # forward-compatible: ignore unknown keys
+            index, fld, names, lo, hi = entry
+            if index is None:
+                others.append((fld, value))
+                continue
+            if span is None:
+                span = list(self.struct.unpack_from(obj._data, self.span_start))
+            if names is not None and type(value) is str:
+                value = names.get(value, value)
+            if type(value) is int and lo <= value <= hi:
+                span[index] = value
+            else:
+                span[index] = fld.encode(value)  # enum members, errors
+        if span is not None:
+            self.struct.pack_into(obj._data, self.span_start, *span)
+        for fld, value in others:
+            fld.from_dict(obj, value)
+
+
+def field_layout(cls):
+    """The FieldLayout of `cls`, compiled on first use and cached on the class.
+
+    Cached in the class's own __dict__, so subclasses compile their own.
+    Classes must not gain field descriptors after their layout is built.
+    """
+    layout = cls.__dict__.get("_field_layout")
+    if layout is None:
+        layout = FieldLayout(cls)
+        cls._field_layout = layout
+    return layout
+
+
+def iter_fields(cls):
+    """Return (name, descriptor) for every field descriptor on cls and its bases.
+
+    Subclass declarations win when a name is declared in both subclass and base.
+    Resolution order: subclass fields first (in declaration order), then each
+    successive base, skipping names already collected. The result is the
+    class's cached `field_layout(cls).fields`.
+    """
+    return field_layout(cls).fields
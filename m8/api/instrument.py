@@ -11,7 +11,7 @@ import warnings
 from enum import IntEnum
 
 from m8.api import M8Block
-from m8.api.fields import ByteField, StringField, iter_fields
+from m8.api.fields import ByteField, StringField, field_layout
 from m8.api.modulator import M8Modulators
 from m8.api.version import M8Version
 
@@ -29,6 +29,13 @@ MODULATORS_OFFSET = 63
 BLOCK_SIZE = INSTRUMENTS_BLOCK_SIZE
 BLOCK_COUNT = INSTRUMENTS_COUNT
 
+# .m8i single-instrument files: header, instrument block (modulators in the
+# M8i layout at offset 61), then the instrument's 16-step table.
+M8I_HEADER = b"M8VERSION\x00"
+M8I_VERSION_OFFSET = 10
+M8I_INSTRUMENT_OFFSET = 14
+M8I_MODULATORS_OFFSET = 61
+
 
 class M8InstrumentType(IntEnum):
     WAVSYNTH = 0
@@ -66,6 +73,16 @@ class M8LimiterType(IntEnum):
 
 
 _INSTRUMENT_REGISTRY = {}
+_registry_loaded = False
+
+
+def _ensure_registry():
+    """Import every concrete instrument module (once) so that
+    _INSTRUMENT_REGISTRY is fully populated."""
+    global _registry_loaded
+    if not _registry_loaded:
+        from m8.api.instruments import sampler, wavsynth, macrosynth, fmsynth, external, midiout, hypersynth  # noqa: F401
+        _registry_loaded = True
 
 
 class M8Instrument:
@@ -91,16 +108,21 @@ class M8Instrument:
         super().__init_subclass__(**kwargs)
         if cls.TYPE_ID is not None:
             _INSTRUMENT_REGISTRY[int(cls.TYPE_ID)] = cls
+        field_layout(cls)
+
+    @classmethod
+    def _blank_data(cls):
+        data = bytearray(BLOCK_SIZE)
+        data[TYPE_OFFSET] = int(cls.TYPE_ID)
+        return data
 
     def __init__(self, **kwargs):
         if self.TYPE_ID is None:
             raise TypeError(f"{type(self).__name__} must declare TYPE_ID")
-        self._data = bytearray(BLOCK_SIZE)
-        self._data[TYPE_OFFSET] = int(self.TYPE_ID)
+        self._data = field_layout(type(self)).new_data()
         self.version = M8Version()
         self.modulators = M8Modulators()
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self.m8i_table = None
         for key, value in kwargs.items():
             if value is None or value == "":
                 continue
@@ -119,8 +141,9 @@ class M8Instrument:
     def clone(self):
         instance = self.__class__.__new__(self.__class__)
         instance._data = bytearray(self._data)
-        instance.version = M8Version(self.version.major, self.version.minor, self.version.patch)
+        instance.version = self.version.clone()
         instance.modulators = self.modulators.clone()
+        instance.m8i_table = self.m8i_table.clone() if self.m8i_table is not None else None
         return instance
 
     @classmethod
@@ -131,16 +154,34 @@ class M8Instrument:
         version-conditional layout (EQ packing in v6.0+, SynthParams in
         v3.0+, etc.) should consult it. Defaults to the bundled template
         firmware when not provided.
+
+        When called on M8Instrument (the base), dispatches to the subclass
+        registered for the block's type byte.
         """
+        if cls is M8Instrument:
+            _ensure_registry()
+            subclass = _INSTRUMENT_REGISTRY.get(data[TYPE_OFFSET])
+            if subclass is None:
+                raise ValueError(f"Unsupported instrument type 0x{data[TYPE_OFFSET]:02X}")
+            return subclass.read(data, version=version)
+
         instance = cls.__new__(cls)
         instance._data = bytearray(data[:BLOCK_SIZE])
         instance.version = version if version is not None else M8Version()
         instance.modulators = M8Modulators.read(data[MODULATORS_OFFSET:])
+        instance.m8i_table = None
         return instance
 
     @classmethod
     def read_from_file(cls, file_path):
-        """Read an .m8i single-instrument file.
+        """Read an .m8i single-instrument file (see `read_m8i`)."""
+        with open(file_path, "rb") as f:
+            data = f.read()
+        return cls.read_m8i(data, source=file_path)
+
+    @classmethod
+    def read_m8i(cls, data, source=None):
+        """Parse the contents of an .m8i single-instrument file.
 
         M8i files have:
         - Metadata header at byte 0
@@ -148,28 +189,65 @@ class M8Instrument:
         - Instrument data at byte 14 (the metadata offset constant)
         - Modulators at instrument-offset 61 in an M8i-specific layout
           (instead of offset 63 used in M8s project files)
+        - The instrument's table after the instrument block, kept as
+          `m8i_table` so `write_m8i()` can write it back
+
+        `source` only names the file in error messages.
         """
-        from m8.api.metadata import METADATA_OFFSET
-        # Eagerly import every subclass so the registry is populated.
-        from m8.api.instruments import sampler, wavsynth, macrosynth, fmsynth, external, midiout, hypersynth  # noqa: F401
+        from m8.api.table import M8Table, TABLE_BYTES
 
-        with open(file_path, "rb") as f:
-            data = f.read()
+        _ensure_registry()
 
-        version = M8Version.read(data[10:])
-        instrument_data = data[METADATA_OFFSET:]
+        version = M8Version.read(data[M8I_VERSION_OFFSET:])
+        instrument_data = data[M8I_INSTRUMENT_OFFSET:]
         instr_type = instrument_data[TYPE_OFFSET]
 
         subclass = _INSTRUMENT_REGISTRY.get(instr_type)
         if subclass is None:
-            raise ValueError(f"Unsupported instrument type 0x{instr_type:02X} in {file_path}")
+            where = f" in {source}" if source is not None else ""
+            raise ValueError(f"Unsupported instrument type 0x{instr_type:02X}{where}")
 
         instance = subclass.read(instrument_data, version=version)
         # M8i modulators are at offset 61 and use a different parameter order
         # for LFO modulators — convert to the M8s in-memory layout.
-        instance.modulators = M8Modulators.read_m8i(instrument_data[61:])
+        instance.modulators = M8Modulators.read_m8i(instrument_data[M8I_MODULATORS_OFFSET:])
+        table_data = instrument_data[BLOCK_SIZE:BLOCK_SIZE + TABLE_BYTES]
+        if len(table_data) == TABLE_BYTES:
+            instance.m8i_table = M8Table.read(table_data)
         return instance
 
+    def write_m8i(self, table=None):
+        """Contents of an .m8i file for this instrument (see `read_m8i`).
+
+        Args:
+            table: The instrument's M8Table (by convention table N of the
+                   project for instrument N); if None, the table read with
+                   the instrument from an .m8i, else an empty table
+
+        Raises:
+            ValueError: if the modulator slot types can't be stored in M8i
+        """
+        from m8.api.table import M8Table
+
+        block = bytearray(self._data[:BLOCK_SIZE].ljust(BLOCK_SIZE, b"\x00"))
+        mod_data = self.modulators.write_m8i()
+        block[M8I_MODULATORS_OFFSET:M8I_MODULATORS_OFFSET + len(mod_data)] = mod_data
+        if table is None:
+            table = self.m8i_table if self.m8i_table is not None else M8Table()
+        table_data = table.write()
+        return M8I_HEADER + self.version.write() + bytes(block) + table_data
+
+    def write_to_file(self, file_path, table=None):
+        """Write an .m8i single-instrument file (see `write_m8i`)."""
+        import os
+
+        directory = os.path.dirname(str(file_path))
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        with open(file_path, "wb") as f:
+            f.write(self.write_m8i(table))
+
     def to_dict(self):
         """Serialize to a name-keyed dict suitable for YAML/JSON.
 
@@ -180,16 +258,10 @@ class M8Instrument:
         except ValueError:
             type_name = self.type_id
 
-        params = {}
-        for name, fld in iter_fields(type(self)):
-            if name == "name":
-                continue
-            params[name] = fld.to_dict(self)
-
         return {
             "type": type_name,
             "name": self.name,
-            "params": params,
+            "params": field_layout(type(self)).to_dict(self, skip=("name",)),
             "modulators": self.modulators.to_dict(dest_enum_class=self.MOD_DEST_ENUM_CLASS),
         }
 
@@ -202,8 +274,7 @@ class M8Instrument:
         values for enum-typed parameters.
         """
         if cls is M8Instrument and "type" in params:
-            # Eagerly import subclasses so the registry is populated.
-            from m8.api.instruments import sampler, wavsynth, macrosynth, fmsynth, external, midiout, hypersynth  # noqa: F401
+            _ensure_registry()
 
             type_value = params["type"]
             if isinstance(type_value, str):
@@ -222,12 +293,8 @@ class M8Instrument:
         if "name" in params:
             instance.name = params["name"]
 
-        fields_by_name = {name: fld for name, fld in iter_fields(cls)}
-        for key, value in params.get("params", {}).items():
-            fld = fields_by_name.get(key)
-            if fld is None:
-                continue  # forward-compatible: ignore unknown keys
-            fld.from_dict(instance, value)
+        # Unknown keys are ignored (forward-compatible)
+        field_layout(cls).from_dict(instance, params.get("params", {}))
 
         if "modulators" in params:
             instance.modulators = M8Modulators.from_dict(
@@ -236,6 +303,126 @@ class M8Instrument:
         return instance
 
 
+class M8InstrumentColumn:
+    """Live view of one ByteField across every instrument slot.
+
+    Slots whose instrument doesn't declare the field (other types, empty
+    slots) are masked: they read as None and are skipped on assignment.
+    The field may sit at a different offset in each instrument type; the
+    view resolves it per slot::
+
+        cutoff = project.instruments.column("cutoff")
+        cutoff.set(0x80)                           # every slot that has it
+        cutoff.set([v // 2 if v else None for v in cutoff])
+        arr = cutoff.to_numpy()                    # masked uint8 array
+        cutoff.set(np.ma.minimum(arr, 0xC0))       # masked entries skipped
+    """
+
+    def __init__(self, instruments, name):
+        self._instruments = instruments
+        self.name = name
+
+    def _field(self, instr):
+        if not isinstance(instr, M8Instrument):
+            return None
+        fld = field_layout(type(instr)).by_name.get(self.name)
+        return fld if type(fld) is ByteField else None
+
+    def _fields(self):
+        """ByteField (or None) for each slot, resolved once per type."""
+        by_type = {}
+        fields = []
+        for instr in self._instruments:
+            kind = type(instr)
+            if kind not in by_type:
+                by_type[kind] = self._field(instr)
+            fields.append(by_type[kind])
+        return fields
+
+    def _masked_error(self, index):
+        return ValueError(
+            f"Instrument slot {index} ({type(self._instruments[index]).__name__}) "
+            f"has no field {self.name!r}"
+        )
+
+    def __len__(self):
+        return len(self._instruments)
+
+    def __iter__(self):
+        return iter(self.values())
+
+    def __getitem__(self, index):
+        instr = self._instruments[index]
+        fld = self._field(instr)
+        return None if fld is None else instr._data[fld.offset]
+
+    def __setitem__(self, index, value):
+        instr = self._instruments[index]
+        fld = self._field(instr)
+        if fld is None:
+            raise self._masked_error(index)
+        instr._data[fld.offset] = fld.encode(value)
+
+    @property
+    def mask(self):
+        """True for each slot without the field (numpy.ma convention)."""
+        return [fld is None for fld in self._fields()]
+
+    def values(self):
+        """Raw byte per slot; None where masked."""
+        return [None if fld is None else instr._data[fld.offset]
+                for instr, fld in zip(self._instruments, self._fields())]
+
+    def set(self, values):
+        """Assign the field across all slots.
+
+        Args:
+            values: A single value (int, enum member or enum name) for every
+                    unmasked slot, or one value per slot — a sequence, numpy
+                    array or masked array — where None/masked entries are
+                    left unchanged
+
+        Returns:
+            int: Number of slots written
+
+        Raises:
+            ValueError: if a value is out of range, a sequence has the wrong
+                        length or assigns to a masked slot; nothing is
+                        written in that case
+        """
+        fields = self._fields()
+        if hasattr(values, "tolist"):
+            values = values.tolist()  # masked entries become None
+        if isinstance(values, (list, tuple)):
+            if len(values) != len(fields):
+                raise ValueError(f"Expected {len(fields)} values, got {len(values)}")
+        else:
+            values = [None if fld is None else values for fld in fields]
+
+        writes = []
+        for index, (fld, value) in enumerate(zip(fields, values)):
+            if value is None:
+                continue
+            if fld is None:
+                raise self._masked_error(index)
+            writes.append((self._instruments[index]._data, fld.offset, fld.encode(value)))
+        for data, offset, value in writes:
+            data[offset] = value
+        return len(writes)
+
+    def to_numpy(self):
+        """numpy masked uint8 array of the column (requires numpy)."""
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("to_numpy() requires numpy (pip install numpy)") from e
+        values = self.values()
+        return np.ma.MaskedArray(
+            [0 if v is None else v for v in values],
+            mask=[v is None for v in values], dtype=np.uint8,
+        )
+
+
 class M8Instruments(list):
     """The 128-slot instrument collection inside a project."""
 
@@ -250,39 +437,41 @@ class M8Instruments(list):
 
     @classmethod
     def read(cls, data, version=None):
-        # Eagerly import every concrete subclass so the registry is populated.
-        from m8.api.instruments import sampler, wavsynth, macrosynth, fmsynth, external, midiout, hypersynth  # noqa: F401
+        _ensure_registry()
 
         instance = cls.__new__(cls)
         list.__init__(instance)
 
         for i in range(BLOCK_COUNT):
             start = i * BLOCK_SIZE
-            block_data = data[start:start + BLOCK_SIZE]
-            instr_type = block_data[0]
-
-            subclass = _INSTRUMENT_REGISTRY.get(instr_type)
-            if subclass is not None:
-                instance.append(subclass.read(block_data, version=version))
-            elif instr_type == 0xFF:
-                instance.append(M8Block.read(block_data))
-            else:
-                try:
-                    type_name = M8InstrumentType(instr_type).name
-                    msg = (
-                        f"Instrument slot {i}: type {type_name} (0x{instr_type:02X}) "
-                        "is not implemented; data will round-trip but cannot be edited"
-                    )
-                except ValueError:
-                    msg = (
-                        f"Instrument slot {i}: unknown type 0x{instr_type:02X}; "
-                        "data will round-trip but cannot be edited"
-                    )
-                warnings.warn(msg, stacklevel=2)
-                instance.append(M8Block.read(block_data))
+            instance.append(cls._read_slot(i, data[start:start + BLOCK_SIZE], version))
 
         return instance
 
+    @staticmethod
+    def _read_slot(index, block_data, version=None):
+        """Instrument for one slot's block; M8Block for empty or
+        unsupported types (the latter with a warning)."""
+        instr_type = block_data[0]
+
+        subclass = _INSTRUMENT_REGISTRY.get(instr_type)
+        if subclass is not None:
+            return subclass.read(block_data, version=version)
+        if instr_type != 0xFF:
+            try:
+                type_name = M8InstrumentType(instr_type).name
+                msg = (
+                    f"Instrument slot {index}: type {type_name} (0x{instr_type:02X}) "
+                    "is not implemented; data will round-trip but cannot be edited"
+                )
+            except ValueError:
+                msg = (
+                    f"Instrument slot {index}: unknown type 0x{instr_type:02X}; "
+                    "data will round-trip but cannot be edited"
+                )
+            warnings.warn(msg, stacklevel=3)
+        return M8Block.read(block_data)
+
     def clone(self):
         instance = self.__class__.__new__(self.__class__)
         list.__init__(instance)
@@ -301,6 +490,18 @@ class M8Instruments(list):
             result.extend(instr_data)
         return bytes(result)
 
+    def column(self, name):
+        """Columnar view of ByteField `name` across all slots.
+
+        Raises:
+            ValueError: if no instrument type declares a ByteField `name`
+        """
+        _ensure_registry()
+        if not any(type(field_layout(kind).by_name.get(name)) is ByteField
+                   for kind in _INSTRUMENT_REGISTRY.values()):
+            raise ValueError(f"No instrument type has a byte field named {name!r}")
+        return M8InstrumentColumn(self, name)
+
     def validate(self):
         if len(self) > BLOCK_COUNT:
             raise ValueError(f"Too many instruments: {len(self)}, maximum is {BLOCK_COUNT}")
@@ -83,3 +83,17 @@ class M8Metadata:
             quantize=self.quantize,
             name=self.name,
         )
+
+    def to_dict(self):
+        return {
+            "directory": self.directory,
+            "transpose": self.transpose,
+            "tempo": self.tempo,
+            "quantize": self.quantize,
+            "name": self.name,
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        keys = ("directory", "transpose", "tempo", "quantize", "name")
+        return cls(**{key: d[key] for key in keys if key in d})
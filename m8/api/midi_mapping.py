@@ -19,7 +19,7 @@ The seven bytes:
   byte 6  max_value       high end of the scaling range
 """
 
-from m8.api.fields import ByteField, iter_fields
+from m8.api.fields import ByteField, field_layout
 
 
 MIDI_MAPPING_BYTES = 7
@@ -40,9 +40,7 @@ class M8MidiMapping:
     max_value      = ByteField(6)
 
     def __init__(self, **kwargs):
-        self._data = bytearray(self.BYTES)
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self._data = field_layout(type(self)).new_data()
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -65,16 +63,12 @@ class M8MidiMapping:
         return instance
 
     def to_dict(self):
-        return {name: fld.to_dict(self) for name, fld in iter_fields(type(self))}
+        return field_layout(type(self)).to_dict(self)
 
     @classmethod
     def from_dict(cls, d):
         instance = cls()
-        fields_by_name = {name: fld for name, fld in iter_fields(cls)}
-        for key, value in d.items():
-            fld = fields_by_name.get(key)
-            if fld is not None:
-                fld.from_dict(instance, value)
+        field_layout(cls).from_dict(instance, d)
         return instance
 
 
@@ -11,7 +11,7 @@ provide list-like accessors for ergonomic indexing without exposing 16
 discrete `track_input_channel_N` descriptors.
 """
 
-from m8.api.fields import ByteField, IndexedBytesField, iter_fields
+from m8.api.fields import ByteField, IndexedBytesField, field_layout
 
 
 MIDI_SETTINGS_BYTES = 27
@@ -44,9 +44,7 @@ class M8MidiSettings:
     track_input_mode                 = ByteField(26)
 
     def __init__(self, **kwargs):
-        self._data = bytearray(self.BYTES)
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self._data = field_layout(type(self)).new_data()
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -65,14 +63,10 @@ class M8MidiSettings:
         return instance
 
     def to_dict(self):
-        return {name: fld.to_dict(self) for name, fld in iter_fields(type(self))}
+        return field_layout(type(self)).to_dict(self)
 
     @classmethod
     def from_dict(cls, d):
         instance = cls()
-        fields_by_name = {name: fld for name, fld in iter_fields(cls)}
-        for key, value in d.items():
-            fld = fields_by_name.get(key)
-            if fld is not None:
-                fld.from_dict(instance, value)
+        field_layout(cls).from_dict(instance, d)
         return instance
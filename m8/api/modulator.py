@@ -12,7 +12,7 @@ in place — different types reinterpret bytes 2-5 differently.
 
 from enum import IntEnum
 
-from m8.api.fields import ByteField, iter_fields
+from m8.api.fields import ByteField, field_layout
 
 
 MODULATOR_BLOCK_SIZE = 6
@@ -66,6 +66,21 @@ class M8LFOTriggerMode(IntEnum):
 
 
 _MODULATOR_REGISTRY = {}
+_DESTINATION_NAMES = {}
+
+
+def _destination_names(dest_enum_class):
+    """Dict value for each of the 16 destination nibbles: enum name, else int."""
+    names = _DESTINATION_NAMES.get(dest_enum_class)
+    if names is None:
+        names = []
+        for value in range(16):
+            try:
+                names.append(dest_enum_class(value).name)
+            except (ValueError, KeyError):
+                names.append(value)
+        names = _DESTINATION_NAMES[dest_enum_class] = tuple(names)
+    return names
 
 
 class M8Modulator:
@@ -83,14 +98,18 @@ class M8Modulator:
         super().__init_subclass__(**kwargs)
         if cls.MOD_TYPE is not None:
             _MODULATOR_REGISTRY[int(cls.MOD_TYPE)] = cls
+        field_layout(cls)
+
+    @classmethod
+    def _blank_data(cls):
+        data = bytearray(BLOCK_SIZE)
+        data[TYPE_DEST_OFFSET] = (int(cls.MOD_TYPE) << 4) & 0xF0
+        return data
 
     def __init__(self, destination=0, **kwargs):
         if self.MOD_TYPE is None:
             raise TypeError(f"{type(self).__name__} must declare MOD_TYPE")
-        self._data = bytearray(BLOCK_SIZE)
-        self._data[TYPE_DEST_OFFSET] = (int(self.MOD_TYPE) << 4) & 0xF0
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self._data = field_layout(type(self)).new_data()
         if destination:
             self.destination = destination
         for key, value in kwargs.items():
@@ -127,24 +146,16 @@ class M8Modulator:
         return instance
 
     def to_dict(self, dest_enum_class=None):
-        destination = self.destination
+        destination = self._data[TYPE_DEST_OFFSET] & 0x0F
         if dest_enum_class is not None:
-            try:
-                destination = dest_enum_class(destination).name
-            except (ValueError, KeyError):
-                pass
+            destination = _destination_names(dest_enum_class)[destination]
 
-        result = {
+        return {
             "type": self.MOD_TYPE.name,
             "destination": destination,
-            "amount": self.amount,
-            "params": {},
+            "amount": self._data[AMOUNT_OFFSET],
+            "params": field_layout(type(self)).to_dict(self, skip=("amount",)),
         }
-        for name, fld in iter_fields(type(self)):
-            if name == "amount":
-                continue
-            result["params"][name] = fld.to_dict(self)
-        return result
 
     @classmethod
     def from_dict(cls, params, dest_enum_class=None):
@@ -177,12 +188,7 @@ class M8Modulator:
         if "amount" in params:
             instance.amount = params["amount"]
 
-        fields_by_name = {n: f for n, f in iter_fields(cls)}
-        for key, value in params.get("params", {}).items():
-            fld = fields_by_name.get(key)
-            if fld is None:
-                continue
-            fld.from_dict(instance, value)
+        field_layout(cls).from_dict(instance, params.get("params", {}))
         return instance
 
 
@@ -285,6 +291,24 @@ class M8Modulators(list):
             instance.append(_read_m8i_block(klass, block))
         return instance
 
+    def write_m8i(self):
+        """Write modulators in the M8i layout (reverse of `read_m8i`).
+
+        Raises:
+            ValueError: if a slot holds a type other than the one M8i
+                        implies for that position (AHD, AHD, LFO, LFO)
+        """
+        result = bytearray()
+        for i, klass in enumerate(_DEFAULT_MODULATOR_CLASSES):
+            mod = self[i] if i < len(self) else klass()
+            if type(mod) is not klass:
+                raise ValueError(
+                    f"M8i modulator slot {i} must be {klass.__name__}, "
+                    f"got {type(mod).__name__}"
+                )
+            result.extend(_write_m8i_block(mod))
+        return bytes(result)
+
     def clone(self):
         instance = self.__class__.__new__(self.__class__)
         list.__init__(instance)
@@ -344,3 +368,14 @@ def _read_m8i_block(klass, block):
         m8s[1:] = block[1:]
 
     return klass.read(bytes(m8s))
+
+
+def _write_m8i_block(mod):
+    """Translate one modulator to its M8i block (reverse of `_read_m8i_block`)."""
+    m8s = bytes(mod.write()[:BLOCK_SIZE]).ljust(BLOCK_SIZE, b"\x00")
+    dest = m8s[0] & 0x0F
+    if isinstance(mod, M8LFOModulator):
+        # M8s LFO: type+dest, amt, osc, trig, freq, retrig
+        # M8i LFO: osc, dest, trig, freq, amt, retrig
+        return bytes([m8s[2], dest, m8s[3], m8s[4], m8s[1], m8s[5]])
+    return bytes([dest]) + m8s[1:]
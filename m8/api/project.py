@@ -79,9 +79,26 @@ class M8Project:
         self.eqs = None
         self.key = 0
         self.version = M8Version()
+        self._timing = None
 
     @classmethod
-    def read(cls, data):
+    def read(cls, data, sparse=False):
+        """Parse a project from .m8s bytes.
+
+        With `sparse=True`, phrases, chains, tables, instruments and EQs
+        share one read-only object between empty slots and parse a slot on
+        first index (see `m8.api.sparse`); write() output is unchanged.
+        """
+        if sparse:
+            from m8.api.sparse import (
+                M8SparseChains as chains_cls, M8SparseEqs as eqs_cls,
+                M8SparseInstruments as instruments_cls, M8SparsePhrases as phrases_cls,
+                M8SparseTables as tables_cls,
+            )
+        else:
+            chains_cls, eqs_cls, instruments_cls = M8Chains, M8Eqs, M8Instruments
+            phrases_cls, tables_cls = M8Phrases, M8Tables
+
         instance = cls()
         instance.data = bytearray(data)
         instance.version = M8Version.read(data[OFFSETS["version"]:])
@@ -103,9 +120,9 @@ class M8Project:
             version=instance.version,
         )
         instance.song = M8SongMatrix.read(data[OFFSETS["song"]:])
-        instance.chains = M8Chains.read(data[OFFSETS["chains"]:])
-        instance.phrases = M8Phrases.read(data[OFFSETS["phrases"]:])
-        instance.tables = M8Tables.read(
+        instance.chains = chains_cls.read(data[OFFSETS["chains"]:])
+        instance.phrases = phrases_cls.read(data[OFFSETS["phrases"]:])
+        instance.tables = tables_cls.read(
             data[OFFSETS["tables"]:OFFSETS["tables"] + M8Tables.TOTAL_BYTES],
             version=instance.version,
         )
@@ -116,7 +133,7 @@ class M8Project:
             data[OFFSETS["mixer"]:OFFSETS["mixer"] + M8MixerSettings.BYTES],
             version=instance.version,
         )
-        instance.instruments = M8Instruments.read(
+        instance.instruments = instruments_cls.read(
             data[OFFSETS["instruments"]:], version=instance.version,
         )
         instance.effects = M8EffectsSettings.read(
@@ -131,7 +148,7 @@ class M8Project:
             data[OFFSETS["scales"]:OFFSETS["scales"] + M8Scales.TOTAL_BYTES],
             version=instance.version,
         )
-        instance.eqs = M8Eqs.read(
+        instance.eqs = eqs_cls.read(
             data[OFFSETS["eqs"]:OFFSETS["eqs"] + M8Eqs.TOTAL_BYTES],
             version=instance.version,
         )
@@ -140,7 +157,7 @@ class M8Project:
     def clone(self):
         instance = self.__class__()
         instance.data = bytearray(self.data)
-        instance.version = M8Version(self.version.major, self.version.minor, self.version.patch)
+        instance.version = self.version.clone()
         instance.metadata = self.metadata.clone() if self.metadata else None
         instance.midi = self.midi.clone() if self.midi else None
         instance.instruments = self.instruments.clone() if self.instruments else None
@@ -181,17 +198,33 @@ class M8Project:
 
         return bytes(output)
 
+    def to_dict(self):
+        """Compact dict covering every byte of the project.
+
+        JSON/msgpack-safe; empty slots are stored once per section. Reverse
+        of from_dict() (see `m8.api.serialization`).
+        """
+        from m8.api.serialization import project_to_dict
+        return project_to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruct from a dict produced by to_dict(); write() output is
+        byte-identical to the original's."""
+        from m8.api.serialization import project_from_dict
+        return project_from_dict(data, cls=cls)
+
     @staticmethod
-    def read_from_file(filename: str):
+    def read_from_file(filename: str, sparse: bool = False):
         with open(filename, "rb") as f:
-            project = M8Project.read(f.read())
+            project = M8Project.read(f.read(), sparse=sparse)
             
         # Context management was removed with enum system simplification
         
         return project
 
     @classmethod
-    def initialise(cls, template_name: str = "TEMPLATE-6-2-1"):
+    def initialise(cls, template_name: str = "TEMPLATE-6-2-1", sparse: bool = False):
         """Creates a new project from a template file."""
         import os
         import sys
@@ -203,7 +236,7 @@ class M8Project:
             import importlib.resources
             with importlib.resources.path('m8.templates', template_filename) as template_path:
                 if os.path.exists(template_path):
-                    return cls.read_from_file(str(template_path))
+                    return cls.read_from_file(str(template_path), sparse=sparse)
         except (ImportError, ModuleNotFoundError, FileNotFoundError, TypeError):
             pass
 
@@ -211,13 +244,13 @@ class M8Project:
         for path in sys.path:
             potential_path = os.path.join(path, 'm8', 'templates', template_filename)
             if os.path.exists(potential_path):
-                return cls.read_from_file(potential_path)
+                return cls.read_from_file(potential_path, sparse=sparse)
 
         # Strategy 3: Relative to this module (development/source installs)
         module_path = os.path.dirname(os.path.abspath(__file__))
         template_path = os.path.join(module_path, "..", "templates", template_filename)
         if os.path.exists(template_path):
-            return cls.read_from_file(template_path)
+            return cls.read_from_file(template_path, sparse=sparse)
 
         raise FileNotFoundError(f"Template '{template_filename}' not found. Check that it exists in the m8/templates directory.")
 
@@ -232,24 +265,33 @@ class M8Project:
         with open(filename, "wb") as f:
             f.write(self.write())
 
+    def timing(self):
+        """Shared groove-aware `M8TimingEngine` for this project.
+
+        Created on first use and cached, so export/duration/rendering
+        consumers reuse one timeline. Call `.invalidate()` on it after
+        editing song, chains, phrases or tempo.
+        """
+        if self._timing is None:
+            from m8.api.timing import M8TimingEngine
+            self._timing = M8TimingEngine(self)
+        return self._timing
+
     def validate(self):
-        """Validate all project components.
+        """Validate every reference in the project.
 
-        Validates:
-        - Chains collection (count and phrase references)
-        - Phrases collection (count and instrument references)
-        - Song matrix (chain references)
-        - Instruments collection (count)
+        Checks song chain references, chain phrase references, phrase
+        instrument references, reference-carrying FX values in phrases and
+        tables, and instrument associated_eq bounds, collecting every
+        violation rather than stopping at the first (see
+        `m8.api.validation`).
 
         Raises:
-            ValueError: If any validation fails
+            ProjectValidationError: A ValueError whose `violations` lists
+                every problem found
         """
-        if self.chains:
-            self.chains.validate()
-        if self.phrases:
-            self.phrases.validate()
-        if self.song:
-            self.song.validate()
-        if self.instruments:
-            self.instruments.validate()
+        from m8.api.validation import M8Validator
+        validator = M8Validator(self)
+        validator.validate()
+        validator.raise_for_violations()
 
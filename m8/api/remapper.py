@@ -42,6 +42,7 @@ from m8.api.fx import M8MixerFX, M8SequenceFX
 from m8.api.instrument import BLOCK_COUNT as N_INSTRUMENTS, M8InstrumentType
 from m8.api.table import TABLE_COUNT as N_TABLES
 from m8.api.eq import EQ_COUNT as N_EQS
+from m8.api.sparse import peek
 
 
 # Sentinel values for "no reference" in each slot kind.
@@ -85,7 +86,7 @@ def _is_concrete_instrument(project, instrument_index):
     """A populated instrument slot, not an M8Block / empty slot."""
     if not (0 <= instrument_index < N_INSTRUMENTS):
         return False
-    inst = project.instruments[instrument_index]
+    inst = peek(project.instruments, instrument_index)
     # M8Block has no associated_eq; real instruments do (the descriptor
     # is on the base class).
     return hasattr(inst, "associated_eq")
@@ -147,7 +148,7 @@ def walk_dependencies(
             if c == EMPTY_CHAIN or c in m.chains or not (0 <= c < 255):
                 continue
             m.chains.add(c)
-            for step in project.chains[c]:
+            for step in peek(project.chains, c):
                 if step.phrase != EMPTY_PHRASE:
                     queue_phrases.add(step.phrase)
             continue
@@ -158,7 +159,7 @@ def walk_dependencies(
             if p == EMPTY_PHRASE or p in m.phrases or not (0 <= p < 255):
                 continue
             m.phrases.add(p)
-            for step in project.phrases[p]:
+            for step in peek(project.phrases, p):
                 if step.instrument != EMPTY_INSTRUMENT_REF and 0 <= step.instrument < N_INSTRUMENTS:
                     queue_instruments.add(step.instrument)
                 _walk_fx(step.fx, m, queue_instruments, queue_tables)
@@ -170,7 +171,7 @@ def walk_dependencies(
             if i in m.instruments or not _is_concrete_instrument(project, i):
                 continue
             m.instruments.add(i)
-            inst = project.instruments[i]
+            inst = peek(project.instruments, i)
             if inst.associated_eq != NO_EQ and 0 <= inst.associated_eq < N_EQS:
                 m.eqs.add(inst.associated_eq)
             # Firmware-6+ convention: instrument N owns table N.
@@ -185,7 +186,7 @@ def walk_dependencies(
             if t in m.tables or not (0 <= t < N_TABLES):
                 continue
             m.tables.add(t)
-            for step in project.tables[t]:
+            for step in peek(project.tables, t):
                 _walk_fx(step.fx, m, queue_instruments, queue_tables)
             continue
 
@@ -256,13 +257,13 @@ class NoFreeSlotError(ValueError):
 def _chain_occupied(project, index):
     if not (0 <= index < len(project.chains)):
         return False
-    return any(step.phrase != EMPTY_PHRASE for step in project.chains[index])
+    return any(step.phrase != EMPTY_PHRASE for step in peek(project.chains, index))
 
 
 def _phrase_occupied(project, index):
     if not (0 <= index < len(project.phrases)):
         return False
-    phrase = project.phrases[index]
+    phrase = peek(project.phrases, index)
     for step in phrase:
         if step.note != 0xFF or step.velocity != 0xFF or step.instrument != EMPTY_INSTRUMENT_REF:
             return True
@@ -280,13 +281,13 @@ def _instrument_occupied(project, index):
 def _table_occupied(project, index):
     if not (0 <= index < N_TABLES):
         return False
-    return not project.tables[index].is_empty()
+    return not peek(project.tables, index).is_empty()
 
 
 def _eq_occupied(project, index):
     if not (0 <= index < N_EQS):
         return False
-    return not project.eqs[index].is_default()
+    return not peek(project.eqs, index).is_default()
 
 
 def _find_free_slot(occupied, capacity, preferred):
@@ -417,18 +418,18 @@ def apply(source, destination, mappings: Mappings, remap: Remapping) -> None:
     # need them already in place to verify associated_eq remapping is
     # consistent (though for now we don't actually verify).
     for src_eq, dst_eq in remap.eqs.items():
-        destination.eqs[dst_eq] = source.eqs[src_eq].clone()
+        destination.eqs[dst_eq] = peek(source.eqs, src_eq).clone()
 
     # Tables — rewrite FX refs in each step
     for src_table, dst_table in remap.tables.items():
-        cloned = source.tables[src_table].clone()
+        cloned = peek(source.tables, src_table).clone()
         for step in cloned:
             _rewrite_fx_tuples(step.fx, remap)
         destination.tables[dst_table] = cloned
 
     # Instruments — rewrite associated_eq
     for src_inst, dst_inst in remap.instruments.items():
-        cloned = source.instruments[src_inst].clone()
+        cloned = peek(source.instruments, src_inst).clone()
         # M8Block instances (empty slots) have no associated_eq and were
         # filtered out at walk time, but be defensive.
         if hasattr(cloned, "associated_eq") and cloned.associated_eq != NO_EQ:
@@ -437,7 +438,7 @@ def apply(source, destination, mappings: Mappings, remap: Remapping) -> None:
 
     # Phrases — rewrite step.instrument and FX refs
     for src_phrase, dst_phrase in remap.phrases.items():
-        cloned = source.phrases[src_phrase].clone()
+        cloned = peek(source.phrases, src_phrase).clone()
         for step in cloned:
             if step.instrument != EMPTY_INSTRUMENT_REF:
                 step.instrument = remap.out_instrument(step.instrument)
@@ -446,7 +447,7 @@ def apply(source, destination, mappings: Mappings, remap: Remapping) -> None:
 
     # Chains — rewrite step.phrase
     for src_chain, dst_chain in remap.chains.items():
-        cloned = source.chains[src_chain].clone()
+        cloned = peek(source.chains, src_chain).clone()
         for step in cloned:
             if step.phrase != EMPTY_PHRASE:
                 step.phrase = remap.out_phrase(step.phrase)
@@ -0,0 +1,286 @@
+# m8/api/serialization.py
+"""Whole-project dict form, and fast encoders for it.
+
+`M8Project.to_dict()` covers every byte of the project file in a compact,
+JSON/msgpack-safe schema (dicts, lists, strings and numbers):
+
+- Sequencer sections (song, chains, phrases, tables, grooves) are lists of
+  ints, one list per step, so they stay queryable in a document store.
+- Metadata, settings (midi, mixer, effects), instrument, MIDI-mapping
+  and EQ slots are their objects' `to_dict()` form, so fields like
+  `doc["metadata"]["name"]` or an instrument's `"type"` can be queried.
+  Bytes the parsed form doesn't reproduce (unparsed padding, string
+  tails) ride along as an `"unparsed"` list of `[offset, hex]` runs.
+  Slots that can't be parsed (empty or unknown instrument types) and
+  scale slots, whose dict form is ten times their size, are hex strings.
+- Each slotted section stores its most common slot once as `fill` and
+  lists only the slots that differ (`[index, value]` pairs), so the ~250
+  empty phrases of a typical project cost nothing.
+- Bytes outside every section (reserved and unparsed regions) are kept
+  as `raw` `[offset, hex]` runs, skipping all-zero runs.
+
+`M8Project.from_dict()` rebuilds the file bytes and parses them, so a
+round trip reproduces `write()` exactly::
+
+    doc = project.to_dict()
+    assert M8Project.from_dict(doc).write() == project.write()
+
+    blob = dumps(project, "msgpack")            # or "json" (default)
+    project = loads(blob, "msgpack")
+
+Further encoders can be added with `register_encoder()`.
+"""
+
+import json
+from collections import Counter
+
+from m8.api.chain import CHAIN_BLOCK_SIZE, CHAIN_STEP_SIZE, CHAINS_COUNT
+from m8.api.eq import EQ_BYTES, EQ_COUNT, M8Eq
+from m8.api.groove import GROOVE_BYTES, GROOVE_COUNT
+from m8.api.instrument import (
+    BLOCK_SIZE as INSTRUMENT_BLOCK_SIZE, INSTRUMENTS_COUNT, M8Instrument,
+)
+from m8.api.metadata import METADATA_BLOCK_SIZE, M8Metadata
+from m8.api.midi_mapping import MIDI_MAPPING_BYTES, MIDI_MAPPING_COUNT, M8MidiMapping
+from m8.api.midi_settings import MIDI_SETTINGS_BYTES, M8MidiSettings
+from m8.api.phrase import PHRASE_BLOCK_SIZE, PHRASE_STEP_SIZE, PHRASES_COUNT
+from m8.api.scale import SCALE_BYTES, SCALE_COUNT
+from m8.api.settings import M8EffectsSettings, M8MixerSettings
+from m8.api.song import SONG_COL_COUNT, SONG_ROW_COUNT
+from m8.api.table import TABLE_BYTES, TABLE_COUNT, TABLE_STEP_BYTES
+from m8.api.version import M8Version
+
+SCHEMA = 1
+VERSION_BYTES = 4
+UNPARSED = "unparsed"
+
+# Single-block sections: name -> length
+BLOCK_SECTIONS = {
+    "metadata": METADATA_BLOCK_SIZE,
+    "midi": MIDI_SETTINGS_BYTES,
+    "mixer": M8MixerSettings.BYTES,
+    "effects": M8EffectsSettings.BYTES,
+}
+
+# Slotted sections: name -> (slot count, slot bytes, step bytes). Slots
+# with a step size are lists of ints (nested per step when a slot has
+# several steps); the rest are stored per FIELD_SECTIONS, or as hex.
+SLOT_SECTIONS = {
+    "song": (SONG_ROW_COUNT, SONG_COL_COUNT, SONG_COL_COUNT),
+    "grooves": (GROOVE_COUNT, GROOVE_BYTES, GROOVE_BYTES),
+    "chains": (CHAINS_COUNT, CHAIN_BLOCK_SIZE, CHAIN_STEP_SIZE),
+    "phrases": (PHRASES_COUNT, PHRASE_BLOCK_SIZE, PHRASE_STEP_SIZE),
+    "tables": (TABLE_COUNT, TABLE_BYTES, TABLE_STEP_BYTES),
+    "instruments": (INSTRUMENTS_COUNT, INSTRUMENT_BLOCK_SIZE, None),
+    "midi_mappings": (MIDI_MAPPING_COUNT, MIDI_MAPPING_BYTES, None),
+    "scales": (SCALE_COUNT, SCALE_BYTES, None),
+    "eqs": (EQ_COUNT, EQ_BYTES, None),
+}
+
+# Sections stored as to_dict() fields: name -> (read(data, version), from_dict)
+FIELD_SECTIONS = {
+    "metadata": (lambda data, version: M8Metadata.read(data), M8Metadata.from_dict),
+    "midi": (lambda data, version: M8MidiSettings.read(data), M8MidiSettings.from_dict),
+    "mixer": (M8MixerSettings.read, M8MixerSettings.from_dict),
+    "effects": (M8EffectsSettings.read, M8EffectsSettings.from_dict),
+    "instruments": (M8Instrument.read, M8Instrument.from_dict),
+    "midi_mappings": (lambda data, version: M8MidiMapping.read(data), M8MidiMapping.from_dict),
+    "eqs": (lambda data, version: M8Eq.read(data), M8Eq.from_dict),
+}
+
+
+def _layout():
+    """(offset, length) of every serialised region, in file order."""
+    from m8.api.project import KEY_OFFSET, OFFSETS
+    spans = [(OFFSETS["version"], VERSION_BYTES), (KEY_OFFSET, 1)]
+    spans += [(OFFSETS[name], length) for name, length in BLOCK_SECTIONS.items()]
+    spans += [(OFFSETS[name], count * size)
+              for name, (count, size, _) in SLOT_SECTIONS.items()]
+    return sorted(spans)
+
+
+def _gaps(size):
+    """(start, end) ranges of a `size`-byte file outside every section."""
+    gaps, position = [], 0
+    for offset, length in _layout():
+        if offset > position:
+            gaps.append((position, offset))
+        position = max(position, offset + length)
+    if size > position:
+        gaps.append((position, size))
+    return gaps
+
+
+def _byte_runs(data, reference):
+    """`[offset, hex]` runs where `data` differs from `reference`."""
+    runs, start = [], None
+    for i, (a, b) in enumerate(zip(data, reference)):
+        if a != b and start is None:
+            start = i
+        elif a == b and start is not None:
+            runs.append([start, data[start:i].hex()])
+            start = None
+    if start is not None:
+        runs.append([start, data[start:].hex()])
+    return runs
+
+
+def _encode_fields(name, data, version):
+    """`to_dict()` of a section's bytes, or hex if they don't parse."""
+    if name not in FIELD_SECTIONS:
+        return data.hex()
+    read, from_dict = FIELD_SECTIONS[name]
+    try:
+        fields = read(data, version).to_dict()
+        rebuilt = from_dict(fields).write()
+    except (KeyError, ValueError):
+        return data.hex()
+    if len(rebuilt) != len(data):
+        return data.hex()
+    runs = _byte_runs(data, rebuilt)
+    if runs:
+        fields[UNPARSED] = runs
+    return fields
+
+
+def _decode_fields(name, value):
+    if isinstance(value, str):
+        return bytes.fromhex(value)
+    fields = dict(value)
+    runs = fields.pop(UNPARSED, [])
+    data = bytearray(FIELD_SECTIONS[name][1](fields).write())
+    for offset, chunk in runs:
+        chunk = bytes.fromhex(chunk)
+        data[offset:offset + len(chunk)] = chunk
+    return bytes(data)
+
+
+def _encode_slot(data, step):
+    if step == len(data):
+        return list(data)
+    return [list(data[i:i + step]) for i in range(0, len(data), step)]
+
+
+def _decode_slot(value):
+    if value and isinstance(value[0], list):
+        return bytes(b for step in value for b in step)
+    return bytes(value)
+
+
+def project_to_dict(project):
+    """Compact dict of every byte in `project.write()` (see module docs)."""
+    from m8.api.project import KEY_OFFSET, OFFSETS
+    data = project.write()
+    end = max(offset + length for offset, length in _layout())
+    if len(data) < end:
+        raise ValueError(f"Project is {len(data)} bytes, expected at least {end}")
+
+    version = M8Version.read(data[OFFSETS["version"]:])
+    doc = {
+        "schema": SCHEMA,
+        "size": len(data),
+        "version": [version.major, version.minor, version.patch, version.reserved],
+        "key": data[KEY_OFFSET],
+        "raw": [[start, data[start:stop].hex()] for start, stop in _gaps(len(data))
+                if data[start:stop].strip(b"\x00")],
+    }
+    for name, length in BLOCK_SECTIONS.items():
+        offset = OFFSETS[name]
+        doc[name] = _encode_fields(name, data[offset:offset + length], version)
+
+    for name, (count, size, step) in SLOT_SECTIONS.items():
+        offset = OFFSETS[name]
+        slots = [data[offset + i * size:offset + (i + 1) * size] for i in range(count)]
+        fill = Counter(slots).most_common(1)[0][0]
+        if step is None:
+            encode = lambda slot: _encode_fields(name, slot, version)
+        else:
+            encode = lambda slot: _encode_slot(slot, step)
+        doc[name] = {
+            "fill": encode(fill),
+            "slots": [[i, encode(slot)] for i, slot in enumerate(slots) if slot != fill],
+        }
+    return doc
+
+
+def project_from_dict(doc, cls=None):
+    """Rebuild a project from `project_to_dict()` output.
+
+    Args:
+        doc: Dict in the SCHEMA format
+        cls: Project class to parse into (default M8Project)
+
+    Raises:
+        ValueError: if the schema version is unsupported or a section has
+                    the wrong size
+    """
+    from m8.api.project import KEY_OFFSET, M8Project, OFFSETS
+    if doc.get("schema") != SCHEMA:
+        raise ValueError(f"Unsupported project schema {doc.get('schema')!r}, expected {SCHEMA}")
+
+    out = bytearray(doc["size"])
+    for start, chunk in doc["raw"]:
+        chunk = bytes.fromhex(chunk)
+        out[start:start + len(chunk)] = chunk
+    offset = OFFSETS["version"]
+    out[offset:offset + VERSION_BYTES] = M8Version(*doc["version"]).write()
+    out[KEY_OFFSET] = doc["key"]
+
+    for name, length in BLOCK_SECTIONS.items():
+        block = _decode_fields(name, doc[name])
+        if len(block) != length:
+            raise ValueError(f"Section {name} is {len(block)} bytes, expected {length}")
+        out[OFFSETS[name]:OFFSETS[name] + length] = block
+
+    for name, (count, size, step) in SLOT_SECTIONS.items():
+        section = doc[name]
+        decode = _decode_slot if step is not None else lambda value: _decode_fields(name, value)
+        fill = decode(section["fill"])
+        slots = [fill] * count
+        for index, value in section["slots"]:
+            slots[index] = decode(value)
+        block = b"".join(slots)
+        if len(block) != count * size:
+            raise ValueError(f"Section {name} is {len(block)} bytes, expected {count * size}")
+        out[OFFSETS[name]:OFFSETS[name] + len(block)] = block
+
+    return (cls or M8Project).read(bytes(out))
+
+
+# Encoders: name -> (dumps(dict) -> bytes, loads(bytes) -> dict)
+ENCODERS = {
+    "json": (
+        lambda doc: json.dumps(doc, separators=(",", ":")).encode("utf-8"),
+        json.loads,
+    ),
+}
+
+
+def register_encoder(name, dumps, loads):
+    """Make `name` available to `dumps()` / `loads()`."""
+    ENCODERS[name] = (dumps, loads)
+
+
+def _encoder(name):
+    if name not in ENCODERS and name == "msgpack":
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("The msgpack encoder requires msgpack (pip install msgpack)") from e
+        register_encoder("msgpack", msgpack.packb,
+                         lambda data: msgpack.unpackb(data, raw=False))
+    try:
+        return ENCODERS[name]
+    except KeyError:
+        available = ", ".join(sorted(set(ENCODERS) | {"msgpack"}))
+        raise ValueError(f"Unknown encoder {name!r}; available: {available}")
+
+
+def dumps(project, encoder="json"):
+    """Encode a project's dict form to bytes."""
+    return _encoder(encoder)[0](project_to_dict(project))
+
+
+def loads(data, encoder="json", cls=None):
+    """Decode bytes from `dumps()` back into a project."""
+    return project_from_dict(_encoder(encoder)[1](data), cls=cls)
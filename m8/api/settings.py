@@ -16,7 +16,7 @@ currently treats as a single block; integrating it requires restructuring
 the metadata reader. Tracked in docs/planning/roadmap.md.
 """
 
-from m8.api.fields import ByteField, IndexedBytesField, iter_fields
+from m8.api.fields import ByteField, IndexedBytesField, field_layout
 
 
 # ---- mixer ----
@@ -73,9 +73,7 @@ class M8MixerSettings:
     ott_level            = ByteField(31)
 
     def __init__(self, **kwargs):
-        self._data = bytearray(self.BYTES)
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self._data = field_layout(type(self)).new_data()
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -99,16 +97,12 @@ class M8MixerSettings:
         return instance
 
     def to_dict(self):
-        return {name: fld.to_dict(self) for name, fld in iter_fields(type(self))}
+        return field_layout(type(self)).to_dict(self)
 
     @classmethod
     def from_dict(cls, d):
         instance = cls()
-        fields_by_name = {name: fld for name, fld in iter_fields(cls)}
-        for key, value in d.items():
-            fld = fields_by_name.get(key)
-            if fld is not None:
-                fld.from_dict(instance, value)
+        field_layout(cls).from_dict(instance, d)
         return instance
 
 
@@ -157,9 +151,7 @@ class M8EffectsSettings:
     mfx_kind           = ByteField(25)  # 0=Chorus, 1=Phaser, 2=Flanger
 
     def __init__(self, **kwargs):
-        self._data = bytearray(self.BYTES)
-        for _, fld in iter_fields(type(self)):
-            fld.apply_default(self)
+        self._data = field_layout(type(self)).new_data()
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -178,14 +170,10 @@ class M8EffectsSettings:
         return instance
 
     def to_dict(self):
-        return {name: fld.to_dict(self) for name, fld in iter_fields(type(self))}
+        return field_layout(type(self)).to_dict(self)
 
     @classmethod
     def from_dict(cls, d):
         instance = cls()
-        fields_by_name = {name: fld for name, fld in iter_fields(cls)}
-        for key, value in d.items():
-            fld = fields_by_name.get(key)
-            if fld is not None:
-                fld.from_dict(instance, value)
+        field_layout(cls).from_dict(instance, d)
         return instance
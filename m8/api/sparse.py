@@ -0,0 +1,244 @@
+# m8/api/sparse.py
+"""Sparse slot collections: empty slots share one read-only object.
+
+A typical project uses a handful of its 255 phrases, 255 chains, 256
+tables, 128 instruments and 132 EQs, but the dense collections build a
+full object tree for every slot. The sparse variants parse only slots
+with content; every empty slot with the same bytes points at one shared
+object. A slot gets its own object the first time it is indexed::
+
+    project = M8Project.read_from_file("song.m8s", sparse=True)
+    project.phrases[12][0].note = 0x24      # phrase 12 materialises here
+    project.phrases.shared_slots()          # slots still sharing
+
+Empty means: phrases with no note, velocity, instrument or FX key on any
+step; chains with no phrase; empty (M8Block) instrument slots; tables
+whose `is_empty()` holds; EQs whose `is_default()` holds. Slots are
+shared by exact bytes, so `write()` output is identical to the dense
+collections'.
+
+Iterating yields the shared objects for empty slots. Their bytes are
+read-only — writing through them raises TypeError — so edit slots via
+`collection[index]`. Indexing can't tell a read from a write (the edit
+above only indexes `phrases`), so every index materialises, reads
+included. Read-only code uses `peek()` to look at a slot without
+materialising it; validation, timing, the remapper (which clones what
+it copies) and the instrument exporter do.
+"""
+
+from m8.api import M8Block
+from m8.api.chain import CHAIN_BLOCK_SIZE, CHAINS_COUNT, M8Chain, M8Chains
+from m8.api.eq import EQ_BYTES, EQ_COUNT, M8Eq, M8Eqs
+from m8.api.instrument import (
+    BLOCK_SIZE as INSTRUMENT_BLOCK_SIZE, INSTRUMENTS_COUNT, M8Instruments,
+    _ensure_registry,
+)
+from m8.api.phrase import PHRASE_BLOCK_SIZE, PHRASES_COUNT, M8Phrase, M8Phrases
+from m8.api.table import TABLE_BYTES, TABLE_COUNT, M8Table, M8Tables
+
+EMPTY = 0xFF
+
+
+def peek(collection, index):
+    """`collection[index]` without materialising a shared slot.
+
+    Works on dense collections too, so read-only walkers can use it
+    unconditionally.
+    """
+    return list.__getitem__(collection, index)
+
+
+def _freeze(item):
+    """Make a shared object's byte buffers read-only, recursively."""
+    for name in ("_data", "data"):
+        value = item.__dict__.get(name) if hasattr(item, "__dict__") else None
+        if isinstance(value, bytearray):
+            setattr(item, name, bytes(value))
+    children = list(item) if isinstance(item, list) else []
+    if hasattr(item, "__dict__"):
+        children += [v for v in vars(item).values() if hasattr(v, "write")]
+    for child in children:
+        _freeze(child)
+
+
+class _SparseSlots:
+    """Mixin for the list-based slot collections.
+
+    Subclasses set ITEM_BYTES and ITEM_COUNT and define `_parse`,
+    `_new_item` and `_is_empty`.
+    """
+
+    ITEM_BYTES = None
+    ITEM_COUNT = None
+
+    def __init__(self):
+        list.__init__(self)
+        self._load(bytes(self._new_item().write()) * self.ITEM_COUNT)
+
+    @classmethod
+    def read(cls, data, version=None):
+        instance = cls.__new__(cls)
+        instance._load(data, version)
+        return instance
+
+    def _load(self, data, version=None):
+        list.__init__(self)
+        self._version = version
+        self._shared = {}                  # block bytes -> shared item
+        size = self.ITEM_BYTES
+        for i in range(self.ITEM_COUNT):
+            block = bytes(data[i * size:(i + 1) * size])
+            item = self._shared.get(block)
+            if item is None:
+                item = self._parse(i, block, version)
+                if self._is_empty(item):
+                    _freeze(item)
+                    self._shared[block] = item
+            list.append(self, item)
+        self._shared_ids = {id(item) for item in self._shared.values()}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = list.__getitem__(self, index)
+        if id(item) in self._shared_ids:
+            item = self._parse(index, bytes(item.write()), self._version)
+            list.__setitem__(self, index, item)
+        return item
+
+    def is_shared(self, index):
+        """True while slot `index` still points at a shared empty object."""
+        return id(list.__getitem__(self, index)) in self._shared_ids
+
+    def shared_slots(self):
+        """Indices of slots still sharing an empty object."""
+        return [i for i, item in enumerate(list.__iter__(self))
+                if id(item) in self._shared_ids]
+
+    def clone(self):
+        instance = self.__class__.__new__(self.__class__)
+        list.__init__(instance)
+        instance._version = self._version
+        instance._shared = self._shared
+        instance._shared_ids = self._shared_ids
+        for item in list.__iter__(self):
+            shared = id(item) in self._shared_ids or not hasattr(item, "clone")
+            list.append(instance, item if shared else item.clone())
+        return instance
+
+
+class M8SparsePhrases(_SparseSlots, M8Phrases):
+    """M8Phrases sharing one object between empty phrases."""
+
+    ITEM_BYTES = PHRASE_BLOCK_SIZE
+    ITEM_COUNT = PHRASES_COUNT
+
+    @staticmethod
+    def _parse(index, block, version=None):
+        return M8Phrase.read(block)
+
+    @staticmethod
+    def _new_item():
+        return M8Phrase()
+
+    @staticmethod
+    def _is_empty(phrase):
+        for step in phrase:
+            if step.note != EMPTY or step.velocity != EMPTY or step.instrument != EMPTY:
+                return False
+            if any(fx.key != EMPTY for fx in step.fx):
+                return False
+        return True
+
+
+class M8SparseChains(_SparseSlots, M8Chains):
+    """M8Chains sharing one object between empty chains."""
+
+    ITEM_BYTES = CHAIN_BLOCK_SIZE
+    ITEM_COUNT = CHAINS_COUNT
+
+    @staticmethod
+    def _parse(index, block, version=None):
+        return M8Chain.read(block)
+
+    @staticmethod
+    def _new_item():
+        return M8Chain()
+
+    @staticmethod
+    def _is_empty(chain):
+        return all(step.phrase == EMPTY for step in chain)
+
+
+class M8SparseTables(_SparseSlots, M8Tables):
+    """M8Tables sharing one object between empty tables."""
+
+    ITEM_BYTES = TABLE_BYTES
+    ITEM_COUNT = TABLE_COUNT
+
+    @staticmethod
+    def _parse(index, block, version=None):
+        return M8Table.read(block)
+
+    @staticmethod
+    def _new_item():
+        return M8Table()
+
+    @staticmethod
+    def _is_empty(table):
+        return table.is_empty()
+
+
+class M8SparseInstruments(_SparseSlots, M8Instruments):
+    """M8Instruments sharing one M8Block between empty slots."""
+
+    ITEM_BYTES = INSTRUMENT_BLOCK_SIZE
+    ITEM_COUNT = INSTRUMENTS_COUNT
+
+    @classmethod
+    def read(cls, data, version=None):
+        _ensure_registry()
+        return super().read(data, version=version)
+
+    @staticmethod
+    def _parse(index, block, version=None):
+        return M8Instruments._read_slot(index, block, version)
+
+    @staticmethod
+    def _new_item():
+        empty = M8Block()
+        empty.data = bytearray([EMPTY] + [0] * (INSTRUMENT_BLOCK_SIZE - 1))
+        return empty
+
+    @staticmethod
+    def _is_empty(instrument):
+        return type(instrument) is M8Block and instrument.data[0] == EMPTY
+
+
+class M8SparseEqs(_SparseSlots, M8Eqs):
+    """M8Eqs sharing one object between EQs at the firmware defaults."""
+
+    ITEM_BYTES = EQ_BYTES
+    ITEM_COUNT = EQ_COUNT
+
+    @staticmethod
+    def _parse(index, block, version=None):
+        return M8Eq.read(block.ljust(EQ_BYTES, b"\x00"))
+
+    @staticmethod
+    def _new_item():
+        return M8Eq()
+
+    @staticmethod
+    def _is_empty(eq):
+        return eq.is_default()
+
+
+# project attribute -> sparse collection class
+SPARSE_SECTIONS = {
+    "phrases": M8SparsePhrases,
+    "chains": M8SparseChains,
+    "tables": M8SparseTables,
+    "instruments": M8SparseInstruments,
+    "eqs": M8SparseEqs,
+}
@@ -0,0 +1,220 @@
+# m8/api/timing.py
+"""Groove-aware playback timing — song position → absolute time.
+
+The M8 sequences at 24 ticks per beat. A groove is a repeating list of
+per-step tick counts (the default groove `06 06` is straight 16ths); a
+phrase step lasts `groove[step % len(groove)]` ticks. An empty groove
+(all 0xFF) plays straight, i.e. as if it were `06`.
+
+Each groove is compiled once into a `GrooveTable` — tick lengths and
+cumulative tick offsets for all 16 phrase positions — so per-step timing
+is a tuple lookup. Tables are cached by groove bytes, so editing a
+groove naturally produces a new table.
+
+`M8TimingEngine` walks the song matrix (song cell → chain → phrase →
+step) for all eight tracks in time order and emits one `TimedStep` per
+phrase step. Groove changes are honoured mid-song:
+
+    GRV xx (sequence FX)   switch this track to groove xx from this step
+    GGR xx (mixer FX)      switch every track to groove xx from this tick
+
+Tracks are advanced in tick order (ties broken by track index), so a GGR
+on one track affects every step that starts at or after it on the others.
+
+Modelling notes: a track stops at its first empty song cell; a chain
+ends at its first empty step; HOP/TPO and other flow-control FX are not
+interpreted — tempo is `metadata.tempo` throughout.
+"""
+
+import heapq
+from dataclasses import dataclass
+
+from m8.api.fx import M8MixerFX, M8SequenceFX
+from m8.api.groove import GROOVE_COUNT
+from m8.api.phrase import STEP_COUNT as PHRASE_STEP_COUNT
+from m8.api.song import COL_COUNT, EMPTY_CHAIN, ROW_COUNT
+from m8.api.sparse import peek
+
+
+TICKS_PER_BEAT = 24
+DEFAULT_STEP_TICKS = 6   # straight 16ths — what an empty groove plays as
+
+EMPTY_PHRASE = 0xFF
+
+GRV_KEY = int(M8SequenceFX.GRV)
+GGR_KEY = int(M8MixerFX.GGR)
+
+
+def tick_seconds(tempo):
+    """Duration of one sequencer tick in seconds at `tempo` BPM."""
+    return 60.0 / (float(tempo) * TICKS_PER_BEAT)
+
+
+class GrooveTable:
+    """Precomputed timing for one groove over a 16-step phrase.
+
+    `ticks[i]` is the length of phrase step i in ticks; `offsets[i]` is
+    its start tick relative to the phrase start (`offsets[16]` is the
+    phrase length).
+    """
+
+    __slots__ = ("ticks", "offsets", "total")
+
+    def __init__(self, groove=None):
+        steps = groove.active_steps() if groove is not None else []
+        if not steps:
+            steps = [DEFAULT_STEP_TICKS]
+        self.ticks = tuple(steps[i % len(steps)] for i in range(PHRASE_STEP_COUNT))
+        offsets = [0]
+        for t in self.ticks:
+            offsets.append(offsets[-1] + t)
+        self.offsets = tuple(offsets)
+        self.total = offsets[-1]
+
+    def seconds(self, tempo):
+        """Per-step start offsets in seconds at `tempo` BPM."""
+        scale = tick_seconds(tempo)
+        return [o * scale for o in self.offsets]
+
+
+@dataclass(frozen=True)
+class TimedStep:
+    """One played phrase step with its absolute position."""
+
+    track: int
+    row: int           # song row
+    chain: int
+    chain_step: int
+    phrase: int
+    step: int          # phrase step 0..15
+    groove: int        # groove in force for this step
+    tick: int          # absolute start tick
+    ticks: int         # length in ticks
+    time: float        # absolute start time in seconds
+
+
+class _TrackCursor:
+    """Iterates the (row, chain, chain_step, phrase, step) positions a
+    single track plays, in order."""
+
+    def __init__(self, project, track):
+        self.track = track
+        self.groove = 0
+        self.tick = 0
+        self._positions = self._walk(project, track)
+
+    @staticmethod
+    def _walk(project, track):
+        song, chains, phrases = project.song, project.chains, project.phrases
+        for row in range(min(ROW_COUNT, len(song))):
+            chain_index = song[row][track]
+            if chain_index == EMPTY_CHAIN or chain_index >= len(chains):
+                return
+            for chain_step, cstep in enumerate(peek(chains, chain_index)):
+                phrase_index = cstep.phrase
+                if phrase_index == EMPTY_PHRASE:
+                    break
+                if phrase_index >= len(phrases):
+                    continue
+                phrase = peek(phrases, phrase_index)
+                for step_index, step in enumerate(phrase):
+                    yield row, chain_index, chain_step, phrase_index, step_index, step
+
+    def next(self):
+        return next(self._positions, None)
+
+
+class M8TimingEngine:
+    """Shared, cached timing computation for a project.
+
+    ::
+
+        engine = project.timing()
+        for ts in engine.timeline():
+            print(ts.track, ts.row, ts.step, f"{ts.time:.3f}s")
+        print(engine.duration(), "seconds")
+
+    The timeline is computed once and reused by every consumer; call
+    `invalidate()` after editing song/chains/phrases/tempo.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._tables = {}
+        self._timeline = None
+
+    def invalidate(self):
+        """Drop the cached timeline (groove tables re-key themselves)."""
+        self._timeline = None
+
+    @property
+    def tempo(self):
+        return self.project.metadata.tempo
+
+    def groove_table(self, index):
+        """Cached `GrooveTable` for groove `index` (by current groove bytes)."""
+        groove = self.project.grooves[index]
+        key = bytes(groove.write())
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = GrooveTable(groove)
+        return table
+
+    def groove_tables(self):
+        """Lookup tables for all 32 grooves."""
+        return [self.groove_table(i) for i in range(len(self.project.grooves))]
+
+    def timeline(self):
+        """Every played step on every track, sorted by (tick, track)."""
+        if self._timeline is None:
+            self._timeline = self._compute()
+        return self._timeline
+
+    def track_steps(self, track):
+        """Timeline restricted to one track."""
+        if not 0 <= track < COL_COUNT:
+            raise IndexError(f"track {track} out of range [0, {COL_COUNT - 1}]")
+        return [ts for ts in self.timeline() if ts.track == track]
+
+    def duration_ticks(self):
+        """Tick at which the last track finishes."""
+        return max((ts.tick + ts.ticks for ts in self.timeline()), default=0)
+
+    def duration(self):
+        """Song length in seconds (longest track)."""
+        return self.duration_ticks() * tick_seconds(self.tempo)
+
+    def _compute(self):
+        scale = tick_seconds(self.tempo)
+        n_grooves = min(GROOVE_COUNT, len(self.project.grooves))
+        tables = [self.groove_table(i) for i in range(n_grooves)]
+        cursors = [_TrackCursor(self.project, t) for t in range(COL_COUNT)]
+        heap = [(0, t) for t in range(COL_COUNT)]
+        heapq.heapify(heap)
+
+        out = []
+        while heap:
+            tick, track = heapq.heappop(heap)
+            cursor = cursors[track]
+            position = cursor.next()
+            if position is None:
+                continue
+            row, chain, chain_step, phrase, step_index, step = position
+
+            for tup in step.fx:
+                if tup.value >= n_grooves:
+                    continue
+                if tup.key == GRV_KEY:
+                    cursor.groove = tup.value
+                elif tup.key == GGR_KEY:
+                    for other in cursors:
+                        other.groove = tup.value
+
+            ticks = tables[cursor.groove].ticks[step_index]
+            out.append(TimedStep(
+                track=track, row=row, chain=chain, chain_step=chain_step,
+                phrase=phrase, step=step_index, groove=cursor.groove,
+                tick=tick, ticks=ticks, time=tick * scale,
+            ))
+            heapq.heappush(heap, (tick + ticks, track))
+        return out
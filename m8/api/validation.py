@@ -0,0 +1,369 @@
+# m8/api/validation.py
+"""Project-wide reference validation over raw section bytes.
+
+`M8Project.validate()` used to walk every phrase step through Python
+property calls and stop at the first bad value. This module checks every
+reference-bearing byte of a project in one pass and reports *all*
+violations with their location:
+
+    song cell                 → chain index      (0..254, 255 = empty)
+    chain step phrase         → phrase index     (0..254, 255 = empty)
+    phrase step instrument    → instrument index (0..127, 255 = empty)
+    phrase / table FX value   → instrument / table / EQ index, for the
+                                keys in remapper's *_REF_FX_KEYS sets
+    instrument associated_eq  → EQ index         (0..131, 255 = none)
+
+Each check works on a whole section at once: a strided slice
+(`data[2::9]` is every phrase step's instrument byte) is pushed through
+`bytes.translate` to classify each byte, so Python-level code only ever
+runs over the violations themselves::
+
+    for v in M8Validator(project).validate():
+        print(v)
+
+The validator keeps its results per slot, so after an edit only the
+touched slots are re-checked::
+
+    validator = M8Validator(project)
+    validator.validate()
+    project.phrases[3][0].instrument = 200
+    validator.revalidate(phrases=[3])
+    validator.violations      # now includes phrase 3 step 0
+
+`validate_bytes()` runs the same checks straight on .m8s file contents,
+without building an M8Project.
+"""
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from m8.api.chain import CHAIN_BLOCK_SIZE, CHAIN_COUNT, CHAIN_STEP_SIZE, CHAINS_OFFSET
+from m8.api.eq import EQ_COUNT
+from m8.api.instrument import (
+    BLOCK_COUNT as INSTRUMENT_COUNT, BLOCK_SIZE as INSTRUMENT_BLOCK_SIZE,
+    INSTRUMENTS_OFFSET, MODULATORS_OFFSET, TYPE_OFFSET,
+)
+from m8.api.phrase import (
+    FX_BLOCK_COUNT, FX_OFFSET, INSTRUMENT_OFFSET, PHRASE_BLOCK_SIZE,
+    PHRASE_COUNT, PHRASE_STEP_COUNT, PHRASE_STEP_SIZE, PHRASES_OFFSET,
+)
+from m8.api.remapper import EQ_REF_FX_KEYS, INSTRUMENT_REF_FX_KEYS, TABLE_REF_FX_KEYS
+from m8.api.song import COL_COUNT, ROW_COUNT, SONG_OFFSET
+from m8.api.sparse import peek
+from m8.api.table import (
+    TABLE_BYTES, TABLE_COUNT, TABLE_OFFSET, TABLE_STEP_BYTES, TABLE_STEP_COUNT,
+)
+
+EMPTY = 0xFF
+ASSOCIATED_EQ_OFFSET = MODULATORS_OFFSET - 1
+TABLE_FX_OFFSET = 2
+CHAIN_STEP_COUNT = CHAIN_BLOCK_SIZE // CHAIN_STEP_SIZE
+
+SECTIONS = ("song", "chains", "phrases", "tables", "instruments")
+
+# Reference kinds as bit flags, so the class of an FX key and the
+# out-of-range classes of its value can be ANDed
+_INSTRUMENT_REF = 1
+_TABLE_REF = 2
+_EQ_REF = 4
+
+_REF_NAMES = {_INSTRUMENT_REF: "instrument", _TABLE_REF: "table", _EQ_REF: "EQ"}
+_REF_COUNTS = {_INSTRUMENT_REF: INSTRUMENT_COUNT, _TABLE_REF: TABLE_COUNT, _EQ_REF: EQ_COUNT}
+
+_NONZERO = re.compile(b"[^\x00]")
+
+
+def _translate_table(classify):
+    return bytes(classify(b) for b in range(256))
+
+
+def _out_of_range(count):
+    """translate() table flagging bytes that are neither < count nor EMPTY."""
+    return _translate_table(lambda b: 0 if b < count or b == EMPTY else 1)
+
+
+# FX key → reference kind its value carries (0 for plain values)
+_FX_KEY_CLASS = _translate_table(
+    lambda b: (_INSTRUMENT_REF if b in INSTRUMENT_REF_FX_KEYS else 0)
+    | (_TABLE_REF if b in TABLE_REF_FX_KEYS else 0)
+    | (_EQ_REF if b in EQ_REF_FX_KEYS else 0)
+)
+# FX value → reference kinds it is out of range for
+_FX_VALUE_CLASS = _translate_table(
+    lambda b: sum(kind for kind, count in _REF_COUNTS.items() if b >= count)
+)
+
+_BAD_CHAIN = _out_of_range(CHAIN_COUNT)
+_BAD_PHRASE = _out_of_range(PHRASE_COUNT)
+_BAD_INSTRUMENT = _out_of_range(INSTRUMENT_COUNT)
+_BAD_EQ = _out_of_range(EQ_COUNT)
+
+
+@dataclass(frozen=True)
+class Violation:
+    """One invalid reference byte and where it lives."""
+
+    section: str             # one of SECTIONS
+    slot: int                # song row / chain / phrase / table / instrument
+    step: Optional[int]      # step (song: column) within the slot, if any
+    field: str               # "chain", "phrase", "instrument", "fx2", "associated_eq"...
+    value: int
+    message: str
+
+    def location(self):
+        if self.section == "song":
+            return f"song row {self.slot} col {self.step}"
+        where = f"{self.section[:-1]} {self.slot}"
+        if self.step is not None:
+            where += f" step {self.step}"
+        return where
+
+    def __str__(self):
+        return f"{self.location()} {self.field}: {self.message}"
+
+
+class ProjectValidationError(ValueError):
+    """Invalid references in a project; `violations` lists all of them."""
+
+    def __init__(self, violations):
+        self.violations = list(violations)
+        more = len(self.violations) - 1
+        message = str(self.violations[0]) if self.violations else "invalid project"
+        if more > 0:
+            message += f" (and {more} more)"
+        super().__init__(message)
+
+
+def _hits(data, offset, stride, table):
+    """Indices into data[offset::stride] whose byte `table` flags."""
+    mask = data[offset::stride].translate(table)
+    return [m.start() for m in _NONZERO.finditer(mask)]
+
+
+def _fx_hits(data, offset, stride):
+    """(index, kind) for FX tuples at data[offset::stride] whose key is a
+    reference FX and whose value is out of range for it."""
+    keys = data[offset::stride].translate(_FX_KEY_CLASS)
+    if _NONZERO.search(keys) is None:
+        return []
+    values = data[offset + 1::stride].translate(_FX_VALUE_CLASS)
+    n = len(values)
+    hits = int.from_bytes(keys[:n], "little") & int.from_bytes(values, "little")
+    if not hits:
+        return []
+    mask = hits.to_bytes(n, "little")
+    return [(m.start(), mask[m.start()]) for m in _NONZERO.finditer(mask)]
+
+
+def _ref_message(kind, value, count):
+    return f"invalid {kind} reference {value}: must be 0-{count - 1} or 255 (empty)"
+
+
+def _fx_violations(section, data, slots, fx_offset, stride, steps):
+    out = []
+    for j in range(FX_BLOCK_COUNT):
+        offset = fx_offset + 2 * j
+        for index, kind in _fx_hits(data, offset, stride):
+            pos = index * stride + offset
+            key, value = data[pos], data[pos + 1]
+            name = _REF_NAMES[kind]
+            out.append(Violation(
+                section, slots[index // steps], index % steps, f"fx{j + 1}", value,
+                f"FX {key:#04x} value {value} is not a valid {name} index "
+                f"(0-{_REF_COUNTS[kind] - 1})",
+            ))
+    return out
+
+
+def check_song(data, rows=None):
+    """Violations in song rows; `data` is the rows' bytes back to back and
+    `rows` their row indices (default: 0, 1, ...)."""
+    rows = rows if rows is not None else range(len(data) // COL_COUNT)
+    return [
+        Violation("song", rows[i // COL_COUNT], i % COL_COUNT, "chain", data[i],
+                  _ref_message("chain", data[i], CHAIN_COUNT))
+        for i in _hits(data, 0, 1, _BAD_CHAIN)
+    ]
+
+
+def check_chains(data, slots=None):
+    """Violations in chain blocks (see `check_song` for the arguments)."""
+    slots = slots if slots is not None else range(len(data) // CHAIN_BLOCK_SIZE)
+    out = []
+    for i in _hits(data, 0, CHAIN_STEP_SIZE, _BAD_PHRASE):
+        value = data[i * CHAIN_STEP_SIZE]
+        out.append(Violation("chains", slots[i // CHAIN_STEP_COUNT], i % CHAIN_STEP_COUNT,
+                             "phrase", value, _ref_message("phrase", value, PHRASE_COUNT)))
+    return out
+
+
+def check_phrases(data, slots=None):
+    """Violations in phrase blocks: instrument column and reference FX."""
+    slots = slots if slots is not None else range(len(data) // PHRASE_BLOCK_SIZE)
+    out = []
+    for i in _hits(data, INSTRUMENT_OFFSET, PHRASE_STEP_SIZE, _BAD_INSTRUMENT):
+        value = data[i * PHRASE_STEP_SIZE + INSTRUMENT_OFFSET]
+        out.append(Violation("phrases", slots[i // PHRASE_STEP_COUNT], i % PHRASE_STEP_COUNT,
+                             "instrument", value,
+                             _ref_message("instrument", value, INSTRUMENT_COUNT)))
+    out += _fx_violations("phrases", data, slots, FX_OFFSET, PHRASE_STEP_SIZE, PHRASE_STEP_COUNT)
+    return out
+
+
+def check_tables(data, slots=None):
+    """Violations in table blocks: reference FX."""
+    slots = slots if slots is not None else range(len(data) // TABLE_BYTES)
+    return _fx_violations("tables", data, slots, TABLE_FX_OFFSET, TABLE_STEP_BYTES,
+                          TABLE_STEP_COUNT)
+
+
+def check_instruments(data, slots=None):
+    """Violations in instrument blocks: associated_eq of non-empty slots."""
+    slots = slots if slots is not None else range(len(data) // INSTRUMENT_BLOCK_SIZE)
+    out = []
+    for i in _hits(data, ASSOCIATED_EQ_OFFSET, INSTRUMENT_BLOCK_SIZE, _BAD_EQ):
+        base = i * INSTRUMENT_BLOCK_SIZE
+        if data[base + TYPE_OFFSET] == EMPTY:
+            continue
+        value = data[base + ASSOCIATED_EQ_OFFSET]
+        out.append(Violation("instruments", slots[i], None, "associated_eq", value,
+                             _ref_message("EQ", value, EQ_COUNT)))
+    return out
+
+
+# section → (checker, file offset, slot size, slot count, steps per slot)
+_SECTIONS = {
+    "song": (check_song, SONG_OFFSET, COL_COUNT, ROW_COUNT, None),
+    "chains": (check_chains, CHAINS_OFFSET, CHAIN_BLOCK_SIZE, CHAIN_COUNT, CHAIN_STEP_COUNT),
+    "phrases": (check_phrases, PHRASES_OFFSET, PHRASE_BLOCK_SIZE, PHRASE_COUNT,
+                PHRASE_STEP_COUNT),
+    "tables": (check_tables, TABLE_OFFSET, TABLE_BYTES, TABLE_COUNT, TABLE_STEP_COUNT),
+    "instruments": (check_instruments, INSTRUMENTS_OFFSET, INSTRUMENT_BLOCK_SIZE,
+                    INSTRUMENT_COUNT, None),
+}
+
+
+def validate_bytes(data):
+    """All violations in raw .m8s file contents, by section then slot."""
+    out = []
+    for section in SECTIONS:
+        check, offset, size, count, _ = _SECTIONS[section]
+        found = check(bytes(data[offset:offset + size * count]))
+        out += sorted(found, key=lambda v: v.slot)
+    return out
+
+
+def _step_buffers(item):
+    """A phrase's or table's raw buffers: each step's bytes, then its FX."""
+    parts = []
+    for step in item:
+        parts.append(step._data)
+        parts.extend([fx._data for fx in step.fx])
+    return parts
+
+
+# section → the buffers making up one slot's bytes; reading the objects'
+# bytearrays directly skips the per-object copies write() makes
+_BUFFERS = {
+    "song": lambda row: [row._data],
+    "chains": lambda chain: [step._data for step in chain],
+    "phrases": _step_buffers,
+    "tables": _step_buffers,
+    "instruments": lambda instrument: [instrument._data],
+}
+
+
+def _fit(block, size):
+    if len(block) < size:
+        return block + bytes(size - len(block))
+    return block[:size]
+
+
+class M8Validator:
+    """Reference validation for an M8Project, with per-slot results.
+
+    `validate()` checks everything; `revalidate(phrases=[...], ...)`
+    re-encodes and re-checks only the given slots and replaces their
+    previous results. Collections holding more slots than the format
+    allows, or slots with the wrong number of steps, are reported as
+    violations too.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._results = {section: {} for section in SECTIONS}
+
+    def _slot_bytes(self, section, slots, structure):
+        _, _, size, _, steps = _SECTIONS[section]
+        collection = getattr(self.project, section)
+        buffers = _BUFFERS[section]
+        blocks = []
+        for slot in slots:
+            item = peek(collection, slot)
+            if steps is not None and len(item) != steps:
+                structure.append(Violation(
+                    section, slot, None, "steps", len(item),
+                    f"has {len(item)} steps, expected {steps}",
+                ))
+            try:
+                block = b"".join(buffers(item))
+            except AttributeError:
+                # Not one of the api classes (e.g. an M8Block instrument)
+                block = bytes(item.write()) if hasattr(item, "write") else b""
+            blocks.append(_fit(block, size))
+        return b"".join(blocks)
+
+    def _check(self, section, slots):
+        check, _, _, count, _ = _SECTIONS[section]
+        collection = getattr(self.project, section)
+        if collection is None:
+            return
+        slots = sorted({s for s in slots if 0 <= s < min(count, len(collection))})
+        found = []
+        data = self._slot_bytes(section, slots, found)
+        found += check(data, slots)
+        results = self._results[section]
+        for slot in slots:
+            results.pop(slot, None)
+        for v in found:
+            results.setdefault(v.slot, []).append(v)
+
+    def validate(self, sections=SECTIONS):
+        """Check every slot of `sections`; returns all violations."""
+        for section in sections:
+            count = _SECTIONS[section][3]
+            collection = getattr(self.project, section)
+            self._results[section] = {}
+            if collection is None:
+                continue
+            if len(collection) > count:
+                self._results[section][count] = [Violation(
+                    section, count, None, "count", len(collection),
+                    f"too many {section}: {len(collection)}, maximum is {count}",
+                )]
+            self._check(section, range(len(collection)))
+        return self.violations
+
+    def revalidate(self, song=(), chains=(), phrases=(), tables=(), instruments=()):
+        """Re-check only the given slots (song: row indices); returns all
+        violations."""
+        for section, slots in zip(SECTIONS, (song, chains, phrases, tables, instruments)):
+            if slots:
+                self._check(section, slots)
+        return self.violations
+
+    @property
+    def violations(self):
+        """Current violations, ordered by section then slot."""
+        out = []
+        for section in SECTIONS:
+            results = self._results[section]
+            for slot in sorted(results):
+                out += results[slot]
+        return out
+
+    def raise_for_violations(self):
+        """Raise ProjectValidationError if any violation is recorded."""
+        violations = self.violations
+        if violations:
+            raise ProjectValidationError(violations)
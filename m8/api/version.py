@@ -5,15 +5,20 @@
 class M8Version:
     """Represents the M8 firmware version used to create a file."""
 
-    def __init__(self, major=6, minor=0, patch=17):
-        """Initialize version. Defaults match TEMPLATE-6-2-1.m8s (firmware 6.0.17)."""
+    def __init__(self, major=6, minor=0, patch=17, reserved=0):
+        """Initialize version. Defaults match TEMPLATE-6-2-1.m8s (firmware 6.0.17).
+
+        `reserved` is the fourth version byte: not part of the version
+        number, but kept so files round-trip (.m8i exports set it).
+        """
         self.major = major
         self.minor = minor
         self.patch = patch
+        self.reserved = reserved
 
     @classmethod
     def read(cls, data):
-        """Read version from a buffer where bytes are laid out [patch, major, minor, 0]."""
+        """Read version from a buffer where bytes are laid out [patch, major, minor, reserved]."""
         instance = cls()
         if len(data) >= 1:
             instance.patch = data[0]
@@ -21,10 +26,15 @@ class M8Version:
             instance.major = data[1]
         if len(data) >= 3:
             instance.minor = data[2]
+        if len(data) >= 4:
+            instance.reserved = data[3]
         return instance
 
     def write(self):
-        return bytes([self.patch, self.major, self.minor, 0])
+        return bytes([self.patch, self.major, self.minor, self.reserved])
+
+    def clone(self):
+        return M8Version(self.major, self.minor, self.patch, self.reserved)
 
     def tuple(self):
         """Return (major, minor, patch) for ordered comparison."""
@@ -1,12 +1,77 @@
 #!/usr/bin/env python3
 """Chain Builder - Tool for creating M8 sample chains with slice metadata."""
 
-from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from pydub import AudioSegment
 from m8.tools.wav_slicer import WAVSlicer
 
 
+class PydubSlices:
+    """ChainBuilder backend: prepare each sample as a pydub AudioSegment.
+
+    `prepare()` loads, resamples, truncates to the slice and fades;
+    padding happens when the slice is written into the chain.
+    """
+
+    def __init__(self, frame_rate, frames_per_slice, fade_ms):
+        self.frame_rate = frame_rate
+        self.frames_per_slice = frames_per_slice
+        self.fade_ms = fade_ms
+
+    def prepare(self, sample):
+        # Load sample if it's a file path
+        if isinstance(sample, (str, Path)):
+            segment = AudioSegment.from_file(str(sample))
+        elif isinstance(sample, AudioSegment):
+            segment = sample
+        else:
+            raise TypeError(f"Sample must be AudioSegment or file path, got {type(sample)}")
+
+        # Resample to target frame rate if needed
+        if segment.frame_rate != self.frame_rate:
+            segment = segment.set_frame_rate(self.frame_rate)
+
+        # Truncate to the slice; shorter samples are padded with silence
+        # when written into the chain
+        fills_slice = segment.frame_count() >= self.frames_per_slice
+        if fills_slice:
+            segment = segment.get_sample_slice(0, self.frames_per_slice)
+
+        # Apply fade in/out to avoid clicks at slice boundaries. The fade-out
+        # of a padded sample would land on silence, so only full slices need it.
+        if self.fade_ms > 0:
+            segment = segment.fade_in(int(self.fade_ms))
+            if fills_slice:
+                segment = segment.fade_out(int(self.fade_ms))
+        return segment
+
+    @staticmethod
+    def format(prepared):
+        return prepared.channels, prepared.sample_width
+
+    def pcm(self, prepared, channels, sample_width):
+        segment = prepared
+        if segment.channels != channels:
+            segment = segment.set_channels(channels)
+        if segment.sample_width != sample_width:
+            segment = segment.set_sample_width(sample_width)
+        return segment.raw_data[:self.frames_per_slice * channels * sample_width]
+
+    def dump(self, prepared):
+        """(raw_pcm, channels, sample_width) of a prepared slice, for caching."""
+        return prepared.raw_data, prepared.channels, prepared.sample_width
+
+    def load(self, raw_pcm, channels, sample_width):
+        return AudioSegment(
+            data=raw_pcm, sample_width=sample_width,
+            frame_rate=self.frame_rate, channels=channels,
+        )
+
+
+BACKENDS = ("pydub", "numpy")
+
+
 class ChainBuilder:
     """Build sample chains with slice metadata for M8 tracker.
 
@@ -15,7 +80,8 @@ class ChainBuilder:
     be handled by the caller.
     """
 
-    def __init__(self, slice_duration_ms, fade_ms=3, frame_rate=44100):
+    def __init__(self, slice_duration_ms, fade_ms=3, frame_rate=44100, backend="pydub",
+                 workers=None, cache=None, dedupe=False):
         """Initialize chain builder.
 
         Args:
@@ -23,17 +89,63 @@ class ChainBuilder:
                                Each sample will be normalized (truncated/padded) to this length
             fade_ms: Fade in/out duration in milliseconds (default: 3)
             frame_rate: Sample rate in Hz (default: 44100)
+            backend: "pydub" (default) or "numpy" — the NumPy backend decodes
+                     WAVs with the stdlib and processes samples as arrays
+                     (requires numpy)
+            workers: If > 1, decode/resample/fade samples across a process
+                     pool of this size. The pool is created on first use and
+                     reused across chains; call close() (or use the builder
+                     as a context manager) to shut it down.
+            cache: Optional SampleCache; prepared slices are looked up before
+                   (and stored after) decoding, so repeat builds skip it
+            dedupe: Pack perceptually identical samples (same sound, any
+                    name/format) into one slice; the returned mapping points
+                    every duplicate at the shared slice (requires numpy)
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
         self.slice_duration_ms = slice_duration_ms
         self.fade_ms = fade_ms
         self.frame_rate = frame_rate
+        self.backend = backend
+        self.workers = workers
+        self.cache = cache
+        self.dedupe = dedupe
         self.wav_slicer = WAVSlicer()
+        self.slices = self._make_backend()
+        self._executor = None
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _make_backend(self):
+        fade_ms = min(self.fade_ms, int(self.slice_duration_ms) // 10)
+        if self.backend == "numpy":
+            try:
+                from m8.tools.numpy_audio import NumpySlices
+            except ImportError as e:
+                raise ImportError("backend='numpy' requires numpy (pip install numpy)") from e
+            return NumpySlices(self.frame_rate, self.frames_per_slice, fade_ms)
+        return PydubSlices(self.frame_rate, self.frames_per_slice, fade_ms)
 
     def build_chain(self, samples):
         """Build a sample chain from a list of audio samples.
 
         Loads samples, normalizes each to slice_duration_ms (padding or truncating),
-        applies fade in/out, and concatenates with slice metadata.
+        applies fade in/out, and writes each slice straight into one
+        preallocated PCM buffer. The WAV header and cue chunks are emitted
+        once around it, so build time is linear in the chain length.
 
         Args:
             samples: List of AudioSegment objects or file paths (Path/str)
@@ -42,74 +154,125 @@ class ChainBuilder:
             tuple: (BytesIO containing WAV with slice metadata, slice_index_mapping)
                   slice_index_mapping is dict mapping original index to slice index
         """
+        segments, slice_index_mapping = self._prepare_samples(samples)
+        channels, sample_width = self._chain_format(segments)
+        slice_bytes = self.frames_per_slice * channels * sample_width
+
+        pcm = bytearray(slice_bytes * len(segments))
+        view = memoryview(pcm)
+        for i, segment in enumerate(segments):
+            raw = self.slices.pcm(segment, channels, sample_width)
+            start = i * slice_bytes
+            view[start:start + len(raw)] = raw
+
+        return self.wav_slicer.build_wav(
+            pcm, self.frame_rate, channels, sample_width,
+            self._slice_positions(len(segments)),
+        ), slice_index_mapping
+
+    def write_chain(self, samples, output):
+        """Stream a sample chain straight to a file without buffering it.
+
+        Same output as `build_chain()`, but slices are written to `output`
+        (a path or a binary file object) one at a time.
+
+        Returns:
+            dict: slice_index_mapping (original index to slice index)
+        """
+        segments, slice_index_mapping = self._prepare_samples(samples)
+        channels, sample_width = self._chain_format(segments)
+        slice_bytes = self.frames_per_slice * channels * sample_width
+        data_size = slice_bytes * len(segments)
+        slice_points = self._slice_positions(len(segments))
+
+        if isinstance(output, (str, Path)):
+            with open(output, 'wb') as f:
+                self._stream_chain(f, segments, channels, sample_width, data_size, slice_points)
+        else:
+            self._stream_chain(output, segments, channels, sample_width, data_size, slice_points)
+        return slice_index_mapping
+
+    @property
+    def frames_per_slice(self):
+        return int(self.slice_duration_ms * self.frame_rate / 1000)
+
+    def _slice_positions(self, num_slices):
+        # Precise slice positions - no concatenation = no cumulative errors
+        return [i * self.frames_per_slice for i in range(num_slices)]
+
+    def _stream_chain(self, f, segments, channels, sample_width, data_size, slice_points):
+        slice_bytes = self.frames_per_slice * channels * sample_width
+        f.write(self.wav_slicer.wav_prologue(
+            data_size, self.frame_rate, channels, sample_width, slice_points,
+        ))
+        for segment in segments:
+            raw = self.slices.pcm(segment, channels, sample_width)
+            f.write(raw)
+            if len(raw) < slice_bytes:
+                f.write(bytes(slice_bytes - len(raw)))
+        f.write(self.wav_slicer.wav_epilogue(data_size, slice_points))
+
+    def _prepare_samples(self, samples):
         if not samples:
             raise ValueError("No samples provided")
 
+        slice_index_mapping = None
+        if self.dedupe:
+            try:
+                from m8.tools.sample_dedup import dedupe
+            except ImportError as e:
+                raise ImportError("dedupe=True requires numpy (pip install numpy)") from e
+            samples, slice_index_mapping = dedupe(samples, workers=self.workers)
+
         # M8 supports up to 128 slices for evenly-spaced slice mode
         if len(samples) > 128:
             raise ValueError(f"Chain has {len(samples)} samples, exceeds M8 limit of 128 slices")
 
-        # Load and process all samples
-        processed_segments = []
-        slice_index_mapping = {}
-
-        for idx, sample in enumerate(samples):
-            # Load sample if it's a file path
-            if isinstance(sample, (str, Path)):
-                segment = AudioSegment.from_file(str(sample))
-            elif isinstance(sample, AudioSegment):
-                segment = sample
-            else:
-                raise TypeError(f"Sample must be AudioSegment or file path, got {type(sample)}")
-
-            # Resample to target frame rate if needed
-            if segment.frame_rate != self.frame_rate:
-                segment = segment.set_frame_rate(self.frame_rate)
-
-            # Normalize to slice duration (truncate or pad)
-            if len(segment) > self.slice_duration_ms:
-                segment = segment[:int(self.slice_duration_ms)]
-            elif len(segment) < self.slice_duration_ms:
-                silence_duration = int(self.slice_duration_ms - len(segment))
-                silence = AudioSegment.silent(
-                    duration=silence_duration,
-                    frame_rate=self.frame_rate
-                )
-                segment = segment + silence
-
-            # Apply fade in/out to avoid clicks at slice boundaries
-            fade_duration = min(self.fade_ms, len(segment) // 10)
-            if fade_duration > 0:
-                segment = segment.fade_in(int(fade_duration))
-                segment = segment.fade_out(int(fade_duration))
-
-            processed_segments.append(segment)
-            slice_index_mapping[idx] = idx
-
-        # Pre-allocate silent buffer for entire chain at exact duration
-        # Calculate precise slice positions - no concatenation = no cumulative errors
-        samples_per_slice = int(self.slice_duration_ms * self.frame_rate / 1000)
-        num_slices = len(processed_segments)
-        slice_positions = [i * samples_per_slice for i in range(num_slices)]
-
-        # Create silent buffer with exact total duration
-        total_duration_ms = self.slice_duration_ms * num_slices
-        chain = AudioSegment.silent(
-            duration=int(total_duration_ms),
-            frame_rate=self.frame_rate
-        )
+        segments = [None] * len(samples)
+        keys = {}
+        if self.cache is not None:
+            for idx, sample in enumerate(samples):
+                if not isinstance(sample, (str, Path, AudioSegment)):
+                    continue  # let the backend raise its TypeError
+                keys[idx] = self.cache.key(sample, *self._cache_params())
+                entry = self.cache.get(keys[idx])
+                if entry is not None:
+                    raw_pcm, _, channels, sample_width = entry
+                    segments[idx] = self.slices.load(raw_pcm, channels, sample_width)
+
+        missing = [idx for idx, seg in enumerate(segments) if seg is None]
+        for idx, segment in zip(missing, self._prepare_many([samples[i] for i in missing])):
+            segments[idx] = segment
+            if idx in keys:
+                self.cache.put(keys[idx], *self._cache_entry(segment))
+
+        if slice_index_mapping is None:
+            slice_index_mapping = {idx: idx for idx in range(len(samples))}
+        return segments, slice_index_mapping
 
-        # Overlay each segment at its precise slice position
-        for i, segment in enumerate(processed_segments):
-            position_ms = i * self.slice_duration_ms
-            chain = chain.overlay(segment, position=int(position_ms))
+    def _prepare_many(self, samples):
+        if self.workers and self.workers > 1 and len(samples) > 1:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            # map() yields results in input order, so slices stay in place
+            chunksize = max(1, len(samples) // (self.workers * 4))
+            return list(self._executor.map(self.slices.prepare, samples, chunksize=chunksize))
+        return [self.slices.prepare(sample) for sample in samples]
 
-        # Export chain to WAV format in memory
-        wav_buffer = BytesIO()
-        chain.export(wav_buffer, format="wav")
-        wav_data = wav_buffer.getvalue()
+    def _cache_params(self):
+        return (self.frame_rate, self.slice_duration_ms, self.fade_ms, self.backend)
 
-        # Add slice point metadata using WAVSlicer
-        sliced_wav = self.wav_slicer.add_slice_points(wav_data, slice_positions)
+    def _cache_entry(self, segment):
+        raw_pcm, channels, sample_width = self.slices.dump(segment)
+        return raw_pcm, self.frame_rate, channels, sample_width
 
-        return sliced_wav, slice_index_mapping
+    def _chain_format(self, segments):
+        """Channel count and sample width of the chain.
+
+        Matches pydub's overlay rules against a 16-bit mono silent base:
+        the widest format among the slices wins.
+        """
+        formats = [self.slices.format(seg) for seg in segments]
+        channels = max(c for c, _ in formats)
+        sample_width = max([2] + [w for _, w in formats])
+        return channels, sample_width
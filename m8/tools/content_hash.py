@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Content Hash - the one SHA-256 scheme for sample files and audio.
+
+The sample cache, index, bundler, dedup and the demo sync tool all key
+samples by content. They share these helpers so a digest computed by one
+matches the others::
+
+    file_sha256("kick.wav")                 # streamed in HASH_BLOCK_SIZE reads
+    sample_sha256(segment)                  # PCM plus format, for AudioSegments
+"""
+
+import hashlib
+from pathlib import Path
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha256(path):
+    """Hex SHA-256 of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def segment_sha256(segment):
+    """Hex SHA-256 of an AudioSegment's PCM and format."""
+    h = hashlib.sha256(
+        f"{segment.frame_rate}:{segment.channels}:{segment.sample_width}:".encode()
+    )
+    h.update(segment.raw_data)
+    return h.hexdigest()
+
+
+def sample_sha256(sample):
+    """Hex SHA-256 of a file path or AudioSegment.
+
+    Raises:
+        TypeError: for anything else
+    """
+    if isinstance(sample, (str, Path)):
+        return file_sha256(sample)
+    if not hasattr(sample, 'raw_data'):
+        raise TypeError(f"Sample must be AudioSegment or file path, got {type(sample)}")
+    return segment_sha256(sample)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Instrument Library - load folders of .m8i presets into an indexed bank.
+
+Files are read on a thread pool (small reads, IO-bound), hashed, and
+parsed with `M8Instrument.read_m8i`. Parsed instruments are memoised by
+content hash, so browsing the same presets again — or a second library
+over an overlapping folder — doesn't reparse anything::
+
+    library = load_library("Instruments/drums")           # dir, glob or paths
+    kick = library.instrument("KICK 01")                  # an editable clone
+    for entry in library.of_type(M8InstrumentType.FMSYNTH):
+        print(entry.path.name, entry.name)
+
+Entries share the memoised instrument; `InstrumentLibrary.instrument()`
+and `LibraryEntry.clone()` hand out copies that are safe to edit.
+
+The other direction writes every populated instrument slot of a project
+as an .m8i preset, together with its instrument table::
+
+    written = export_instruments(project, "Instruments/set1")
+"""
+
+import glob
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from m8.api.instrument import M8Instrument, M8InstrumentType, _ensure_registry
+from m8.api.sparse import peek
+
+M8I_SUFFIX = ".m8i"
+UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+DEFAULT_WORKERS = 8
+MAX_CACHED = 4096
+
+_parsed = OrderedDict()          # sha256 -> parsed M8Instrument
+_parsed_lock = threading.Lock()
+
+
+def clear_cache():
+    """Forget every memoised instrument."""
+    with _parsed_lock:
+        _parsed.clear()
+
+
+def _parse(data, source=None):
+    """Parsed instrument for .m8i bytes, memoised by content hash.
+
+    Returns:
+        tuple: (sha256 hex digest, shared M8Instrument)
+    """
+    sha = hashlib.sha256(data).hexdigest()
+    with _parsed_lock:
+        instrument = _parsed.get(sha)
+        if instrument is not None:
+            _parsed.move_to_end(sha)
+            return sha, instrument
+    instrument = M8Instrument.read_m8i(data, source=source)
+    with _parsed_lock:
+        _parsed[sha] = instrument
+        while len(_parsed) > MAX_CACHED:
+            _parsed.popitem(last=False)
+    return sha, instrument
+
+
+@dataclass(frozen=True)
+class LibraryEntry:
+    """One .m8i file in a library."""
+
+    path: Path
+    sha256: str
+    name: str
+    type_id: int
+    instrument: M8Instrument      # shared; clone() before editing
+
+    @property
+    def type_name(self):
+        try:
+            return M8InstrumentType(self.type_id).name
+        except ValueError:
+            return f"0x{self.type_id:02X}"
+
+    def clone(self):
+        return self.instrument.clone()
+
+
+class InstrumentLibrary:
+    """Bank of .m8i instruments indexed by name, type and content hash.
+
+    Names need not be unique; `by_name` maps each to every entry that
+    carries it, in load order.
+    """
+
+    def __init__(self, entries=()):
+        self.entries = []
+        self.by_name = {}
+        self.by_type = {}
+        self.by_hash = {}
+        self.errors = {}              # path -> error text
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        self.entries.append(entry)
+        self.by_name.setdefault(entry.name, []).append(entry)
+        self.by_type.setdefault(entry.type_id, []).append(entry)
+        self.by_hash.setdefault(entry.sha256, entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __contains__(self, name):
+        return name in self.by_name
+
+    def get(self, name):
+        """First entry named `name`, or None."""
+        found = self.by_name.get(name)
+        return found[0] if found else None
+
+    def instrument(self, name):
+        """Editable copy of the first instrument named `name`.
+
+        Raises:
+            KeyError: if no instrument has that name
+        """
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry.clone()
+
+    def of_type(self, type_id):
+        """Entries of one instrument type (M8InstrumentType or int)."""
+        return list(self.by_type.get(int(type_id), ()))
+
+    def duplicates(self):
+        """Lists of entries whose files have identical contents."""
+        groups = {}
+        for entry in self.entries:
+            groups.setdefault(entry.sha256, []).append(entry)
+        return [group for group in groups.values() if len(group) > 1]
+
+
+def find_m8i(source):
+    """.m8i paths for a directory (searched recursively), a glob pattern,
+    a single file, or an iterable of paths — sorted, without duplicates."""
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.is_dir():
+            paths = path.rglob(f"*{M8I_SUFFIX}")
+        elif path.is_file():
+            paths = [path]
+        else:
+            paths = (Path(p) for p in glob.glob(str(source), recursive=True))
+    else:
+        paths = (Path(p) for p in source)
+    return sorted(set(paths))
+
+
+def _load_entry(path):
+    try:
+        data = path.read_bytes()
+        sha, instrument = _parse(data, source=path)
+        return LibraryEntry(path, sha, instrument.name, instrument.type_id, instrument)
+    except (OSError, ValueError, IndexError) as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def load_library(source, workers=DEFAULT_WORKERS):
+    """Read every .m8i file under `source` into an InstrumentLibrary.
+
+    Args:
+        source: Directory, glob pattern, file, or iterable of paths
+        workers: Thread pool size for reading and parsing
+
+    Returns:
+        InstrumentLibrary; unreadable files are listed in `.errors`
+    """
+    _ensure_registry()
+    paths = find_m8i(source)
+    library = InstrumentLibrary()
+    if workers and workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_load_entry, paths))
+    else:
+        results = [_load_entry(p) for p in paths]
+    for path, result in zip(paths, results):
+        if isinstance(result, str):
+            library.errors[path] = result
+        else:
+            library.add(result)
+    return library
+
+
+def export_filename(index, instrument):
+    """File name for instrument slot `index`: "<slot in hex>-<name>.m8i"."""
+    name = UNSAFE_FILENAME_CHARS.sub("_", instrument.name).strip()
+    return f"{index:02X}-{name}{M8I_SUFFIX}" if name else f"{index:02X}{M8I_SUFFIX}"
+
+
+def export_instruments(project, directory, workers=DEFAULT_WORKERS):
+    """Write every populated instrument slot of `project` as an .m8i file.
+
+    Each file carries the instrument's table (table N for instrument N).
+    Files are encoded and written on a thread pool.
+
+    Args:
+        project: M8Project
+        directory: Output directory (created if missing)
+        workers: Thread pool size
+
+    Returns:
+        dict: {slot index: Path written}
+
+    Raises:
+        ValueError: if an instrument can't be stored as .m8i (the other
+                    files are still written)
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    slots = [(index, instrument) for index, instrument in enumerate(project.instruments)
+             if isinstance(instrument, M8Instrument)]
+
+    def _export(item):
+        index, instrument = item
+        path = directory / export_filename(index, instrument)
+        table = peek(project.tables, index) if index < len(project.tables) else None
+        path.write_bytes(instrument.write_m8i(table))
+        return path
+
+    written, failed = {}, []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [(index, pool.submit(_export, (index, inst))) for index, inst in slots]
+        for index, future in futures:
+            try:
+                written[index] = future.result()
+            except ValueError as e:
+                failed.append(f"slot {index:02X}: {e}")
+    if failed:
+        raise ValueError("Could not export " + "; ".join(failed))
+    return written
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""NumPy audio processing backend for ChainBuilder.
+
+Decodes PCM WAVs with the stdlib `wave` module (no ffmpeg) into float32
+arrays shaped (frames, channels) in [-1.0, 1.0), and does resampling,
+truncation/padding, fades and PCM encoding as whole-array operations.
+Non-WAV inputs fall back to pydub for decoding only.
+
+Requires numpy (`pip install pym8[numpy]`); select it with
+`ChainBuilder(..., backend="numpy")`.
+"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+
+
+def _pcm_to_float(raw, sample_width, channels):
+    """Decode little-endian PCM bytes to a float32 (frames, channels) array."""
+    if sample_width == 1:
+        # 8-bit WAV is unsigned
+        ints = np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0
+        scale = 128.0
+    elif sample_width == 2:
+        ints = np.frombuffer(raw, dtype='<i2').astype(np.float32)
+        scale = 32768.0
+    elif sample_width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = (b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16))
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints).astype(np.float32)
+        scale = 8388608.0
+    elif sample_width == 4:
+        ints = np.frombuffer(raw, dtype='<i4').astype(np.float64)
+        scale = 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+    return (ints / scale).astype(np.float32).reshape(-1, channels)
+
+
+def to_pcm(samples, sample_width):
+    """Encode a float (frames, channels) array as little-endian PCM bytes.
+
+    Uses the same 2**(bits-1) scale as decoding, so decode → encode is
+    lossless; values are clipped to the integer range.
+    """
+    if sample_width not in (1, 2, 3, 4):
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+    scale = float(1 << (8 * sample_width - 1))
+    ints = np.clip(np.round(np.asarray(samples, dtype=np.float64) * scale), -scale, scale - 1)
+    if sample_width == 1:
+        # 8-bit WAV is unsigned
+        return (ints + 128).astype(np.uint8).tobytes()
+    if sample_width == 2:
+        return ints.astype('<i2').tobytes()
+    if sample_width == 3:
+        return ints.astype('<i4').reshape(-1).view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    return ints.astype('<i4').tobytes()
+
+
+def read_wav(source):
+    """Decode a PCM WAV file (path or binary file object).
+
+    Returns:
+        tuple: (float32 array shaped (frames, channels), frame_rate, sample_width)
+
+    Raises:
+        wave.Error: if the file is not a PCM WAV the stdlib can read
+    """
+    with wave.open(str(source) if isinstance(source, Path) else source, 'rb') as w:
+        channels = w.getnchannels()
+        sample_width = w.getsampwidth()
+        frame_rate = w.getframerate()
+        raw = w.readframes(w.getnframes())
+    return _pcm_to_float(raw, sample_width, channels), frame_rate, sample_width
+
+
+def from_segment(segment):
+    """Convert a pydub AudioSegment to (array, frame_rate, sample_width)."""
+    return (
+        _pcm_to_float(segment.raw_data, segment.sample_width, segment.channels),
+        segment.frame_rate,
+        segment.sample_width,
+    )
+
+
+def load_audio(sample):
+    """Decode a sample given as a path or AudioSegment.
+
+    `.wav` paths are read with the stdlib; anything else (or a WAV the
+    stdlib rejects, e.g. float or extensible formats) goes through pydub.
+    """
+    from pydub import AudioSegment
+
+    if isinstance(sample, (str, Path)):
+        path = Path(sample)
+        if path.suffix.lower() == '.wav':
+            try:
+                return read_wav(path)
+            except (wave.Error, EOFError):
+                pass
+        return from_segment(AudioSegment.from_file(str(path)))
+    if isinstance(sample, AudioSegment):
+        return from_segment(sample)
+    raise TypeError(f"Sample must be AudioSegment or file path, got {type(sample)}")
+
+
+def resample(samples, src_rate, dst_rate):
+    """Linear-interpolation resample of a (frames, channels) array."""
+    if src_rate == dst_rate or len(samples) == 0:
+        return samples
+    n_out = int(round(len(samples) * dst_rate / src_rate))
+    pos = np.arange(n_out, dtype=np.float64) * (src_rate / dst_rate)
+    idx = np.minimum(pos.astype(np.int64), len(samples) - 1)
+    nxt = np.minimum(idx + 1, len(samples) - 1)
+    frac = (pos - idx).astype(np.float32)[:, None]
+    return samples[idx] * (1.0 - frac) + samples[nxt] * frac
+
+
+def apply_fades(samples, fade_frames, fade_out=True):
+    """Linear fade-in (and optionally fade-out) over `fade_frames` frames."""
+    n = min(fade_frames, len(samples))
+    if n <= 0:
+        return samples
+    out = np.array(samples, dtype=np.float32, copy=True)
+    ramp = np.linspace(0.0, 1.0, n, endpoint=False, dtype=np.float32)[:, None]
+    out[:n] *= ramp
+    if fade_out:
+        out[-n:] *= ramp[::-1]
+    return out
+
+
+def set_channels(samples, channels):
+    """Mono → N by duplication, N → mono by averaging (as pydub does)."""
+    if samples.shape[1] == channels:
+        return samples
+    if channels == 1:
+        return samples.mean(axis=1, keepdims=True)
+    if samples.shape[1] == 1:
+        return np.repeat(samples, channels, axis=1)
+    raise ValueError(f"Cannot convert {samples.shape[1]} channels to {channels}")
+
+
+class NumpySlices:
+    """ChainBuilder backend: prepare each sample as a float32 array.
+
+    `prepare()` returns `(array, sample_width)` with the array resampled,
+    truncated to the slice, faded and quantised to `sample_width` — the
+    source width, at least 16-bit like the chain. Quantising once here
+    makes `dump()`/`load()` lossless, so a SampleCache hit writes the same
+    chain bytes as a miss. Padding happens when the slice is written into
+    the chain.
+    """
+
+    def __init__(self, frame_rate, frames_per_slice, fade_ms):
+        self.frame_rate = frame_rate
+        self.frames_per_slice = frames_per_slice
+        self.fade_ms = fade_ms
+
+    def prepare(self, sample):
+        samples, frame_rate, sample_width = load_audio(sample)
+        samples = resample(samples, frame_rate, self.frame_rate)
+        fills_slice = len(samples) >= self.frames_per_slice
+        samples = samples[:self.frames_per_slice]
+        fade_frames = int(self.fade_ms * self.frame_rate / 1000)
+        samples = apply_fades(samples, fade_frames, fade_out=fills_slice)
+        sample_width = max(2, sample_width)
+        samples = _pcm_to_float(to_pcm(samples, sample_width), sample_width, samples.shape[1])
+        return samples, sample_width
+
+    @staticmethod
+    def format(prepared):
+        samples, sample_width = prepared
+        return samples.shape[1], sample_width
+
+    def pcm(self, prepared, channels, sample_width):
+        samples, _ = prepared
+        return to_pcm(set_channels(samples, channels), sample_width)
+
+    def dump(self, prepared):
+        """(raw_pcm, channels, sample_width) of a prepared slice, for caching."""
+        samples, sample_width = prepared
+        return to_pcm(samples, sample_width), samples.shape[1], sample_width
+
+    def load(self, raw_pcm, channels, sample_width):
+        return _pcm_to_float(raw_pcm, sample_width, channels), sample_width
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Onset Slicer - place slice points on the transients of a long sample.
+
+A spectral-flux onset detector: the WAV is read in blocks, mixed to mono
+and run through a Hann-windowed STFT one block of frames at a time, so
+only the per-frame flux envelope (1/hop of the audio) is kept — an
+hour-long recording never has to fit in memory. Peaks of the flux that
+rise above a moving-average threshold, and are at least `min_gap_ms`
+apart, become slice points, which are written with `WAVSlicer`'s cue
+chunk writers::
+
+    slicer = OnsetSlicer(min_gap_ms=60)
+    points = slicer.detect("break.wav")
+    slicer.slice_file("break.wav", "break-sliced.wav")   # or in place
+
+Requires numpy (`pip install pym8[numpy]`).
+"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from m8.tools.numpy_audio import _pcm_to_float
+from m8.tools.wav_slicer import WAVSlicer
+
+MAX_SLICES = 128  # M8 limit, as in ChainBuilder
+
+
+def _frames(buffer, frame_size, hop):
+    """(n, frame_size) strided view of the complete frames in `buffer`."""
+    n = 1 + (len(buffer) - frame_size) // hop
+    stride = buffer.strides[0]
+    return as_strided(buffer, shape=(n, frame_size), strides=(hop * stride, stride), writeable=False)
+
+
+def _moving_mean(x, radius):
+    """Centred moving average over 2*radius+1 frames (edges use fewer)."""
+    c = np.concatenate([[0.0], np.cumsum(x, dtype=np.float64)])
+    idx = np.arange(len(x))
+    lo = np.maximum(idx - radius, 0)
+    hi = np.minimum(idx + radius + 1, len(x))
+    return (c[hi] - c[lo]) / (hi - lo)
+
+
+def _local_max(x, radius):
+    """True where x is the maximum of its ±radius neighbourhood."""
+    padded = np.concatenate([np.full(radius, -np.inf), x, np.full(radius, -np.inf)])
+    windows = _frames(padded, 2 * radius + 1, 1)
+    return x >= windows.max(axis=1)
+
+
+class OnsetSlicer:
+    """Spectral-flux onset detector that writes M8 slice points.
+
+    Args:
+        frame_size: STFT window in samples
+        hop: STFT hop in samples (detection resolution)
+        delta: Threshold above the local mean flux, on flux normalised to
+               [0, 1]; raise it for fewer, stronger onsets
+        window_ms: Half-width of the moving-average threshold
+        min_gap_ms: Minimum distance between slice points
+        max_slices: Keep at most this many (the strongest) slice points
+        include_start: Always put a slice at sample 0
+        refine: Re-read a frame around each onset and move the point to the
+                sharpest short-term energy rise (STFT frames alone place
+                onsets up to half a window early)
+        block_frames: Frames read from the file per block
+    """
+
+    REFINE_CHUNK = 64
+
+    def __init__(self, frame_size=2048, hop=512, delta=0.07, window_ms=100,
+                 min_gap_ms=50, max_slices=MAX_SLICES, include_start=True,
+                 refine=True, block_frames=1 << 16):
+        if hop <= 0 or frame_size < hop:
+            raise ValueError("Need 0 < hop <= frame_size")
+        if max_slices < 1:
+            raise ValueError(f"max_slices must be >= 1, got {max_slices}")
+        self.frame_size = frame_size
+        self.hop = hop
+        self.delta = delta
+        self.window_ms = window_ms
+        self.min_gap_ms = min_gap_ms
+        self.max_slices = max_slices
+        self.include_start = include_start
+        self.refine = refine
+        self.block_frames = block_frames
+        self.wav_slicer = WAVSlicer()
+        self._window = np.hanning(frame_size).astype(np.float32)
+
+    def _blocks(self, w):
+        channels = w.getnchannels()
+        sample_width = w.getsampwidth()
+        while True:
+            raw = w.readframes(self.block_frames)
+            if not raw:
+                return
+            yield _pcm_to_float(raw, sample_width, channels).mean(axis=1)
+
+    def _spectra(self, frames):
+        return np.log1p(100.0 * np.abs(np.fft.rfft(frames * self._window, axis=1)))
+
+    def onset_envelope(self, source):
+        """Spectral flux per hop, streaming the file in blocks.
+
+        Frames are centred (the signal is padded by frame_size/2 on both
+        sides), so envelope index i corresponds to sample i * hop.
+
+        Returns:
+            tuple: (float32 flux array, frame_rate)
+        """
+        half = self.frame_size // 2
+        with wave.open(str(source) if isinstance(source, Path) else source, 'rb') as w:
+            frame_rate = w.getframerate()
+            total = w.getnframes()
+            n_out = total // self.hop + 1
+            flux = []
+            prev = None
+            buffer = np.zeros(half, dtype=np.float32)
+            for block in self._blocks(w):
+                buffer = np.concatenate([buffer, block])
+                if len(buffer) < self.frame_size:
+                    continue
+                frames = _frames(buffer, self.frame_size, self.hop)
+                spec = self._spectra(frames)
+                flux.append(self._flux(spec, prev))
+                prev = spec[-1]
+                buffer = buffer[len(frames) * self.hop:]
+            # Flush: pad the tail so the last centred frames are complete
+            buffer = np.concatenate([buffer, np.zeros(half + self.hop, dtype=np.float32)])
+            if len(buffer) >= self.frame_size:
+                spec = self._spectra(_frames(buffer, self.frame_size, self.hop))
+                flux.append(self._flux(spec, prev))
+        envelope = np.concatenate(flux) if flux else np.zeros(0, dtype=np.float32)
+        return envelope[:n_out].astype(np.float32), frame_rate
+
+    @staticmethod
+    def _flux(spec, prev):
+        if prev is None:
+            prev = spec[0]
+        diff = np.diff(np.vstack([prev[None, :], spec]), axis=0)
+        return np.maximum(diff, 0.0).sum(axis=1)
+
+    def pick_peaks(self, envelope, frame_rate):
+        """Slice points (in samples) from an onset envelope."""
+        if len(envelope) == 0:
+            return [0] if self.include_start else []
+        peak = envelope.max()
+        norm = envelope / peak if peak > 0 else envelope
+        frames_per_ms = frame_rate / (1000.0 * self.hop)
+        radius = max(1, int(round(self.window_ms * frames_per_ms)))
+        gap = max(1, int(round(self.min_gap_ms * frames_per_ms)))
+
+        onset = (norm >= _moving_mean(norm, radius) + self.delta) & _local_max(norm, min(radius, gap))
+        candidates = np.flatnonzero(onset)
+
+        # Enforce the minimum gap, keeping the earlier onset
+        kept = []
+        last = -gap
+        if self.include_start:
+            kept.append(0)
+            last = 0
+        for idx in candidates:
+            if idx - last >= gap:
+                kept.append(int(idx))
+                last = idx
+
+        if len(kept) > self.max_slices:
+            start = kept[:1] if self.include_start else []
+            rest = kept[len(start):]
+            strongest = sorted(rest, key=lambda i: norm[i], reverse=True)
+            kept = start + sorted(strongest[:self.max_slices - len(start)])
+        return [i * self.hop for i in kept]
+
+    def detect(self, source):
+        """Detect onsets in a WAV (path or binary file object).
+
+        Returns:
+            list: Slice points in samples, ascending
+        """
+        envelope, frame_rate = self.onset_envelope(source)
+        points = self.pick_peaks(envelope, frame_rate)
+        if self.refine:
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            points = self.refine_points(source, points)
+        return points
+
+    def refine_points(self, source, points):
+        """Snap each onset to the largest rise in short-term energy.
+
+        Only `frame_size` frames around each point are read (by seeking),
+        so this stays cheap on long files. A slice at sample 0 is kept.
+        """
+        chunk = self.REFINE_CHUNK
+        half = self.frame_size // 2
+        refined = []
+        with wave.open(str(source) if isinstance(source, Path) else source, 'rb') as w:
+            channels, sample_width = w.getnchannels(), w.getsampwidth()
+            total = w.getnframes()
+            for p in points:
+                lo = max(0, p - half)
+                hi = min(total, p + half)
+                if p == 0 or hi - lo < 2 * chunk:
+                    refined.append(p)
+                    continue
+                w.setpos(lo)
+                mono = _pcm_to_float(w.readframes(hi - lo), sample_width, channels).mean(axis=1)
+                n = len(mono) // chunk
+                energy = np.square(mono[:n * chunk]).reshape(n, chunk).sum(axis=1)
+                rise = np.diff(energy, prepend=0.0)
+                refined.append(lo + int(np.argmax(rise)) * chunk)
+        return sorted(set(refined))
+
+    def slice_file(self, source, output=None):
+        """Detect onsets in `source` and write them as M8 slice points.
+
+        Args:
+            source: Path to a PCM WAV file
+            output: Destination path; None updates `source` in place
+
+        Returns:
+            list: The slice points written
+        """
+        points = self.detect(Path(source))
+        if output is None:
+            self.wav_slicer.update_slice_points(source, points)
+        else:
+            with open(source, 'rb') as src, open(output, 'wb') as dst:
+                self.wav_slicer.write_sliced(src, dst, points)
+        return points
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Preset Bank - thousands of instrument presets in one memory-mapped file.
+
+A YAML preset costs a file open and a full YAML parse; a bank stores each
+preset as its raw 215-byte instrument block behind a fixed-size index, so
+opening a 10k-preset bank reads only its header and every lookup is a binary
+search over the mapped index::
+
+    write_bank("drums.m8bank", presets, tags={"KICK 01": ["kick", "808"]})
+
+    with PresetBank("drums.m8bank") as bank:
+        kick = bank.instrument("KICK 01")          # parsed on demand
+        for key in bank.with_tag("808"):
+            ...
+
+File layout (little-endian)::
+
+    header   MAGIC, format version, preset count, strings offset,
+             blocks offset
+    index    count × (key[32], type id, 0, firmware version[4],
+             tags length, tags offset), sorted by key
+    strings  comma-joined UTF-8 tags
+    blocks   count × 215-byte instrument blocks, in index order
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from m8.api.instrument import BLOCK_SIZE, M8Instrument
+from m8.api.version import M8Version
+
+MAGIC = b"PYM8BANK"
+FORMAT_VERSION = 2
+KEY_SIZE = 32
+TAG_SEPARATOR = ","
+BANK_SUFFIX = ".m8bank"
+
+HEADER = struct.Struct("<8sH2xIII")
+RECORD = struct.Struct(f"<{KEY_SIZE}sBx4sHI")
+TYPE_FIELD_OFFSET = KEY_SIZE
+
+
+def _encode_key(key):
+    raw = key.encode("utf-8")
+    if not raw or len(raw) > KEY_SIZE or b"\x00" in raw:
+        raise ValueError(f"Preset key {key!r} must be 1-{KEY_SIZE} UTF-8 bytes without NULs")
+    return raw
+
+
+def write_bank(path, presets, tags=None, version=None):
+    """Pack instruments into a bank file (written atomically).
+
+    Args:
+        path: Bank file to create or replace
+        presets: {key: M8Instrument} (or iterable of (key, instrument))
+        tags: Optional {key: iterable of tag strings}
+        version: Firmware version stored for every block; defaults to
+                 each instrument's own
+
+    Returns:
+        int: Number of presets written
+
+    Raises:
+        ValueError: on duplicate, empty or over-long keys, or tags
+                    containing the separator
+    """
+    items = presets.items() if hasattr(presets, "items") else presets
+    entries = sorted(((_encode_key(key), key, instrument) for key, instrument in items),
+                     key=lambda entry: entry[0])
+    for (a, _, _), (b, key, _) in zip(entries, entries[1:]):
+        if a == b:
+            raise ValueError(f"Duplicate preset key {key!r}")
+    tags = tags or {}
+
+    strings = bytearray()
+    index = bytearray(RECORD.size * len(entries))
+    blocks = bytearray()
+    for i, (raw_key, key, instrument) in enumerate(entries):
+        preset_tags = list(tags.get(key, ()))
+        if any(TAG_SEPARATOR in tag for tag in preset_tags):
+            raise ValueError(f"Tags of {key!r} may not contain {TAG_SEPARATOR!r}")
+        tag_bytes = TAG_SEPARATOR.join(preset_tags).encode("utf-8")
+        block_version = version if version is not None else instrument.version
+        RECORD.pack_into(index, i * RECORD.size, raw_key, instrument.type_id,
+                         block_version.write(), len(tag_bytes), len(strings))
+        strings += tag_bytes
+        block = bytes(instrument.write())
+        blocks += block[:BLOCK_SIZE].ljust(BLOCK_SIZE, b"\x00")
+
+    strings_offset = HEADER.size + len(index)
+    blocks_offset = strings_offset + len(strings)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), strings_offset, blocks_offset)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(index)
+            f.write(strings)
+            f.write(blocks)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return len(entries)
+
+
+class PresetBank:
+    """Read-only, memory-mapped view of a bank file.
+
+    Nothing but the header is read up front; instruments are parsed from
+    their blocks on each `instrument()` call, so callers get independent
+    copies.
+
+    Raises:
+        ValueError: if the file is not a bank of a supported format
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{self.path} is not a preset bank")
+        magic, fmt, count, strings, blocks = HEADER.unpack_from(self._map)
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} preset bank")
+        self._count = count
+        self._strings = strings
+        self._blocks = blocks
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _record(self, i):
+        return RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+
+    def _key_at(self, i):
+        offset = HEADER.size + i * RECORD.size
+        return self._map[offset:offset + KEY_SIZE].rstrip(b"\x00")
+
+    def find(self, key):
+        """Index position of `key`, or -1 (binary search over the index)."""
+        raw = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < raw:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._count and self._key_at(lo) == raw else -1
+
+    def _position(self, key):
+        i = self.find(key)
+        if i < 0:
+            raise KeyError(key)
+        return i
+
+    def __contains__(self, key):
+        return self.find(key) >= 0
+
+    def keys(self):
+        """Preset keys in sorted order."""
+        return [self._key_at(i).decode("utf-8") for i in range(self._count)]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def type_id(self, key):
+        return self._record(self._position(key))[1]
+
+    def version(self, key):
+        """Firmware version the preset's block was written by."""
+        return M8Version.read(self._record(self._position(key))[2])
+
+    def tags(self, key):
+        _, _, _, length, offset = self._record(self._position(key))
+        if not length:
+            return []
+        start = self._strings + offset
+        return self._map[start:start + length].decode("utf-8").split(TAG_SEPARATOR)
+
+    def block(self, key):
+        """The raw 215-byte instrument block of `key`."""
+        start = self._blocks + self._position(key) * BLOCK_SIZE
+        return self._map[start:start + BLOCK_SIZE]
+
+    def instrument(self, key):
+        """A freshly parsed M8Instrument for `key`.
+
+        Raises:
+            KeyError: if the bank has no preset `key`
+        """
+        return M8Instrument.read(self.block(key), version=self.version(key))
+
+    def of_type(self, type_id):
+        """Keys of presets of one instrument type (M8InstrumentType or int)."""
+        column = self._map[HEADER.size + TYPE_FIELD_OFFSET:self._strings:RECORD.size]
+        type_id = int(type_id)
+        return [self._key_at(i).decode("utf-8")
+                for i, value in enumerate(column) if value == type_id]
+
+    def with_tag(self, tag):
+        """Keys of presets carrying `tag`."""
+        found = []
+        for i in range(self._count):
+            raw_key, _, _, length, offset = self._record(i)
+            if not length:
+                continue
+            start = self._strings + offset
+            if tag in self._map[start:start + length].decode("utf-8").split(TAG_SEPARATOR):
+                found.append(raw_key.rstrip(b"\x00").decode("utf-8"))
+        return found
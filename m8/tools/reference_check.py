@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Reference Check - find dangling and cross-type references in projects.
+
+Where `project.validate()` only checks that reference bytes are in range,
+this checks what they point at. Starting from the song (via
+`remapper.walk_song`, so only playable content is inspected) it flags:
+
+    empty-chain       song cell → chain with no phrases
+    empty-phrase      chain step → phrase with no notes, instruments or FX
+    empty-instrument  phrase step instrument, or INS/NXT FX → empty slot
+    default-table     TBL/TBX FX → table with no content
+    default-eq        EQM/EQI FX → EQ still at the firmware defaults
+    fx-type           instrument-specific FX key the playing instrument's
+                      type does not define
+
+Instrument FX bytes (0x80 and up) are shared between types — the M8
+reads them by the type of the instrument playing — so a phrase step's FX
+are checked against the step's instrument, or the last instrument set
+earlier in the phrase, and table N's against instrument N. Steps with no
+known instrument are skipped, as are MIDI out and external instruments::
+
+    for issue in check_references(project):
+        print(issue)
+
+    report = check_library(Path("Songs").rglob("*.m8s"), workers=8)
+    print(report.summary())
+
+Libraries are checked in a process pool when `workers` > 1 (parsing is
+CPU-bound).
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from m8.api.fx import (
+    M8FMSynthFX, M8HypersynthFX, M8MacrosynthFX, M8ModulatorFX, M8SamplerFX,
+    M8WavsynthFX,
+)
+from m8.api.instrument import M8InstrumentType
+from m8.api.project import M8Project
+from m8.api.remapper import (
+    EMPTY_CHAIN, EMPTY_INSTRUMENT_REF, EMPTY_PHRASE, EQ_REF_FX_KEYS,
+    INSTRUMENT_REF_FX_KEYS, N_EQS, N_INSTRUMENTS, N_TABLES, TABLE_REF_FX_KEYS,
+    _chain_occupied, _eq_occupied, _instrument_occupied, _phrase_occupied,
+    _table_occupied, walk_song,
+)
+from m8.api.song import COL_COUNT
+from m8.api.sparse import peek
+
+EMPTY_KEY = 0xFF
+INSTRUMENT_FX_START = 0x80
+
+EMPTY_CHAIN_REF = "empty-chain"
+EMPTY_PHRASE_REF = "empty-phrase"
+EMPTY_INSTRUMENT_REF_KIND = "empty-instrument"
+DEFAULT_TABLE_REF = "default-table"
+DEFAULT_EQ_REF = "default-eq"
+FX_TYPE = "fx-type"
+
+KINDS = (EMPTY_CHAIN_REF, EMPTY_PHRASE_REF, EMPTY_INSTRUMENT_REF_KIND,
+         DEFAULT_TABLE_REF, DEFAULT_EQ_REF, FX_TYPE)
+
+# Instrument-specific FX keys each type defines (modulator FX apply to all)
+INSTRUMENT_FX_KEYS = {
+    int(kind): frozenset(int(k) for k in fx) | frozenset(int(k) for k in M8ModulatorFX)
+    for kind, fx in (
+        (M8InstrumentType.WAVSYNTH, M8WavsynthFX),
+        (M8InstrumentType.MACROSYNTH, M8MacrosynthFX),
+        (M8InstrumentType.SAMPLER, M8SamplerFX),
+        (M8InstrumentType.FMSYNTH, M8FMSynthFX),
+        (M8InstrumentType.HYPERSYNTH, M8HypersynthFX),
+    )
+}
+
+
+@dataclass(frozen=True)
+class Issue:
+    """One suspicious reference."""
+
+    kind: str                 # one of KINDS
+    location: str             # e.g. "phrase 4 step 2 fx1"
+    target: Optional[int]     # referenced slot (None for fx-type)
+    message: str
+
+    def __str__(self):
+        return f"{self.location}: {self.message}"
+
+
+class _Checker:
+    """One pass over a project, with per-slot occupancy memoised."""
+
+    def __init__(self, project):
+        self.project = project
+        self.issues = []
+        self._occupied = {}
+
+    def occupied(self, predicate, index):
+        key = (predicate, index)
+        if key not in self._occupied:
+            self._occupied[key] = predicate(self.project, index)
+        return self._occupied[key]
+
+    def add(self, kind, location, target, message):
+        self.issues.append(Issue(kind, location, target, message))
+
+    def instrument_type(self, index):
+        if index is None or not self.occupied(_instrument_occupied, index):
+            return None
+        return peek(self.project.instruments, index).type_id
+
+    def check_instrument_ref(self, index, location):
+        if 0 <= index < N_INSTRUMENTS and not self.occupied(_instrument_occupied, index):
+            self.add(EMPTY_INSTRUMENT_REF_KIND, location, index,
+                     f"uses empty instrument slot {index}")
+
+    def check_fx(self, fx, location, instrument):
+        allowed = INSTRUMENT_FX_KEYS.get(self.instrument_type(instrument))
+        for j, tup in enumerate(fx):
+            key, value = tup.key, tup.value
+            where = f"{location} fx{j + 1}"
+            if key in INSTRUMENT_REF_FX_KEYS:
+                self.check_instrument_ref(value, where)
+            elif key in TABLE_REF_FX_KEYS:
+                if 0 <= value < N_TABLES and not self.occupied(_table_occupied, value):
+                    self.add(DEFAULT_TABLE_REF, where, value,
+                             f"FX {key:#04x} points at empty table {value}")
+            elif key in EQ_REF_FX_KEYS:
+                if 0 <= value < N_EQS and not self.occupied(_eq_occupied, value):
+                    self.add(DEFAULT_EQ_REF, where, value,
+                             f"FX {key:#04x} points at default EQ {value}")
+            elif (allowed is not None and key >= INSTRUMENT_FX_START
+                  and key != EMPTY_KEY and key not in allowed):
+                kind = M8InstrumentType(self.instrument_type(instrument)).name.lower()
+                self.add(FX_TYPE, where, None,
+                         f"FX {key:#04x} is not defined for {kind} instrument {instrument}")
+
+    def run(self):
+        project = self.project
+        reachable = walk_song(project)
+
+        for r, row in enumerate(project.song):
+            for c in range(COL_COUNT):
+                chain = row[c]
+                if chain != EMPTY_CHAIN and not self.occupied(_chain_occupied, chain):
+                    self.add(EMPTY_CHAIN_REF, f"song row {r} col {c}", chain,
+                             f"points at empty chain {chain}")
+
+        for index in sorted(reachable.chains):
+            for s, step in enumerate(peek(project.chains, index)):
+                phrase = step.phrase
+                if phrase != EMPTY_PHRASE and not self.occupied(_phrase_occupied, phrase):
+                    self.add(EMPTY_PHRASE_REF, f"chain {index} step {s}", phrase,
+                             f"points at empty phrase {phrase}")
+
+        for index in sorted(reachable.phrases):
+            current = None
+            for s, step in enumerate(peek(project.phrases, index)):
+                location = f"phrase {index} step {s}"
+                if step.instrument != EMPTY_INSTRUMENT_REF:
+                    self.check_instrument_ref(step.instrument, location)
+                    current = step.instrument
+                self.check_fx(step.fx, location, current)
+
+        for index in sorted(reachable.tables):
+            owner = index if index < N_INSTRUMENTS else None
+            for s, step in enumerate(peek(project.tables, index)):
+                self.check_fx(step.fx, f"table {index} step {s}", owner)
+
+        return self.issues
+
+
+def check_references(project):
+    """Dangling and cross-type references reachable from the song.
+
+    Returns:
+        list of Issue, in song → chains → phrases → tables order
+    """
+    return _Checker(project).run()
+
+
+def check_file(path):
+    """(path, issues) for one .m8s file; issues is the error text instead
+    if the file can't be read."""
+    try:
+        return path, check_references(M8Project.read_from_file(str(path)))
+    except (OSError, ValueError, IndexError) as e:
+        return path, f"{type(e).__name__}: {e}"
+
+
+@dataclass
+class LibraryReport:
+    """Outcome of `check_library()`."""
+
+    issues: dict = field(default_factory=dict)     # path -> list of Issue
+    errors: dict = field(default_factory=dict)     # path -> error text
+
+    @property
+    def checked(self):
+        return len(self.issues) + len(self.errors)
+
+    def counts(self):
+        """Counter of issue kind → number of issues."""
+        return Counter(issue.kind for found in self.issues.values() for issue in found)
+
+    def projects_with(self, kind):
+        """Paths with at least one issue of `kind`."""
+        return [path for path, found in self.issues.items()
+                if any(issue.kind == kind for issue in found)]
+
+    def summary(self):
+        flagged = sum(1 for found in self.issues.values() if found)
+        lines = [f"{self.checked} projects checked, {flagged} with issues, "
+                 f"{len(self.errors)} unreadable"]
+        counts = self.counts()
+        for kind in KINDS:
+            if counts[kind]:
+                lines.append(f"  {kind:<17} {counts[kind]:>6} "
+                             f"(in {len(self.projects_with(kind))} projects)")
+        return "\n".join(lines)
+
+
+def check_library(paths, workers=None):
+    """Check many .m8s files (process pool if `workers` > 1).
+
+    Returns:
+        LibraryReport, with paths in input order
+    """
+    paths = [Path(p) for p in paths]
+    if workers and workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(paths) // (workers * 4))
+            results = list(pool.map(check_file, paths, chunksize=chunksize))
+    else:
+        results = [check_file(p) for p in paths]
+
+    report = LibraryReport()
+    for path, found in results:
+        if isinstance(found, str):
+            report.errors[path] = found
+        else:
+            report.issues[path] = found
+    return report
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Sample Bundle - collect the samples projects depend on into one place.
+
+Walks every `M8Sampler` in one or many projects, resolves its
+`sample_path` the way the M8 does — absolute paths ("/Samples/...")
+from the card root, relative ones from the project's
+`metadata.directory` — and copies (or hardlinks) each distinct file once
+into a bundle directory, optionally rewriting the instruments to point
+at the bundled copies::
+
+    result = bundle_samples(
+        ["Songs/live/set1.m8s", "Songs/live/set2.m8s"],
+        bundle_dir="/Volumes/M8/Samples/bundle",
+        card_root="/Volumes/M8",
+        sample_prefix="/Samples/bundle",
+    )
+    for path, project in zip(result.project_paths, result.projects):
+        project.write_to_file(path)
+
+Files are identified by content hash, so the same sample referenced under
+different paths is stored once; hashing and copying run on thread pools
+(both are IO-bound and release the GIL).
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import List, Optional
+
+from m8.api.instruments.sampler import SAMPLE_PATH_SIZE, M8Sampler
+from m8.api.project import M8Project
+from m8.tools.content_hash import file_sha256
+
+
+def resolve_sample_path(sample_path, base_dir=None, card_root=None):
+    """Local file for an M8Sampler.sample_path.
+
+    Absolute M8 paths ("/Samples/...") resolve under `card_root`; relative
+    ones (as the demos write them) under `base_dir`, the directory holding
+    the .m8s file. Returns None if the needed root is not given.
+    """
+    if sample_path.startswith('/'):
+        return Path(card_root) / sample_path.lstrip('/') if card_root is not None else None
+    return Path(base_dir) / sample_path if base_dir is not None else None
+
+
+def project_base_dir(project, card_root=None, project_path=None):
+    """Directory relative sample paths of `project` are resolved from.
+
+    On a card that is `card_root / metadata.directory`; without a card root
+    (or directory) it falls back to the folder the .m8s was read from.
+    """
+    directory = project.metadata.directory
+    if card_root is not None and directory:
+        return Path(card_root) / directory.lstrip('/')
+    if project_path is not None:
+        return Path(project_path).parent
+    return None
+
+
+@dataclass
+class SampleRef:
+    """One sampler instrument's reference to a sample file."""
+
+    project: int              # index into the collected projects
+    instrument: int
+    sample_path: str          # as stored in the instrument
+    source: Optional[Path]    # resolved local file (None if unresolvable)
+
+
+@dataclass
+class BundleResult:
+    """Outcome of `bundle_samples()`."""
+
+    projects: List[M8Project]
+    project_paths: List[Optional[Path]]
+    refs: List[SampleRef]
+    files: dict = field(default_factory=dict)      # sha256 -> bundled Path
+    rewritten: int = 0
+    missing: List[SampleRef] = field(default_factory=list)
+
+
+def _load(projects):
+    loaded, paths = [], []
+    for p in projects:
+        if isinstance(p, M8Project):
+            loaded.append(p)
+            paths.append(None)
+        else:
+            loaded.append(M8Project.read_from_file(str(p)))
+            paths.append(Path(p))
+    return loaded, paths
+
+
+def collect_sample_refs(projects, card_root=None, project_paths=None):
+    """Every sampler sample reference across `projects`.
+
+    Args:
+        projects: M8Project objects
+        card_root: Local mount of the M8 card
+        project_paths: Optional .m8s paths, parallel to `projects`
+
+    Returns:
+        list of SampleRef
+    """
+    refs = []
+    for pi, project in enumerate(projects):
+        path = project_paths[pi] if project_paths else None
+        base_dir = project_base_dir(project, card_root, path)
+        for ii, instrument in enumerate(project.instruments):
+            if isinstance(instrument, M8Sampler) and instrument.sample_path:
+                source = resolve_sample_path(instrument.sample_path, base_dir, card_root)
+                refs.append(SampleRef(pi, ii, instrument.sample_path, source))
+    return refs
+
+
+def _place(source, dest, link):
+    if dest.exists():
+        return dest
+    if link:
+        try:
+            os.link(source, dest)
+            return dest
+        except OSError:
+            pass  # cross-device or unsupported: fall back to a copy
+    tmp = dest.with_name(dest.name + '.part')
+    shutil.copy2(source, tmp)
+    os.replace(tmp, dest)
+    return dest
+
+
+def bundle_samples(projects, bundle_dir, card_root=None, sample_prefix=None,
+                   link=False, workers=8):
+    """Copy every sample the projects use into `bundle_dir`, once each.
+
+    Args:
+        projects: M8Project objects and/or paths to .m8s files
+        bundle_dir: Destination directory (created if missing)
+        card_root: Local mount of the M8 card, for resolving sample paths
+        sample_prefix: If given, rewrite each instrument's sample_path to
+                       `sample_prefix/<bundled name>` — the bundle's path as
+                       the M8 will see it (e.g. "/Samples/bundle")
+        link: Hardlink instead of copying where the filesystem allows
+        workers: Thread pool size for hashing and copying
+
+    Returns:
+        BundleResult; projects are modified in place but not written
+
+    Raises:
+        ValueError: if a rewritten sample path would not fit the
+                    instrument's 128-byte path field
+    """
+    projects, paths = _load(projects)
+    refs = collect_sample_refs(projects, card_root, paths)
+    result = BundleResult(projects=projects, project_paths=paths, refs=refs)
+
+    sources, seen = [], set()
+    for ref in refs:
+        if ref.source is None or not ref.source.is_file():
+            result.missing.append(ref)
+        elif ref.source not in seen:
+            seen.add(ref.source)
+            sources.append(ref.source)
+
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        hashes = dict(zip(sources, pool.map(file_sha256, sources)))
+
+        # One name per distinct content: keep the file name unless another
+        # file (in this run or already in the bundle) claimed it, then
+        # disambiguate with the hash
+        names, first_source, taken = {}, {}, {}
+        for source in sources:
+            sha = hashes[source]
+            if sha in names:
+                continue
+            name = source.name
+            if name not in taken and (bundle_dir / name).is_file():
+                taken[name] = file_sha256(bundle_dir / name)
+            if taken.get(name, sha) != sha:
+                name = f"{source.stem}-{sha[:8]}{source.suffix}"
+            taken[name] = sha
+            names[sha] = name
+            first_source[sha] = source
+
+        new_paths = {}
+        if sample_prefix is not None:
+            prefix = PurePosixPath(sample_prefix)
+            for sha, name in names.items():
+                new_path = new_paths[sha] = str(prefix / name)
+                if len(new_path.encode('utf-8')) > SAMPLE_PATH_SIZE:
+                    raise ValueError(
+                        f"Sample path {new_path!r} exceeds {SAMPLE_PATH_SIZE} bytes"
+                    )
+
+        shas = list(names)
+        placed = pool.map(
+            lambda sha: _place(first_source[sha], bundle_dir / names[sha], link), shas
+        )
+        result.files = dict(zip(shas, placed))
+
+    if new_paths:
+        missing = {id(ref) for ref in result.missing}
+        for ref in refs:
+            if id(ref) in missing:
+                continue
+            new_path = new_paths[hashes[ref.source]]
+            instrument = projects[ref.project].instruments[ref.instrument]
+            if instrument.sample_path != new_path:
+                instrument.sample_path = new_path
+                result.rewritten += 1
+    return result
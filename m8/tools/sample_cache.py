@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Sample Cache - on-disk cache of preprocessed ChainBuilder slices.
+
+Every chain build resamples, truncates and fades the same one-shots again.
+`SampleCache` stores the processed PCM of each sample as a small WAV file,
+keyed by a hash of the source audio plus the processing parameters
+(frame_rate, slice_duration_ms, fade_ms, backend), so repeated builds skip
+decoding entirely::
+
+    cache = SampleCache("tmp/sample-cache", max_bytes=512 * 1024 * 1024)
+    builder = ChainBuilder(slice_duration_ms=250, cache=cache)
+
+The cache is bounded by total size and evicts least-recently-used entries
+(file mtime is bumped on every hit). Writes are atomic, so several builders
+can share one cache directory.
+"""
+
+import hashlib
+import os
+import tempfile
+import wave
+from pathlib import Path
+
+from m8.tools.content_hash import file_sha256, sample_sha256
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+ENTRY_SUFFIX = ".wav"
+
+
+class SampleCache:
+    """Size-bounded LRU cache of processed sample PCM.
+
+    Args:
+        root: Cache directory (created if missing)
+        max_bytes: Evict least-recently-used entries above this total size
+    """
+
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._digests = {}
+        self._total = None
+
+    # Keys
+
+    def source_digest(self, sample):
+        """SHA-256 of a sample's source audio.
+
+        File paths hash the file contents (memoised per path, size and
+        mtime); AudioSegments hash their PCM and format.
+        """
+        if isinstance(sample, (str, Path)):
+            path = Path(sample)
+            st = path.stat()
+            memo = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+            digest = self._digests.get(memo)
+            if digest is None:
+                digest = self._digests[memo] = file_sha256(path)
+            return digest
+        return sample_sha256(sample)
+
+    def key(self, sample, *params):
+        """Cache key for `sample` processed with `params`."""
+        h = hashlib.sha256(self.source_digest(sample).encode())
+        h.update(repr(params).encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return self.root / key[:2] / (key + ENTRY_SUFFIX)
+
+    # Entries
+
+    def get(self, key):
+        """Return (raw_pcm, frame_rate, channels, sample_width) or None."""
+        path = self._path(key)
+        try:
+            with wave.open(str(path), 'rb') as w:
+                entry = (
+                    w.readframes(w.getnframes()),
+                    w.getframerate(),
+                    w.getnchannels(),
+                    w.getsampwidth(),
+                )
+        except (FileNotFoundError, wave.Error, EOFError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key, raw_pcm, frame_rate, channels, sample_width):
+        """Store processed PCM under `key`, evicting old entries if needed."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f, wave.open(f, 'wb') as w:
+                w.setnchannels(channels)
+                w.setsampwidth(sample_width)
+                w.setframerate(frame_rate)
+                w.writeframes(raw_pcm)
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        if self._total is not None:
+            self._total += path.stat().st_size - old_size
+        if self.total_bytes() > self.max_bytes:
+            self.evict()
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    # Size management
+
+    def _entries(self):
+        return [p for p in self.root.glob('*/*' + ENTRY_SUFFIX) if p.is_file()]
+
+    def total_bytes(self):
+        """Total size of cached entries in bytes."""
+        if self._total is None:
+            self._total = sum(p.stat().st_size for p in self._entries())
+        return self._total
+
+    def evict(self, max_bytes=None):
+        """Delete least-recently-used entries until under `max_bytes`.
+
+        Returns:
+            int: Number of entries removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, p))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in entries:
+            if total <= limit:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._total = total
+        return removed
+
+    def clear(self):
+        """Remove every cached entry."""
+        return self.evict(max_bytes=0)
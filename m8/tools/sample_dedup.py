@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Sample Dedup - find the same one-shot under different names and formats.
+
+Each sample gets a 256-bit perceptual fingerprint: the audio is mixed to
+mono, resampled to 8 kHz, trimmed of leading silence and peak-normalised,
+then analysed in 33 windows of 32 ms (spread evenly over the first
+second) × 9 frequency bands. Bit (n, m) is the
+sign of the energy difference between bands m and m+1 in frame n minus
+the same difference in frame n-1 (the Haitsma–Kalker scheme), so gain,
+sample rate, bit depth and container don't change the hash; small
+encoding differences flip only a few bits.
+
+Two samples are duplicates when their fingerprints are within
+`max_distance` bits (Hamming) and their durations agree. Candidate pairs
+are found by bucketing on 16-bit blocks of the fingerprint (any pair
+within 15 bits shares at least one block exactly), so grouping stays
+near-linear for large kits::
+
+    unique, index_map = dedupe(paths, workers=8)
+    builder = ChainBuilder(slice_duration_ms=250, dedupe=True)
+
+    dedupe_project_samples(project, base_dir="tmp/demos/acid_909_sampler")
+
+Fingerprints are computed in a process pool when `workers` > 1.
+Requires numpy (`pip install pym8[numpy]`).
+"""
+
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from m8.tools.content_hash import sample_sha256
+from m8.tools.numpy_audio import load_audio, resample
+from m8.tools.sample_bundle import resolve_sample_path  # noqa: F401 (re-exported)
+
+FINGERPRINT_RATE = 8000
+FRAME_SIZE = 256                 # 32 ms at 8 kHz
+NUM_FRAMES = 33                  # → 32 frame differences
+MAX_SPAN = NUM_FRAMES * FRAME_SIZE
+NUM_BANDS = 9                    # → 8 band differences
+FINGERPRINT_BITS = (NUM_FRAMES - 1) * (NUM_BANDS - 1)
+BLOCK_BITS = 16
+SILENCE_THRESHOLD = 0.01         # of peak, for leading-silence trim
+ENERGY_FLOOR = 1e-6              # -60 dB below the loudest band
+DEFAULT_MAX_DISTANCE = 12
+DURATION_TOLERANCE = 0.05        # relative
+DURATION_SLACK = 0.02            # seconds
+
+# Log-spaced FFT bin edges from 31 Hz (bin 1) so kick fundamentals count
+_BAND_EDGES = np.round(
+    np.geomspace(1, FRAME_SIZE // 2 + 1, NUM_BANDS + 1)
+).astype(int)
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Perceptual hash of one sample."""
+
+    bits: int          # FINGERPRINT_BITS-bit integer
+    duration: float    # seconds, after trimming leading silence
+
+    def distance(self, other):
+        """Hamming distance in bits."""
+        return bin(self.bits ^ other.bits).count('1')
+
+
+def fingerprint_samples(samples, frame_rate):
+    """Fingerprint a float (frames, channels) array."""
+    mono = samples.mean(axis=1) if samples.ndim > 1 else samples
+    mono = resample(mono[:, None], frame_rate, FINGERPRINT_RATE)[:, 0]
+    peak = np.abs(mono).max() if len(mono) else 0.0
+    if peak > 0:
+        start = int(np.argmax(np.abs(mono) >= peak * SILENCE_THRESHOLD))
+        mono = mono[start:] / peak
+    duration = len(mono) / float(FINGERPRINT_RATE)
+
+    # 33 analysis windows spread evenly over the first ~1 s, so short
+    # one-shots use every frame rather than trailing silence
+    span = min(len(mono), MAX_SPAN)
+    if span < FRAME_SIZE:
+        mono = np.concatenate([mono, np.zeros(FRAME_SIZE - span, dtype=mono.dtype)])
+        span = FRAME_SIZE
+    starts = np.linspace(0, span - FRAME_SIZE, NUM_FRAMES).astype(int)
+    frames = mono[starts[:, None] + np.arange(FRAME_SIZE)] * np.hanning(FRAME_SIZE)
+    power = np.square(np.abs(np.fft.rfft(frames, axis=1)))
+    energy = np.add.reduceat(power, _BAND_EDGES[:-1], axis=1)[:, :NUM_BANDS]
+    # Floor near-silent bands so encoder noise can't flip their bits
+    energy = np.log(np.maximum(energy, energy.max() * ENERGY_FLOOR + 1e-12))
+
+    band_diff = energy[:, :-1] - energy[:, 1:]
+    bits = (band_diff[1:] - band_diff[:-1]) > 0
+    value = int.from_bytes(np.packbits(bits.reshape(-1)).tobytes(), 'big')
+    return Fingerprint(bits=value, duration=duration)
+
+
+def fingerprint(sample):
+    """Fingerprint a file path or AudioSegment."""
+    samples, frame_rate, _ = load_audio(sample)
+    return fingerprint_samples(samples, frame_rate)
+
+
+def _content_key(sample):
+    """Exact-content key: file hash for paths, PCM+format hash for segments."""
+    return sample_sha256(sample)
+
+
+def fingerprint_all(samples, workers=None):
+    """Fingerprints for `samples`, in order (process pool if `workers` > 1)."""
+    samples = list(samples)
+    if workers and workers > 1 and len(samples) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(samples) // (workers * 4))
+            return list(pool.map(fingerprint, samples, chunksize=chunksize))
+    return [fingerprint(s) for s in samples]
+
+
+def _durations_match(a, b):
+    return abs(a - b) <= max(DURATION_SLACK, DURATION_TOLERANCE * max(a, b))
+
+
+def group_fingerprints(prints, max_distance=DEFAULT_MAX_DISTANCE):
+    """Group indices of near-identical fingerprints.
+
+    Returns:
+        list: Lists of indices, each in ascending order; singletons included
+    """
+    if max_distance >= FINGERPRINT_BITS // BLOCK_BITS:
+        raise ValueError(
+            f"max_distance must be < {FINGERPRINT_BITS // BLOCK_BITS} "
+            f"for block bucketing, got {max_distance}"
+        )
+    parent = list(range(len(prints)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    mask = (1 << BLOCK_BITS) - 1
+    for block in range(FINGERPRINT_BITS // BLOCK_BITS):
+        buckets = defaultdict(list)
+        shift = block * BLOCK_BITS
+        for i, fp in enumerate(prints):
+            buckets[(fp.bits >> shift) & mask].append(i)
+        for members in buckets.values():
+            for a_pos, a in enumerate(members):
+                for b in members[a_pos + 1:]:
+                    ra, rb = find(a), find(b)
+                    if ra == rb:
+                        continue
+                    if (prints[a].distance(prints[b]) <= max_distance
+                            and _durations_match(prints[a].duration, prints[b].duration)):
+                        parent[max(ra, rb)] = min(ra, rb)
+
+    groups = defaultdict(list)
+    for i in range(len(prints)):
+        groups[find(i)].append(i)
+    return sorted(groups.values())
+
+
+def dedupe(samples, max_distance=DEFAULT_MAX_DISTANCE, workers=None):
+    """Drop perceptual duplicates, keeping the first occurrence of each sound.
+
+    Byte-identical inputs are collapsed before fingerprinting, so they are
+    decoded once.
+
+    Args:
+        samples: File paths and/or AudioSegments
+        max_distance: Hamming distance (bits of 256) treated as the same sound
+        workers: Fingerprint across a process pool of this size
+
+    Returns:
+        tuple: (unique samples in input order,
+                {original index: index into unique samples})
+    """
+    samples = list(samples)
+    first_by_content = {}
+    content_of = []
+    for i, sample in enumerate(samples):
+        key = _content_key(sample)
+        content_of.append(first_by_content.setdefault(key, i))
+
+    distinct = sorted(set(content_of))
+    prints = fingerprint_all([samples[i] for i in distinct], workers)
+    keeper = {}
+    for group in group_fingerprints(prints, max_distance):
+        for member in group:
+            keeper[distinct[member]] = distinct[group[0]]
+
+    kept = sorted(set(keeper.values()))
+    position = {orig: n for n, orig in enumerate(kept)}
+    unique = [samples[i] for i in kept]
+    index_map = {i: position[keeper[content_of[i]]] for i in range(len(samples))}
+    return unique, index_map
+
+
+def find_duplicates(samples, max_distance=DEFAULT_MAX_DISTANCE, workers=None):
+    """Groups (lists) of samples that are the same sound; only groups of 2+."""
+    samples = list(samples)
+    _, index_map = dedupe(samples, max_distance, workers)
+    groups = defaultdict(list)
+    for i, target in index_map.items():
+        groups[target].append(samples[i])
+    return [g for _, g in sorted(groups.items()) if len(g) > 1]
+
+
+def dedupe_project_samples(project, base_dir=None, card_root=None,
+                           max_distance=DEFAULT_MAX_DISTANCE, workers=None):
+    """Point samplers that reference the same sound at a single file.
+
+    Collects the sample_path of every M8Sampler instrument, fingerprints
+    the referenced files, and rewrites each duplicate's sample_path to the
+    first-seen path of its group, so only one copy needs to go on the SD
+    card. Missing or unresolvable files are left alone.
+
+    Returns:
+        dict: {instrument index: (old sample_path, new sample_path)} for
+        every rewritten instrument
+    """
+    from m8.api.instruments.sampler import M8Sampler
+
+    refs = []
+    for index, instrument in enumerate(project.instruments):
+        if not isinstance(instrument, M8Sampler) or not instrument.sample_path:
+            continue
+        local = resolve_sample_path(instrument.sample_path, base_dir, card_root)
+        if local is not None and local.is_file():
+            refs.append((index, instrument.sample_path, local))
+
+    # Several instruments may share a path already; fingerprint each file once
+    files = list(dict.fromkeys(local for _, _, local in refs))
+    file_pos = {local: i for i, local in enumerate(files)}
+    _, index_map = dedupe(files, max_distance, workers)
+    keeper_path = {}
+    for _, sample_path, local in refs:
+        keeper_path.setdefault(index_map[file_pos[local]], sample_path)
+
+    changes = {}
+    for index, sample_path, local in refs:
+        new_path = keeper_path[index_map[file_pos[local]]]
+        if new_path != sample_path:
+            project.instruments[index].sample_path = new_path
+            changes[index] = (sample_path, new_path)
+    return changes
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""WAV Cues - read and edit slice points of WAV files without loading audio.
+
+Slice points live in `cue ` chunks: a standard one (cue points referencing
+the 'data' chunk) and the M8-specific one written after the audio, whose
+points reference 'atad'. Everything here works by seeking through the RIFF
+chunk table and reading only chunk headers, the fmt chunk and the cue
+chunks — the data chunk is never read — so auditing a large library is
+bound by header IO::
+
+    info = read_cues("kit.wav")
+    print(info.frames, info.slice_points, info.consistent)
+
+    for path, info in scan_cues(Path("Samples").rglob("*.wav"), workers=16):
+        ...
+
+    rewrite_cues_in_place("kit.wav", [0, 4410, 8820])  # same slice count
+"""
+
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+CUE_HEADER_SIZE = 12     # 'cue ' + chunk size + number of cue points
+CUE_POINT_SIZE = 24
+
+STANDARD_CUE_ID = b'data'
+M8_CUE_ID = b'atad'
+
+_cue_structs = {}
+
+
+def cue_chunk_size(num_points):
+    """Total size of a cue chunk (header included) holding `num_points`."""
+    return CUE_HEADER_SIZE + CUE_POINT_SIZE * num_points
+
+
+def _cue_struct(num_points):
+    st = _cue_structs.get(num_points)
+    if st is None:
+        st = _cue_structs[num_points] = struct.Struct('<4sII' + 'II4sIII' * num_points)
+    return st
+
+
+def pack_cue_chunk(buffer, offset, slice_points, data_chunk_id=STANDARD_CUE_ID):
+    """Pack a complete cue chunk into `buffer` at `offset` in one call.
+
+    Returns:
+        int: Offset just past the chunk
+    """
+    n = len(slice_points)
+    values = [b'cue ', cue_chunk_size(n) - 8, n]
+    for i, position in enumerate(slice_points):
+        # id (from 1), position, chunk id, chunk start, block start, sample offset
+        values += (i + 1, position, data_chunk_id, 0, 0, position)
+    st = _cue_struct(n)
+    st.pack_into(buffer, offset, *values)
+    return offset + st.size
+
+
+def iter_chunks(f):
+    """Yield (chunk_id, offset, size) for each chunk of a RIFF/WAVE file.
+
+    Seeks past chunk bodies, so only the 8-byte chunk headers are read;
+    `offset` is the position of the chunk header. Stops at a truncated
+    chunk header.
+
+    Raises:
+        ValueError: if the file is not RIFF/WAVE
+    """
+    f.seek(0)
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file")
+    offset = 12
+    while True:
+        f.seek(offset)
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            return
+        chunk_id, size = struct.unpack('<4sI', chunk_header)
+        yield chunk_id, offset, size
+        offset += 8 + size + (size & 1)
+
+
+@dataclass
+class CueChunk:
+    """One `cue ` chunk: its file offset, referenced chunk id and points."""
+
+    offset: int
+    size: int
+    chunk_id: bytes           # b'data' (standard) or b'atad' (M8)
+    points: List[int]         # sample offsets, in cue order
+
+
+@dataclass
+class WAVCueInfo:
+    """Header-level view of a WAV file and its slice points."""
+
+    frame_rate: int = 0
+    channels: int = 0
+    sample_width: int = 0
+    data_offset: Optional[int] = None
+    data_size: int = 0
+    chunks: List[Tuple[bytes, int, int]] = field(default_factory=list)
+    cues: List[CueChunk] = field(default_factory=list)
+
+    @property
+    def frames(self):
+        block_align = self.channels * self.sample_width
+        return self.data_size // block_align if block_align else 0
+
+    @property
+    def standard_points(self):
+        """Points of the standard ('data') cue chunk, or None."""
+        return next((c.points for c in self.cues if c.chunk_id != M8_CUE_ID), None)
+
+    @property
+    def m8_points(self):
+        """Points of the M8 ('atad') cue chunk, or None."""
+        return next((c.points for c in self.cues if c.chunk_id == M8_CUE_ID), None)
+
+    @property
+    def slice_points(self):
+        """Slice points the M8 will use (atad first, then standard)."""
+        points = self.m8_points
+        if points is None:
+            points = self.standard_points
+        return list(points) if points is not None else []
+
+    @property
+    def consistent(self):
+        """True if all cue chunks agree and every point is inside the audio."""
+        sets = {tuple(c.points) for c in self.cues}
+        return len(sets) <= 1 and all(p < self.frames for p in self.slice_points)
+
+
+def _read_cue(f, offset, size):
+    f.seek(offset + 8)
+    body = f.read(size)
+    if len(body) < 4:
+        raise ValueError(f"Truncated cue chunk at offset {offset}")
+    count = struct.unpack_from('<I', body)[0]
+    count = min(count, (len(body) - 4) // CUE_POINT_SIZE)
+    chunk_id = STANDARD_CUE_ID
+    points = []
+    for i in range(count):
+        _, _, cid, _, _, sample_offset = struct.unpack_from('<II4sIII', body, 4 + i * CUE_POINT_SIZE)
+        if i == 0:
+            chunk_id = cid
+        points.append(sample_offset)
+    return CueChunk(offset=offset, size=size, chunk_id=chunk_id, points=points)
+
+
+def read_cues(source):
+    """Read the format, data extent and cue chunks of a WAV.
+
+    Args:
+        source: Path or seekable binary file object
+
+    Returns:
+        WAVCueInfo
+
+    Raises:
+        ValueError: if the file is not RIFF/WAVE
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            return read_cues(f)
+
+    info = WAVCueInfo()
+    for chunk_id, offset, size in iter_chunks(source):
+        info.chunks.append((chunk_id, offset, size))
+        if chunk_id == b'fmt ':
+            source.seek(offset + 8)
+            fmt = source.read(16)
+            if len(fmt) == 16:
+                _, info.channels, info.frame_rate, _, _, bits = struct.unpack('<HHIIHH', fmt)
+                info.sample_width = bits // 8
+        elif chunk_id == b'data':
+            info.data_offset = offset + 8
+            info.data_size = size
+        elif chunk_id == b'cue ':
+            info.cues.append(_read_cue(source, offset, size))
+    return info
+
+
+def scan_cues(paths, workers=8):
+    """Read cue info for many files concurrently (header IO only).
+
+    Yields:
+        (path, WAVCueInfo) in input order; unreadable files yield the
+        exception (ValueError/OSError) in place of the info.
+    """
+    def _read(path):
+        try:
+            return path, read_cues(path)
+        except (ValueError, OSError, struct.error) as e:
+            return path, e
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_read, paths)
+
+
+def rewrite_cues_in_place(path, slice_points):
+    """Overwrite every cue chunk of `path` with `slice_points` in place.
+
+    Only possible when each existing cue chunk already has room for
+    exactly `len(slice_points)` points; each chunk keeps its 'data' /
+    'atad' id. Nothing but the cue chunks is written.
+
+    Returns:
+        bool: True if rewritten, False if the file has no cue chunks or
+        the chunk size would change (nothing is written in that case)
+
+    Raises:
+        ValueError: if a point lies beyond the end of the audio
+    """
+    with open(path, 'r+b') as f:
+        info = read_cues(f)
+        n = len(slice_points)
+        if not info.cues or not n or any(c.size != cue_chunk_size(n) - 8 for c in info.cues):
+            return False
+        if info.frames and any(p >= info.frames for p in slice_points):
+            raise ValueError(f"Slice point beyond end of audio ({info.frames} frames)")
+        chunk = bytearray(cue_chunk_size(n))
+        for cue in info.cues:
+            pack_cue_chunk(chunk, 0, slice_points, cue.chunk_id)
+            f.seek(cue.offset)
+            f.write(chunk)
+    return True
@@ -1,8 +1,67 @@
 #!/usr/bin/env python3
 """WAV Slicer - Tool for adding slice point metadata to WAV files for M8 tracker."""
 
+import os
+import shutil
 import struct
-from io import BytesIO
+import tempfile
+from io import BytesIO, UnsupportedOperation
+from pathlib import Path
+
+from m8.tools.wav_cues import (  # noqa: F401 (re-exported)
+    CUE_HEADER_SIZE, CUE_POINT_SIZE, cue_chunk_size, iter_chunks, pack_cue_chunk,
+    rewrite_cues_in_place,
+)
+
+WAVE_FORMAT_PCM = 1
+FMT_CHUNK_SIZE = 16
+
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _copy_range(src, dst, offset, length):
+    """Copy `length` bytes at `offset` of `src` to the current position of `dst`.
+
+    Uses os.sendfile between real files, otherwise a reused readinto buffer.
+    """
+    sendfile = getattr(os, 'sendfile', None)
+    if sendfile is not None:
+        try:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+        except (AttributeError, OSError, UnsupportedOperation):
+            pass
+        else:
+            dst.flush()
+            pos = dst.tell()
+            os.lseek(dst_fd, pos, os.SEEK_SET)
+            sent = 0
+            try:
+                while sent < length:
+                    n = sendfile(dst_fd, src_fd, offset + sent, length - sent)
+                    if n == 0:
+                        break
+                    sent += n
+            except OSError:
+                if sent:
+                    raise
+            else:
+                dst.seek(pos + sent)
+                if sent == length:
+                    return
+                raise ValueError("Unexpected end of file while copying WAV data")
+            dst.seek(pos)
+
+    src.seek(offset)
+    buf = bytearray(min(COPY_BUFFER_SIZE, length) or 1)
+    view = memoryview(buf)
+    remaining = length
+    while remaining:
+        n = src.readinto(view[:min(len(buf), remaining)])
+        if not n:
+            raise ValueError("Unexpected end of file while copying WAV data")
+        dst.write(view[:n])
+        remaining -= n
 
 
 class WAVSlicer:
@@ -27,33 +86,9 @@ class WAVSlicer:
         Returns:
             Bytes containing the complete cue chunk
         """
-        # Chunk header
-        chunk_id = b'cue '
-
-        # Number of cue points
-        num_cues = len(slice_points)
-        cue_data = struct.pack('<I', num_cues)
-
-        # Add each cue point
-        for i, position in enumerate(slice_points):
-            cue_id = i + 1  # Start IDs from 1
-            data_chunk_id = b'data'
-            chunk_start = 0
-            block_start = 0
-            sample_offset = position
-
-            cue_data += struct.pack('<I', cue_id)
-            cue_data += struct.pack('<I', position)
-            cue_data += data_chunk_id
-            cue_data += struct.pack('<I', chunk_start)
-            cue_data += struct.pack('<I', block_start)
-            cue_data += struct.pack('<I', sample_offset)
-
-        # Calculate chunk size
-        chunk_size = len(cue_data)
-
-        # Return full chunk with header
-        return chunk_id + struct.pack('<I', chunk_size) + cue_data
+        chunk = bytearray(cue_chunk_size(len(slice_points)))
+        pack_cue_chunk(chunk, 0, slice_points, b'data')
+        return bytes(chunk)
 
     def create_m8_atad_cue_chunk(self, slice_points):
         """Create M8-specific cue chunk with 'atad' chunk ID.
@@ -66,39 +101,19 @@ class WAVSlicer:
         Returns:
             Bytes containing the complete M8-specific cue chunk
         """
-        # Chunk header
-        chunk_id = b'cue '
-
-        # Number of cue points
-        num_cues = len(slice_points)
-        cue_data = struct.pack('<I', num_cues)
-
-        # Add each cue point (M8-specific format uses 'atad' instead of 'data')
-        for i, position in enumerate(slice_points):
-            cue_id = i + 1
-            data_chunk_id = b'atad'  # M8-specific
-            chunk_start = 0
-            block_start = 0
-            sample_offset = position
-
-            cue_data += struct.pack('<I', cue_id)
-            cue_data += struct.pack('<I', position)
-            cue_data += data_chunk_id
-            cue_data += struct.pack('<I', chunk_start)
-            cue_data += struct.pack('<I', block_start)
-            cue_data += struct.pack('<I', sample_offset)
-
-        # Calculate chunk size
-        chunk_size = len(cue_data)
-
-        # Return full chunk with header
-        return chunk_id + struct.pack('<I', chunk_size) + cue_data
+        chunk = bytearray(cue_chunk_size(len(slice_points)))
+        pack_cue_chunk(chunk, 0, slice_points, b'atad')
+        return bytes(chunk)
 
     def add_slice_points(self, wav_data, slice_points):
         """Add slice point metadata to WAV file data.
 
+        The output is allocated once; the fmt/cue/data/atad layout is
+        assembled into it through a memoryview, with both cue chunks
+        packed in place.
+
         Args:
-            wav_data: Bytes object containing WAV file data
+            wav_data: Bytes-like object containing WAV file data
             slice_points: List of slice point positions (in samples)
 
         Returns:
@@ -108,32 +123,134 @@ class WAVSlicer:
             # No slice points to add, return original data
             return BytesIO(wav_data)
 
-        # Create standard cue chunk
-        standard_cue_chunk = self.create_standard_cue_chunk(slice_points)
-
-        # Find proper position to insert standard cue chunk (after fmt chunk)
-        fmt_pos = wav_data.find(b'fmt ')
-        if fmt_pos < 0:
-            raise ValueError("Could not find 'fmt ' chunk in WAV file")
-
-        # Get the size of the fmt chunk and calculate end position
-        fmt_chunk_size = struct.unpack('<I', wav_data[fmt_pos+4:fmt_pos+8])[0]
-        fmt_end = fmt_pos + 8 + fmt_chunk_size
-        # Handle padding byte for odd-sized chunks
-        if fmt_chunk_size % 2:
-            fmt_end += 1
+        src = memoryview(wav_data)
+        fmt_end = self._fmt_end(wav_data)
+        cue_size = cue_chunk_size(len(slice_points))
 
-        # Insert standard cue chunk after fmt chunk
-        new_data = wav_data[:fmt_end] + standard_cue_chunk + wav_data[fmt_end:]
-
-        # Create M8-specific atad cue chunk
-        m8_cue_chunk = self.create_m8_atad_cue_chunk(slice_points)
-
-        # Add M8-specific cue chunk at the end
-        new_data = new_data + m8_cue_chunk
+        out = bytearray(len(src) + 2 * cue_size)
+        view = memoryview(out)
+        view[:fmt_end] = src[:fmt_end]
+        pos = pack_cue_chunk(out, fmt_end, slice_points, b'data')
+        view[pos:pos + len(src) - fmt_end] = src[fmt_end:]
+        pack_cue_chunk(out, pos + len(src) - fmt_end, slice_points, b'atad')
 
         # Update the RIFF size
-        riff_size = len(new_data) - 8  # Total size minus RIFF header
-        new_data = new_data[:4] + struct.pack('<I', riff_size) + new_data[8:]
+        struct.pack_into('<I', out, 4, len(out) - 8)
+        return BytesIO(out)
+
+    @staticmethod
+    def _fmt_end(wav_data):
+        # Walk the chunk headers to the end of the fmt chunk, where the
+        # standard cue chunk is inserted
+        pos = 12
+        while pos + 8 <= len(wav_data):
+            chunk_id, size = struct.unpack_from('<4sI', wav_data, pos)
+            # Handle padding byte for odd-sized chunks
+            pos += 8 + size + (size & 1)
+            if chunk_id == b'fmt ':
+                return pos
+        raise ValueError("Could not find 'fmt ' chunk in WAV file")
+
+    def write_sliced(self, source, output, slice_points):
+        """Stream a WAV from `source` to `output` with new slice points.
+
+        Chunks are copied straight from file to file (os.sendfile where
+        available); existing cue chunks are dropped and replaced by a
+        standard cue chunk after fmt and the M8 atad cue chunk at the end.
+        Audio data never passes through Python buffers larger than 1 MB.
+
+        Args:
+            source: Seekable binary file object positioned anywhere
+            output: Binary file object to write to
+            slice_points: List of slice point positions (in samples)
+        """
+        chunks = [c for c in iter_chunks(source) if c[0] != b'cue ']
+        if not any(c[0] == b'fmt ' for c in chunks):
+            raise ValueError("Could not find 'fmt ' chunk in WAV file")
+        cue_size = cue_chunk_size(len(slice_points)) if slice_points else 0
+        body = sum(8 + size + (size & 1) for _, _, size in chunks)
+
+        header = bytearray(12)
+        struct.pack_into('<4sI4s', header, 0, b'RIFF', 4 + body + 2 * cue_size, b'WAVE')
+        output.write(header)
+        cue = bytearray(cue_size)
+        for chunk_id, offset, size in chunks:
+            _copy_range(source, output, offset, 8 + size + (size & 1))
+            if chunk_id == b'fmt ' and slice_points:
+                pack_cue_chunk(cue, 0, slice_points, b'data')
+                output.write(cue)
+        if slice_points:
+            pack_cue_chunk(cue, 0, slice_points, b'atad')
+            output.write(cue)
+
+    def update_slice_points(self, path, slice_points):
+        """Replace the slice points of a WAV file on disk.
+
+        When every existing cue chunk already holds `len(slice_points)`
+        points, the chunks are overwritten in place via
+        `wav_cues.rewrite_cues_in_place()` (no audio touched). Otherwise the file is rewritten via
+        `write_sliced()` into a temporary file that atomically replaces it.
+        """
+        path = Path(path)
+        if slice_points and rewrite_cues_in_place(path, slice_points):
+            return
+
+        with open(path, 'rb') as f:
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as out:
+                    self.write_sliced(f, out, slice_points)
+                shutil.copymode(path, tmp)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        os.replace(tmp, path)
+
+    def wav_prologue(self, data_size, frame_rate, channels, sample_width, slice_points):
+        """RIFF header, fmt chunk, standard cue chunk and data chunk header.
+
+        Everything that precedes the PCM bytes of a sliced WAV whose data
+        chunk will be `data_size` bytes. Pair with `wav_epilogue()`; the
+        RIFF size already accounts for both.
+        """
+        cue = self.create_standard_cue_chunk(slice_points) if slice_points else b''
+        trailer_size = len(self.wav_epilogue(data_size, slice_points))
+        riff_size = 4 + (8 + FMT_CHUNK_SIZE) + len(cue) + 8 + data_size + trailer_size
+
+        block_align = channels * sample_width
+        header = bytearray(12 + 8 + FMT_CHUNK_SIZE)
+        struct.pack_into('<4sI4s', header, 0, b'RIFF', riff_size, b'WAVE')
+        struct.pack_into(
+            '<4sIHHIIHH', header, 12,
+            b'fmt ', FMT_CHUNK_SIZE, WAVE_FORMAT_PCM, channels, frame_rate,
+            frame_rate * block_align, block_align, sample_width * 8,
+        )
+        return bytes(header) + cue + struct.pack('<4sI', b'data', data_size)
+
+    def wav_epilogue(self, data_size, slice_points):
+        """Pad byte for an odd-sized data chunk plus the M8 atad cue chunk."""
+        pad = b'\x00' if data_size % 2 else b''
+        atad = self.create_m8_atad_cue_chunk(slice_points) if slice_points else b''
+        return pad + atad
+
+    def build_wav(self, pcm_data, frame_rate, channels, sample_width, slice_points):
+        """Assemble a sliced WAV from raw PCM in a single preallocated buffer.
+
+        Produces the same chunk layout as exporting the PCM and running
+        `add_slice_points()` over it (fmt, cue, data, atad cue) without
+        the intermediate copies.
 
-        return BytesIO(new_data)
+        Returns:
+            BytesIO object containing the WAV file with slice metadata
+        """
+        data_size = len(pcm_data)
+        prologue = self.wav_prologue(data_size, frame_rate, channels, sample_width, slice_points)
+        epilogue = self.wav_epilogue(data_size, slice_points)
+
+        out = bytearray(len(prologue) + data_size + len(epilogue))
+        view = memoryview(out)
+        pos = len(prologue)
+        view[:pos] = prologue
+        view[pos:pos + data_size] = pcm_data
+        view[pos + data_size:] = epilogue
+        return BytesIO(out)
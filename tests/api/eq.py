@@ -12,7 +12,7 @@ import unittest
 
 from m8.api.eq import (
     EQ_BAND_BYTES, EQ_BYTES, EQ_COUNT,
-    M8Eq, M8EqBand, M8EqMode, M8EqType, M8Eqs,
+    M8Eq, M8EqBand, M8EqMode, M8EqType, M8Eqs, unpack_mode_byte,
 )
 from m8.api.instruments.wavsynth import M8Wavsynth
 from m8.api.instruments.hypersynth import M8HyperSynth
@@ -54,6 +54,15 @@ class TestM8EqBand(unittest.TestCase):
         self.assertEqual(band.eq_mode, int(M8EqMode.LEFT))
         self.assertEqual(band.eq_type, int(M8EqType.LOWCUT))
 
+    def test_to_dict_unpacks_like_properties(self):
+        band = M8EqBand(mode_byte=0x98 | int(M8EqType.BANDPASS))  # reserved bit 3 set
+        self.assertEqual(unpack_mode_byte(band.mode_byte), (band.eq_type, band.eq_mode))
+        d = band.to_dict()
+        self.assertEqual(d["eq_type"], M8EqType(band.eq_type).name)
+        self.assertEqual(d["eq_mode"], M8EqMode(band.eq_mode).name)
+        band.eq_mode = M8EqMode.MID
+        self.assertEqual(band.mode_byte & 0x08, 0x08)
+
     def test_frequency_combines_freq_high_low(self):
         band = M8EqBand()
         band.freq = 0x03
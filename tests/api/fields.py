@@ -2,7 +2,7 @@
 import unittest
 from enum import IntEnum
 
-from m8.api.fields import ByteField, BytesField, StringField, iter_fields
+from m8.api.fields import ByteField, BytesField, StringField, field_layout, iter_fields
 
 
 class Mode(IntEnum):
@@ -150,5 +150,100 @@ class TestIterFields(unittest.TestCase):
         self.assertEqual(len(names), len(set(names)))
 
 
+class TestFieldLayout(unittest.TestCase):
+    def test_cached_per_class(self):
+        class SubSample(Sample):
+            extra = ByteField(20)
+
+        self.assertIs(field_layout(Sample), field_layout(Sample))
+        self.assertIsNot(field_layout(SubSample), field_layout(Sample))
+        self.assertIn("extra", field_layout(SubSample).by_name)
+        self.assertNotIn("extra", field_layout(Sample).by_name)
+
+    def test_template_matches_applied_defaults(self):
+        class Sized(Sample):
+            BYTES = 64
+
+        layout = field_layout(Sized)
+        data = layout.new_data()
+        self.assertEqual(bytes(data), bytes(Sample()._data))
+        data[0] = 0
+        self.assertEqual(layout.template[0], 0xFF, "new_data must return a copy")
+
+    def test_blank_data_hook(self):
+        class Typed(Sample):
+            @classmethod
+            def _blank_data(cls):
+                data = bytearray(64)
+                data[63] = 0x42
+                return data
+
+        data = field_layout(Typed).new_data()
+        self.assertEqual(data[63], 0x42)
+        self.assertEqual(data[0], 0xFF)
+
+    def test_unpack_bytes(self):
+        s = Sample()
+        s.cutoff = 0x33
+        layout = field_layout(Sample)
+        values = layout.unpack_bytes(s._data)
+        self.assertEqual([n for n, _ in layout.byte_fields], ["cutoff", "mode", "bounded"])
+        self.assertEqual(values[layout.byte_index["cutoff"]], 0x33)
+        self.assertEqual(values[layout.byte_index["bounded"]], 15)
+
+
+class Interleaved:
+    """ByteFields with a string and an undeclared byte between them."""
+
+    BYTES = 16
+    first = ByteField(0, enum=Mode, default=Mode.A)
+    label = StringField(1, length=4)
+    # byte 5 undeclared
+    last = ByteField(6, min=0, max=100)
+
+    def __init__(self):
+        self._data = field_layout(type(self)).new_data()
+
+
+class TestBulkCodec(unittest.TestCase):
+    def test_record_round_trip_preserves_gaps(self):
+        obj = Interleaved()
+        obj.label = "abcd"
+        obj._data[5] = 0x77
+        layout = field_layout(Interleaved)
+        self.assertEqual(layout.record(obj._data), (1, 0))
+        layout.pack_record(obj._data, (2, 50))
+        self.assertEqual((obj.first, obj.last), (2, 50))
+        self.assertEqual(obj.label, "abcd")
+        self.assertEqual(obj._data[5], 0x77)
+
+    def test_to_dict_matches_descriptors(self):
+        obj = Interleaved()
+        obj.label = "ab"
+        obj.last = 9
+        expected = {name: fld.to_dict(obj) for name, fld in iter_fields(Interleaved)}
+        self.assertEqual(field_layout(Interleaved).to_dict(obj), expected)
+        self.assertEqual(field_layout(Interleaved).to_dict(obj, skip=("label",)),
+                         {"first": "A", "last": 9})
+        obj._data[0] = 0x7F  # not a Mode member: stays an int
+        self.assertEqual(field_layout(Interleaved).to_dict(obj)["first"], 0x7F)
+
+    def test_from_dict(self):
+        obj = Interleaved()
+        field_layout(Interleaved).from_dict(
+            obj, {"first": "B", "label": "xy", "last": 42, "unknown": 1})
+        self.assertEqual((obj.first, obj.label, obj.last), (2, "xy", 42))
+        field_layout(Interleaved).from_dict(obj, {"first": Mode.A})
+        self.assertEqual(obj.first, 1)
+
+    def test_from_dict_validates(self):
+        obj = Interleaved()
+        with self.assertRaises(ValueError):
+            field_layout(Interleaved).from_dict(obj, {"last": 101})
+        with self.assertRaises(KeyError):
+            field_layout(Interleaved).from_dict(obj, {"first": "C"})
+        self.assertEqual(obj.last, 0, "nothing written on error")
+
+
 if __name__ == "__main__":
     unittest.main()
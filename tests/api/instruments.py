@@ -7,6 +7,11 @@ and factory-dispatch coverage.
 import os
 import unittest
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from m8.api import M8Block
 from m8.api.instrument import (
     BLOCK_SIZE,
@@ -200,6 +205,33 @@ class TestM8iRoundTrip(unittest.TestCase):
         self.assertIsInstance(inst, M8FMSynth)
         self.assertEqual(len(inst.modulators), 4)
 
+    def test_write_m8i_round_trip(self):
+        with open(self.FIXTURE, "rb") as f:
+            data = f.read()
+        inst = M8Instrument.read_m8i(data)
+        self.assertEqual(inst.write_m8i(), data)
+        self.assertEqual(inst.clone().write_m8i(), data)
+        # An explicit table replaces the one read from the file
+        from m8.api.table import M8Table
+        self.assertEqual(inst.write_m8i(M8Table())[-128:], M8Table().write())
+
+    def test_write_to_file(self):
+        import tempfile
+        from m8.api.table import M8Table
+        src = M8Sampler(name="KICK", sample_path="/Samples/kick.wav")
+        table = M8Table()
+        table[0].transpose = 12
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sub", "kick.m8i")
+            src.write_to_file(path, table=table)
+            with open(path, "rb") as f:
+                data = f.read()
+            loaded = M8Instrument.read_from_file(path)
+        self.assertTrue(data.startswith(b"M8VERSION\x00"))
+        self.assertEqual(data[-128:], table.write())
+        self.assertIsInstance(loaded, M8Sampler)
+        self.assertEqual(loaded.to_dict(), src.to_dict())
+
 
 class TestInstrumentErrorHandling(unittest.TestCase):
     def test_unknown_instrument_type_in_factory(self):
@@ -257,5 +289,64 @@ class TestInstrumentsCollection(unittest.TestCase):
         M8Instruments().validate()  # should not raise
 
 
+class TestInstrumentColumn(unittest.TestCase):
+    """project.instruments.column(name): one ByteField across all slots."""
+
+    def setUp(self):
+        self.instruments = M8Instruments([M8Sampler(), M8Block(), M8Wavsynth(), M8MIDIOut()])
+        self.cutoff = self.instruments.column("cutoff")
+
+    def test_values_and_mask(self):
+        values = self.cutoff.values()
+        self.assertEqual(len(values), 128)
+        self.assertEqual(values[:4], [0xFF, None, 0xFF, None])
+        self.assertEqual(self.cutoff.mask[:4], [False, True, False, True])
+        self.assertEqual(self.cutoff[2], 0xFF)
+        self.assertIsNone(self.cutoff[1])
+
+    def test_scalar_assignment_skips_masked_slots(self):
+        self.assertEqual(self.cutoff.set(0x40), 2)
+        self.assertEqual(self.instruments[0].cutoff, 0x40)
+        self.assertEqual(self.instruments[2].cutoff, 0x40)  # different offset
+        self.assertEqual(bytes(self.instruments[4].write()), bytes([0xFF] + [0] * (BLOCK_SIZE - 1)))
+
+    def test_sequence_assignment(self):
+        values = [None] * 128
+        values[2] = 0x10
+        self.assertEqual(self.cutoff.set(values), 1)
+        self.assertEqual((self.instruments[0].cutoff, self.instruments[2].cutoff), (0xFF, 0x10))
+
+    def test_enum_names(self):
+        self.instruments.column("play_mode").set("REV")
+        self.assertEqual(self.instruments[0].play_mode, M8PlayMode.REV)
+
+    def test_invalid_assignment_writes_nothing(self):
+        values = [0x20] * 128
+        values[1] = None
+        values[3] = None
+        values[2] = 300
+        with self.assertRaises(ValueError):
+            self.cutoff.set(values)
+        self.assertEqual(self.instruments[0].cutoff, 0xFF)
+        with self.assertRaises(ValueError):
+            self.cutoff.set([0x20] * 128)  # slot 1 is masked
+        with self.assertRaises(ValueError):
+            self.cutoff[1] = 0x20
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.instruments.column("no_such_field")
+        with self.assertRaises(ValueError):
+            self.instruments.column("name")  # not a ByteField
+
+    @unittest.skipUnless(np is not None, "numpy not installed")
+    def test_numpy_round_trip(self):
+        arr = self.cutoff.to_numpy()
+        self.assertEqual(arr.dtype, np.uint8)
+        self.assertEqual(int(arr.count()), 2)
+        self.assertEqual(self.cutoff.set(arr // 2), 2)
+        self.assertEqual(self.instruments[2].cutoff, 0x7F)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -116,6 +116,20 @@ class TestM8MetadataClone(unittest.TestCase):
         self.assertEqual(original.name, "ORIGINAL")
 
 
+class TestM8MetadataDict(unittest.TestCase):
+    def test_round_trip(self):
+        original = M8Metadata(directory="/Songs/x/", transpose=2, tempo=98.5,
+                              quantize=1, name="DICT")
+        d = original.to_dict()
+        self.assertEqual(d["name"], "DICT")
+        self.assertEqual(M8Metadata.from_dict(d).write(), original.write())
+
+    def test_from_dict_defaults_missing_keys(self):
+        m = M8Metadata.from_dict({"tempo": 140.0})
+        self.assertEqual(m.tempo, 140.0)
+        self.assertEqual(m.name, "HELLO")
+
+
 class TestKeyNotOnMetadata(unittest.TestCase):
     """The musical-key byte is on M8Project, not on M8Metadata."""
 
@@ -246,6 +246,20 @@ class TestM8iConversion(unittest.TestCase):
         self.assertEqual(mods[2].shape, int(M8LFOShape.SIN))
         self.assertEqual(mods[2].freq, 0x20)
 
+    def test_write_m8i_round_trip(self):
+        data = bytes([3, 0x80, 0x10, 0x20, 0x30, 0x00]) + bytes(6) + bytes([
+            int(M8LFOShape.SIN), 5, 0, 0x20, 0x90, 0,
+        ]) + bytes(6)
+        mods = M8Modulators.read_m8i(data)
+        self.assertEqual(mods.write_m8i(), data)
+        self.assertEqual(M8Modulators.read_m8i(mods.write_m8i()).write(), mods.write())
+
+    def test_write_m8i_rejects_other_slot_types(self):
+        mods = M8Modulators()
+        mods[0] = M8LFOModulator()
+        with self.assertRaises(ValueError):
+            mods.write_m8i()
+
 
 if __name__ == "__main__":
     unittest.main()
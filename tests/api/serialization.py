@@ -0,0 +1,135 @@
+"""Tests for the whole-project dict form and its encoders."""
+import ast
+import json
+import os
+import unittest
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from m8.api.chain import M8ChainStep
+from m8.api.instrument import BLOCK_SIZE, INSTRUMENTS_OFFSET, NAME_OFFSET
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.phrase import M8Note, M8PhraseStep
+from m8.api.project import M8Project
+from m8.api.serialization import (
+    ENCODERS, SCHEMA, dumps, loads, project_to_dict, register_encoder,
+)
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "EXTERNAL.m8s")
+
+
+class TestProjectDict(unittest.TestCase):
+    def setUp(self):
+        self.project = M8Project.initialise()
+
+    def test_template_round_trip(self):
+        doc = self.project.to_dict()
+        self.assertEqual(doc["schema"], SCHEMA)
+        self.assertEqual(M8Project.from_dict(doc).write(), self.project.write())
+
+    def test_fixture_round_trip(self):
+        project = M8Project.read_from_file(FIXTURE)
+        self.assertEqual(M8Project.from_dict(project.to_dict()).write(), project.write())
+
+    def test_empty_slots_stored_once(self):
+        p = self.project
+        p.instruments[3] = M8Wavsynth(name="LEAD")
+        p.phrases[9][0] = M8PhraseStep(note=M8Note.C_4, velocity=0x60, instrument=3)
+        p.chains[2][0] = M8ChainStep(phrase=9)
+        p.song[0][1] = 2
+        doc = p.to_dict()
+        self.assertEqual([i for i, _ in doc["phrases"]["slots"]], [9])
+        self.assertEqual([i for i, _ in doc["chains"]["slots"]], [2])
+        self.assertEqual([i for i, _ in doc["instruments"]["slots"]], [3])
+        self.assertEqual(doc["phrases"]["slots"][0][1][0][:3], [M8Note.C_4, 0x60, 3])
+        self.assertEqual(doc["song"]["slots"], [[0, [255, 2, 255, 255, 255, 255, 255, 255]]])
+
+        restored = M8Project.from_dict(doc)
+        self.assertEqual(restored.write(), p.write())
+        self.assertEqual(restored.instruments[3].name, "LEAD")
+
+    def test_settings_and_slots_are_queryable(self):
+        p = self.project
+        p.metadata.name = "QUERY"
+        p.metadata.tempo = 98.5
+        p.instruments[3] = M8Wavsynth(name="LEAD")
+        p.eqs[5].mid.q = 0x42
+        doc = p.to_dict()
+        self.assertEqual(doc["metadata"]["name"], "QUERY")
+        self.assertEqual(doc["metadata"]["tempo"], 98.5)
+        instruments = dict(doc["instruments"]["slots"])
+        self.assertEqual((instruments[3]["type"], instruments[3]["name"]), ("WAVSYNTH", "LEAD"))
+        self.assertEqual(dict(doc["eqs"]["slots"])[5]["mid"]["q"], 0x42)
+        self.assertIsInstance(doc["instruments"]["fill"], str)   # empty slot: hex
+
+    def test_edited_fields_are_written(self):
+        doc = self.project.to_dict()
+        doc["metadata"]["name"] = "EDITED"
+        doc["eqs"]["slots"].append([7, dict(doc["eqs"]["fill"], low=dict(doc["eqs"]["fill"]["low"], q=9))])
+        restored = M8Project.from_dict(doc)
+        self.assertEqual(restored.metadata.name, "EDITED")
+        self.assertEqual(restored.eqs[7].low.q, 9)
+
+    def test_unparsed_bytes_survive(self):
+        self.project.instruments[3] = M8Wavsynth(name="AB")
+        data = bytearray(self.project.write())
+        data[INSTRUMENTS_OFFSET + 3 * BLOCK_SIZE + NAME_OFFSET + 5] = 0x7A   # junk after the name
+        project = M8Project.read(bytes(data))
+        slot = dict(project.to_dict()["instruments"]["slots"])[3]
+        self.assertEqual(slot["name"], "AB")
+        self.assertEqual(slot["unparsed"], [[NAME_OFFSET + 5, "7a"]])
+        self.assertEqual(M8Project.from_dict(project.to_dict()).write(), bytes(data))
+
+    def test_dict_is_json_safe(self):
+        doc = self.project.to_dict()
+        self.assertEqual(json.loads(json.dumps(doc)), doc)
+
+    def test_unsupported_schema(self):
+        doc = self.project.to_dict()
+        doc["schema"] = SCHEMA + 1
+        with self.assertRaises(ValueError):
+            M8Project.from_dict(doc)
+
+    def test_wrong_section_size(self):
+        doc = self.project.to_dict()
+        doc["scales"]["fill"] = doc["scales"]["fill"][:-2]
+        with self.assertRaises(ValueError):
+            M8Project.from_dict(doc)
+
+
+class TestEncoders(unittest.TestCase):
+    def setUp(self):
+        self.project = M8Project.initialise()
+
+    def test_json(self):
+        blob = dumps(self.project)
+        self.assertLess(len(blob), len(self.project.write()) // 10)
+        self.assertEqual(loads(blob).write(), self.project.write())
+
+    @unittest.skipUnless(msgpack is not None, "msgpack not installed")
+    def test_msgpack(self):
+        blob = dumps(self.project, "msgpack")
+        self.assertEqual(loads(blob, "msgpack").write(), self.project.write())
+
+    def test_register_encoder(self):
+        register_encoder("repr", lambda doc: repr(doc).encode(),
+                         lambda data: ast.literal_eval(data.decode()))
+        try:
+            blob = dumps(self.project, "repr")
+            self.assertEqual(loads(blob, "repr").write(), self.project.write())
+        finally:
+            del ENCODERS["repr"]
+
+    def test_unknown_encoder(self):
+        with self.assertRaises(ValueError):
+            dumps(self.project, "xml")
+
+    def test_to_dict_matches_module(self):
+        self.assertEqual(self.project.to_dict(), project_to_dict(self.project))
+
+
+if __name__ == '__main__':
+    unittest.main()
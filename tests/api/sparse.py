@@ -0,0 +1,112 @@
+"""Tests for sparse project collections."""
+import os
+import unittest
+
+from m8.api import M8Block
+from m8.api.chain import M8ChainStep
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.phrase import M8Note, M8PhraseStep
+from m8.api.project import M8Project
+from m8.api.remapper import move_chains, walk_song
+from m8.api.sparse import M8SparsePhrases, M8SparseTables, SPARSE_SECTIONS, peek
+from m8.api.table import M8Tables
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "EXTERNAL.m8s")
+
+
+class TestSparseProject(unittest.TestCase):
+    def setUp(self):
+        with open(FIXTURE, "rb") as f:
+            self.data = f.read()
+        self.dense = M8Project.read(self.data)
+        self.project = M8Project.read(self.data, sparse=True)
+
+    def test_write_matches_dense(self):
+        self.assertEqual(self.project.write(), self.dense.write())
+
+    def test_empty_slots_share_one_object(self):
+        phrases = self.project.phrases
+        self.assertIsInstance(phrases, M8SparsePhrases)
+        self.assertEqual(len(phrases), len(self.dense.phrases))
+        shared = phrases.shared_slots()
+        self.assertEqual(len(shared), len(phrases) - 1)
+        self.assertIs(peek(phrases, shared[0]), peek(phrases, shared[-1]))
+        for name in SPARSE_SECTIONS:
+            self.assertTrue(getattr(self.project, name).shared_slots(), name)
+
+    def test_index_materialises_one_slot(self):
+        phrases = self.project.phrases
+        index = phrases.shared_slots()[0]
+        phrases[index][0] = M8PhraseStep(note=M8Note.C_4, velocity=0x60, instrument=0)
+        self.assertFalse(phrases.is_shared(index))
+        self.assertEqual(peek(phrases, index)[0].note, M8Note.C_4)
+        self.assertEqual(len(phrases.shared_slots()), len(phrases) - 2)
+
+        self.dense.phrases[index][0] = M8PhraseStep(note=M8Note.C_4, velocity=0x60, instrument=0)
+        self.assertEqual(self.project.write(), self.dense.write())
+
+    def test_shared_objects_are_read_only(self):
+        shared = peek(self.project.chains, self.project.chains.shared_slots()[0])
+        with self.assertRaises(TypeError):
+            shared[0].phrase = 3
+        instrument = peek(self.project.instruments, 5)
+        self.assertIsInstance(instrument, M8Block)
+        with self.assertRaises(TypeError):
+            instrument.data[0] = 0
+
+    def test_readers_do_not_materialise(self):
+        before = {name: getattr(self.project, name).shared_slots() for name in SPARSE_SECTIONS}
+        self.project.validate()
+        walk_song(self.project)
+        self.project.write()
+        self.project.timing().timeline()
+        after = {name: getattr(self.project, name).shared_slots() for name in SPARSE_SECTIONS}
+        self.assertEqual(before, after)
+
+    def test_timing_does_not_materialise(self):
+        chains, phrases = self.project.chains, self.project.phrases
+        empty_chain, empty_phrase = chains.shared_slots()[0], phrases.shared_slots()[0]
+        chain = chains.shared_slots()[1]
+        chains[chain][0] = M8ChainStep(phrase=empty_phrase)
+        self.project.song[0][0] = chain
+        self.project.song[0][1] = empty_chain
+        before = {name: getattr(self.project, name).shared_slots() for name in SPARSE_SECTIONS}
+        timeline = self.project.timing().timeline()
+        self.assertTrue(any(ts.phrase == empty_phrase for ts in timeline))
+        after = {name: getattr(self.project, name).shared_slots() for name in SPARSE_SECTIONS}
+        self.assertEqual(before, after)
+
+    def test_remap_does_not_materialise(self):
+        before = {name: getattr(self.project, name).shared_slots() for name in SPARSE_SECTIONS}
+        destination = M8Project.initialise()
+        chains = {step for row in self.project.song for step in row if step != 0xFF}
+        remap = move_chains(self.project, destination, chains)
+        self.assertTrue(remap.tables)                 # empty tables are copied too
+        after = {name: getattr(self.project, name).shared_slots() for name in SPARSE_SECTIONS}
+        self.assertEqual(before, after)
+        # Copies of shared slots are ordinary, writable objects
+        table = destination.tables[next(iter(remap.tables.values()))]
+        table[0].transpose = 3
+        self.assertEqual(destination.tables[next(iter(remap.tables.values()))][0].transpose, 3)
+
+    def test_assignment_replaces_shared_slot(self):
+        self.project.instruments[9] = M8Wavsynth(name="NEW")
+        self.project.chains[7][0] = M8ChainStep(phrase=1)
+        self.assertFalse(self.project.instruments.is_shared(9))
+        self.assertEqual(self.project.chains[7][0].phrase, 1)
+
+    def test_clone_keeps_sharing(self):
+        clone = self.project.clone()
+        self.assertEqual(clone.phrases.shared_slots(), self.project.phrases.shared_slots())
+        clone.phrases[3][0].note = M8Note.C_4
+        self.assertTrue(self.project.phrases.is_shared(3))
+        self.assertEqual(self.project.write(), self.dense.write())
+
+    def test_new_collection_is_all_shared(self):
+        tables = M8SparseTables()
+        self.assertEqual(len(tables.shared_slots()), len(tables))
+        self.assertEqual(tables.write(), M8Tables().write())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Tests for the groove-aware timing engine."""
+import unittest
+
+from m8.api.chain import M8Chain, M8ChainStep
+from m8.api.fx import M8FXTuple, M8MixerFX, M8SequenceFX
+from m8.api.groove import M8Groove
+from m8.api.phrase import M8Phrase
+from m8.api.project import M8Project
+from m8.api.timing import (
+    DEFAULT_STEP_TICKS, TICKS_PER_BEAT, GrooveTable, M8TimingEngine, tick_seconds,
+)
+
+
+def _project_with_track(track=0, rows=1):
+    project = M8Project.initialise()
+    project.metadata.tempo = 120
+    for row in range(rows):
+        project.phrases[row] = M8Phrase()
+        project.chains[row] = M8Chain()
+        project.chains[row][0] = M8ChainStep(phrase=row)
+        project.song[row][track] = row
+    return project
+
+
+class TestGrooveTable(unittest.TestCase):
+    def test_straight_groove(self):
+        table = GrooveTable(M8Groove(steps=[6, 6]))
+        self.assertEqual(table.ticks, (6,) * 16)
+        self.assertEqual(table.offsets[:3], (0, 6, 12))
+        self.assertEqual(table.total, 96)
+
+    def test_swing_groove_repeats(self):
+        table = GrooveTable(M8Groove(steps=[8, 4]))
+        self.assertEqual(table.ticks[:4], (8, 4, 8, 4))
+        self.assertEqual(table.offsets[2], 12)
+        self.assertEqual(table.total, 96)
+
+    def test_odd_length_groove_cycles(self):
+        table = GrooveTable(M8Groove(steps=[5, 6, 7]))
+        self.assertEqual(table.ticks[:6], (5, 6, 7, 5, 6, 7))
+
+    def test_empty_groove_plays_straight(self):
+        table = GrooveTable(M8Groove())
+        self.assertEqual(table.ticks, (DEFAULT_STEP_TICKS,) * 16)
+
+    def test_seconds(self):
+        table = GrooveTable(M8Groove(steps=[6]))
+        # 120 BPM: one beat = 0.5s = 4 steps of 6 ticks
+        self.assertAlmostEqual(table.seconds(120)[4], 0.5)
+
+    def test_tick_seconds(self):
+        self.assertAlmostEqual(tick_seconds(120) * TICKS_PER_BEAT, 0.5)
+
+
+class TestTimingEngine(unittest.TestCase):
+    def test_project_shares_engine(self):
+        project = M8Project.initialise()
+        self.assertIsInstance(project.timing(), M8TimingEngine)
+        self.assertIs(project.timing(), project.timing())
+
+    def test_empty_song_has_no_steps(self):
+        project = M8Project.initialise()
+        self.assertEqual(project.timing().timeline(), [])
+        self.assertEqual(project.timing().duration(), 0)
+
+    def test_single_phrase_straight(self):
+        project = _project_with_track()
+        engine = project.timing()
+        steps = engine.track_steps(0)
+        self.assertEqual(len(steps), 16)
+        self.assertEqual([s.tick for s in steps[:3]], [0, 6, 12])
+        self.assertAlmostEqual(steps[4].time, 0.5)
+        self.assertAlmostEqual(engine.duration(), 2.0)
+
+    def test_rows_follow_each_other(self):
+        project = _project_with_track(rows=2)
+        steps = project.timing().track_steps(0)
+        self.assertEqual(len(steps), 32)
+        self.assertEqual(steps[16].row, 1)
+        self.assertEqual(steps[16].tick, 96)
+
+    def test_grv_switches_track_groove(self):
+        project = _project_with_track()
+        project.grooves[1] = M8Groove(steps=[8, 4])
+        project.phrases[0][4].fx[0] = M8FXTuple(key=M8SequenceFX.GRV, value=1)
+        steps = project.timing().track_steps(0)
+        self.assertEqual(steps[3].groove, 0)
+        self.assertEqual(steps[4].groove, 1)
+        self.assertEqual(steps[4].ticks, 8)
+        self.assertEqual(steps[5].ticks, 4)
+        self.assertEqual(steps[5].tick, 24 + 8)
+
+    def test_ggr_switches_all_tracks(self):
+        project = _project_with_track(track=1)
+        project.grooves[2] = M8Groove(steps=[12])
+        project.phrases[1] = M8Phrase()
+        project.phrases[1][2].fx[0] = M8FXTuple(key=M8MixerFX.GGR, value=2)
+        project.chains[1] = M8Chain()
+        project.chains[1][0] = M8ChainStep(phrase=1)
+        project.song[0][0] = 1
+        engine = project.timing()
+        track1 = engine.track_steps(1)
+        # GGR fires on track 0 at tick 12; track 1's step at tick 12 follows it
+        self.assertEqual(track1[1].ticks, 6)
+        self.assertEqual(track1[2].groove, 2)
+        self.assertEqual(track1[2].ticks, 12)
+        self.assertEqual(engine.track_steps(0)[2].groove, 2)
+
+    def test_out_of_range_groove_ignored(self):
+        project = _project_with_track()
+        project.phrases[0][0].fx[0] = M8FXTuple(key=M8SequenceFX.GRV, value=0x40)
+        self.assertEqual(project.timing().track_steps(0)[0].groove, 0)
+
+    def test_groove_tables_cached_by_bytes(self):
+        project = _project_with_track()
+        engine = project.timing()
+        self.assertIs(engine.groove_table(0), engine.groove_table(1))
+        project.grooves[1] = M8Groove(steps=[3])
+        self.assertIsNot(engine.groove_table(0), engine.groove_table(1))
+
+    def test_invalidate(self):
+        project = _project_with_track()
+        engine = project.timing()
+        first = engine.timeline()
+        self.assertIs(engine.timeline(), first)
+        project.metadata.tempo = 60
+        engine.invalidate()
+        self.assertAlmostEqual(engine.duration(), 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
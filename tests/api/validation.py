@@ -0,0 +1,113 @@
+"""Tests for the byte-level project validator."""
+import unittest
+
+from m8.api.instrument import BLOCK_SIZE, INSTRUMENTS_OFFSET, MODULATORS_OFFSET
+from m8.api.fx import M8FXTuple, M8MixerFX, M8SequenceFX
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.phrase import M8PhraseStep
+from m8.api.project import M8Project
+from m8.api.validation import (
+    M8Validator, ProjectValidationError, Violation, check_phrases, validate_bytes,
+)
+
+
+class TestValidator(unittest.TestCase):
+    def setUp(self):
+        self.project = M8Project.initialise()
+
+    def test_clean_project(self):
+        self.assertEqual(M8Validator(self.project).validate(), [])
+        self.assertEqual(validate_bytes(self.project.write()), [])
+
+    def test_collects_every_violation(self):
+        p = self.project
+        p.phrases[0][3] = M8PhraseStep(note=36, velocity=0xFF, instrument=200)
+        p.phrases[7][15].instrument = 128
+        p.phrases[2][1].fx[1] = M8FXTuple(key=int(M8MixerFX.EQM), value=140)
+        p.tables[9][4].fx[2] = M8FXTuple(key=int(M8MixerFX.INS), value=130)
+        p.instruments[5] = M8Wavsynth()
+        p.instruments[5].associated_eq = 200
+
+        violations = M8Validator(p).validate()
+        self.assertEqual(
+            [(v.section, v.slot, v.step, v.field, v.value) for v in violations],
+            [
+                ("phrases", 0, 3, "instrument", 200),
+                ("phrases", 2, 1, "fx2", 140),
+                ("phrases", 7, 15, "instrument", 128),
+                ("tables", 9, 4, "fx3", 130),
+                ("instruments", 5, None, "associated_eq", 200),
+            ],
+        )
+        self.assertEqual(str(violations[0]),
+                         "phrase 0 step 3 instrument: invalid instrument reference 200: "
+                         "must be 0-127 or 255 (empty)")
+        self.assertEqual(validate_bytes(p.write()), violations)
+
+    def test_in_range_references_pass(self):
+        p = self.project
+        p.phrases[0][0].fx[0] = M8FXTuple(key=int(M8MixerFX.INS), value=127)
+        p.phrases[0][0].fx[1] = M8FXTuple(key=int(M8SequenceFX.TBL), value=255)
+        p.phrases[0][0].fx[2] = M8FXTuple(key=int(M8MixerFX.EQI), value=131)
+        # A value only matters under a reference key
+        p.tables[0][0].fx[0] = M8FXTuple(key=0x00, value=200)
+        self.assertEqual(M8Validator(p).validate(), [])
+
+    def test_empty_instrument_slot_eq_ignored(self):
+        data = bytearray(self.project.write())
+        block = INSTRUMENTS_OFFSET + 127 * BLOCK_SIZE
+        data[block] = 0xFF                              # empty slot
+        data[block + MODULATORS_OFFSET - 1] = 200       # stray associated_eq byte
+        self.assertEqual(validate_bytes(data), [])
+        data[block] = 0x00
+        self.assertEqual([v.slot for v in validate_bytes(data)], [127])
+
+    def test_revalidate_only_touched_slots(self):
+        p = self.project
+        validator = M8Validator(p)
+        self.assertEqual(validator.validate(), [])
+
+        p.phrases[3][0].instrument = 200
+        p.phrases[4][0].instrument = 201
+        self.assertEqual([v.slot for v in validator.revalidate(phrases=[3])], [3])
+
+        p.phrases[3][0].instrument = 1
+        self.assertEqual(validator.revalidate(phrases=[3]), [])
+
+    def test_step_count_reported(self):
+        self.project.phrases[1].pop()
+        violations = M8Validator(self.project).validate()
+        self.assertEqual([(v.slot, v.field, v.value) for v in violations], [(1, "steps", 15)])
+
+    def test_check_phrases_slot_mapping(self):
+        step = M8PhraseStep(instrument=150).write()
+        data = M8PhraseStep().write() * 16 + step * 16
+        violations = check_phrases(data, [10, 20])
+        self.assertEqual({v.slot for v in violations}, {20})
+        self.assertEqual(len(violations), 16)
+
+
+class TestProjectValidate(unittest.TestCase):
+    def test_raises_with_all_violations(self):
+        project = M8Project.initialise()
+        project.phrases[0][0].instrument = 200
+        project.phrases[1][0].instrument = 201
+        with self.assertRaises(ProjectValidationError) as ctx:
+            project.validate()
+        self.assertIsInstance(ctx.exception, ValueError)
+        self.assertEqual(len(ctx.exception.violations), 2)
+        self.assertIn("(and 1 more)", str(ctx.exception))
+        self.assertIsInstance(ctx.exception.violations[0], Violation)
+
+    def test_unpopulated_project(self):
+        project = M8Project()
+        project.validate()
+        self.assertEqual(M8Validator(project).revalidate(chains=[0], phrases=[1]), [])
+        project.phrases = M8Project.initialise().phrases
+        project.phrases[0][0].instrument = 200
+        with self.assertRaises(ProjectValidationError):
+            project.validate()
+
+
+if __name__ == "__main__":
+    unittest.main()
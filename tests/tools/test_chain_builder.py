@@ -9,6 +9,7 @@ from pydub import AudioSegment
 from pydub.generators import Sine, Square
 
 from m8.tools.chain_builder import ChainBuilder
+from m8.tools.wav_cues import read_cues
 
 
 class TestChainBuilder(unittest.TestCase):
@@ -202,6 +203,78 @@ class TestChainBuilder(unittest.TestCase):
         self.assertAlmostEqual(len(chain), 100, delta=5)
 
 
+class TestChainBuilderStreaming(unittest.TestCase):
+    """Slices are written straight into one PCM buffer / output stream."""
+
+    def setUp(self):
+        self.builder = ChainBuilder(slice_duration_ms=100, fade_ms=3, frame_rate=44100)
+        self.segments = [
+            Sine(440).to_audio_segment(duration=150),
+            Square(880).to_audio_segment(duration=50),
+            Sine(220).to_audio_segment(duration=100),
+        ]
+
+    def test_data_chunk_is_exact_slice_multiple(self):
+        result_wav, _ = self.builder.build_chain(self.segments)
+        wav_data = result_wav.getvalue()
+        cue_pos = wav_data.find(b'cue ')
+        cue_size = struct.unpack('<I', wav_data[cue_pos + 4:cue_pos + 8])[0]
+        data_pos = cue_pos + 8 + cue_size
+        self.assertEqual(wav_data[data_pos:data_pos + 4], b'data')
+        data_size = struct.unpack('<I', wav_data[data_pos + 4:data_pos + 8])[0]
+        self.assertEqual(data_size, 3 * self.builder.frames_per_slice * 2)
+
+    def test_short_sample_padded_with_silence(self):
+        result_wav, _ = self.builder.build_chain(self.segments)
+        result_wav.seek(0)
+        chain = AudioSegment.from_wav(result_wav)
+        slice_frames = self.builder.frames_per_slice
+        second = chain.get_sample_slice(slice_frames, 2 * slice_frames)
+        tail = second.get_sample_slice(int(slice_frames * 0.6), slice_frames)
+        self.assertEqual(tail.max, 0)
+
+    def test_stereo_sample_makes_stereo_chain(self):
+        stereo = Sine(440).to_audio_segment(duration=100).set_channels(2)
+        result_wav, _ = self.builder.build_chain([self.segments[0], stereo])
+        result_wav.seek(0)
+        chain = AudioSegment.from_wav(result_wav)
+        self.assertEqual(chain.channels, 2)
+        self.assertAlmostEqual(len(chain), 200, delta=5)
+
+    def test_write_chain_matches_build_chain(self):
+        result_wav, mapping = self.builder.build_chain(self.segments)
+        out = BytesIO()
+        streamed_mapping = self.builder.write_chain(self.segments, out)
+        self.assertEqual(out.getvalue(), result_wav.getvalue())
+        self.assertEqual(streamed_mapping, mapping)
+
+    def test_write_chain_to_path(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "chain.wav"
+            self.builder.write_chain(self.segments, path)
+            with open(path, 'rb') as f:
+                chain = AudioSegment.from_wav(f)
+            self.assertAlmostEqual(len(chain), 300, delta=5)
+
+
+    def test_fractional_duration_slices_start_on_cue_frames(self):
+        # 130 BPM, 1/16 note x 2, as in demos/acid_909_chain.py: 230.77ms
+        builder = ChainBuilder(slice_duration_ms=60000 / 130 / 4 * 2, fade_ms=0)
+        click = AudioSegment(data=struct.pack('<h', 16000) * 100,
+                             sample_width=2, frame_rate=44100, channels=1)
+        result_wav, _ = builder.build_chain([click] * 8)
+        cue_points = [i * builder.frames_per_slice for i in range(8)]
+        info = read_cues(result_wav)
+        self.assertEqual(info.standard_points, cue_points)
+        self.assertEqual(info.frames, 8 * builder.frames_per_slice)
+
+        result_wav.seek(0)
+        samples = AudioSegment.from_wav(result_wav).get_array_of_samples()
+        onsets = [i for i in range(len(samples)) if samples[i] and (i == 0 or not samples[i - 1])]
+        self.assertEqual(onsets, cue_points)
+
+
 class TestChainBuilderSliceLimit(unittest.TestCase):
     """ChainBuilder enforces the M8's 128-slice maximum."""
 
@@ -223,5 +296,36 @@ class TestChainBuilderSliceLimit(unittest.TestCase):
         self.assertIn("128", str(ctx.exception))
 
 
+class TestChainBuilderWorkers(unittest.TestCase):
+    """Process-pool sample preparation."""
+
+    def setUp(self):
+        self.samples = [
+            Sine(220 * (i + 1)).to_audio_segment(duration=30 + 20 * i)
+            for i in range(6)
+        ]
+
+    def test_parallel_matches_serial(self):
+        serial, serial_map = ChainBuilder(slice_duration_ms=50).build_chain(self.samples)
+        with ChainBuilder(slice_duration_ms=50, workers=2) as builder:
+            parallel, parallel_map = builder.build_chain(self.samples)
+            # The pool is reused across chains
+            executor = builder._executor
+            builder.build_chain(self.samples[:2])
+            self.assertIs(builder._executor, executor)
+        self.assertIsNone(builder._executor)
+        self.assertEqual(parallel.getvalue(), serial.getvalue())
+        self.assertEqual(parallel_map, serial_map)
+
+    def test_single_sample_skips_pool(self):
+        builder = ChainBuilder(slice_duration_ms=50, workers=4)
+        builder.build_chain(self.samples[:1])
+        self.assertIsNone(builder._executor)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            ChainBuilder(slice_duration_ms=50, workers=0)
+
+
 if __name__ == '__main__':
     unittest.main()
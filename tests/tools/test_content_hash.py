@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Tests for the shared sample content hashes."""
+
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pydub import AudioSegment
+
+from m8.tools import content_hash
+from m8.tools.content_hash import file_sha256, sample_sha256, segment_sha256
+from m8.tools.sample_cache import SampleCache
+from m8.tools.sample_index import file_sha256 as index_file_sha256
+
+
+class TestContentHash(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "kick.wav"
+        self.segment = AudioSegment.silent(duration=50, frame_rate=44100)
+        self.segment.export(str(self.path), format="wav").close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_file_hash_spans_blocks(self):
+        data = bytes(range(256)) * 9000          # > 2 blocks
+        self.path.write_bytes(data)
+        with mock.patch.object(content_hash, "HASH_BLOCK_SIZE", 1000):
+            self.assertEqual(file_sha256(self.path), hashlib.sha256(data).hexdigest())
+
+    def test_sample_hash_dispatch(self):
+        self.assertEqual(sample_sha256(self.path), file_sha256(self.path))
+        self.assertEqual(sample_sha256(str(self.path)), file_sha256(self.path))
+        self.assertEqual(sample_sha256(self.segment), segment_sha256(self.segment))
+        with self.assertRaises(TypeError):
+            sample_sha256(42)
+
+    def test_tools_share_digests(self):
+        cache = SampleCache(Path(self.tmp.name) / "cache")
+        self.assertEqual(cache.source_digest(self.path), file_sha256(self.path))
+        self.assertEqual(cache.source_digest(self.segment), segment_sha256(self.segment))
+        self.assertIs(index_file_sha256, file_sha256)
+
+
+if __name__ == '__main__':
+    unittest.main()
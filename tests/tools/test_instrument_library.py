@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Tests for the .m8i instrument library loader."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from m8.api.instrument import M8Instrument, M8InstrumentType
+from m8.api.instruments.sampler import M8Sampler
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.modulator import M8LFOModulator
+from m8.api.project import M8Project
+from m8.tools import instrument_library
+from m8.tools.instrument_library import (
+    clear_cache, export_filename, export_instruments, find_m8i, load_library,
+)
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "KICK_MORPH.m8i"
+
+
+class TestInstrumentLibrary(unittest.TestCase):
+
+    def setUp(self):
+        clear_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "drums").mkdir()
+        shutil.copy(FIXTURE, self.root / "drums" / "kick.m8i")
+        shutil.copy(FIXTURE, self.root / "drums" / "kick-copy.m8i")
+        (self.root / "broken.m8i").write_bytes(b"\x00" * 14 + b"\xEE" + b"\x00" * 40)
+        (self.root / "notes.txt").write_text("not an instrument")
+        self.expected = M8Instrument.read_from_file(str(FIXTURE))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_m8i_sources(self):
+        self.assertEqual(len(find_m8i(self.root)), 3)
+        self.assertEqual(len(find_m8i(str(self.root / "drums" / "*.m8i"))), 2)
+        self.assertEqual(find_m8i(self.root / "drums" / "kick.m8i"),
+                         [self.root / "drums" / "kick.m8i"])
+
+    def test_load_indexes_entries(self):
+        library = load_library(self.root, workers=4)
+        self.assertEqual(len(library), 2)
+        self.assertEqual(list(library.errors), [self.root / "broken.m8i"])
+
+        entry = library.get(self.expected.name)
+        self.assertIsNotNone(entry)
+        self.assertIn(self.expected.name, library)
+        self.assertEqual(entry.type_id, self.expected.type_id)
+        self.assertEqual(entry.type_name, M8InstrumentType(self.expected.type_id).name)
+        self.assertEqual(len(library.of_type(entry.type_id)), 2)
+        self.assertEqual(len(library.by_hash), 1)
+        self.assertEqual(len(library.duplicates()), 1)
+
+    def test_instrument_returns_editable_copy(self):
+        library = load_library(self.root)
+        copy = library.instrument(self.expected.name)
+        self.assertEqual(copy.write(), self.expected.write())
+        copy.name = "EDITED"
+        self.assertEqual(library.get(self.expected.name).instrument.name, self.expected.name)
+        with self.assertRaises(KeyError):
+            library.instrument("MISSING")
+
+    def test_parsed_once_per_content(self):
+        with mock.patch.object(instrument_library.M8Instrument, "read_m8i",
+                               wraps=M8Instrument.read_m8i) as read_m8i:
+            load_library(self.root / "drums", workers=1)
+            load_library(self.root / "drums", workers=1)
+        self.assertEqual(read_m8i.call_count, 1)
+
+
+class TestExportInstruments(unittest.TestCase):
+
+    def setUp(self):
+        self.project = M8Project.initialise()
+        self.project.instruments[0] = M8Sampler(name="KICK", sample_path="kick.wav")
+        self.project.instruments[0x1A] = M8Wavsynth(name="LEAD/1")
+        self.project.tables[0x1A][0].transpose = 7
+
+    def test_export_populated_slots(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            written = export_instruments(self.project, tmp, workers=4)
+            self.assertEqual(sorted(written), [0, 0x1A])
+            self.assertEqual(written[0x1A].name, "1A-LEAD_1.m8i")
+
+            library = load_library(tmp)
+            self.assertEqual(library.instrument("KICK").to_dict(),
+                             self.project.instruments[0].to_dict())
+            data = written[0x1A].read_bytes()
+            self.assertEqual(data[-128:], self.project.tables[0x1A].write())
+
+    def test_export_reports_failures(self):
+        self.project.instruments[0].modulators[0] = M8LFOModulator()
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError) as ctx:
+                export_instruments(self.project, tmp)
+            self.assertIn("slot 00", str(ctx.exception))
+            self.assertTrue((Path(tmp) / "1A-LEAD_1.m8i").exists())
+
+    def test_export_sparse_project_keeps_shared_slots(self):
+        sparse = M8Project.read(self.project.write(), sparse=True)
+        shared = sparse.tables.shared_slots()
+        with tempfile.TemporaryDirectory() as tmp:
+            written = export_instruments(sparse, tmp)
+            self.assertEqual(written[0].read_bytes()[-128:], sparse.tables.write()[:128])
+        self.assertIn(0, shared)
+        self.assertEqual(sparse.tables.shared_slots(), shared)
+
+    def test_export_filename_without_name(self):
+        self.assertEqual(export_filename(5, M8Wavsynth(name="")), "05.m8i")
+
+
+class TestReadM8i(unittest.TestCase):
+
+    def test_read_m8i_matches_read_from_file(self):
+        data = FIXTURE.read_bytes()
+        self.assertEqual(M8Instrument.read_m8i(data).write(),
+                         M8Instrument.read_from_file(str(FIXTURE)).write())
+
+    def test_unsupported_type_names_source(self):
+        with self.assertRaises(ValueError) as ctx:
+            M8Instrument.read_m8i(b"\x00" * 14 + b"\xEE" + b"\x00" * 40, source="x.m8i")
+        self.assertIn("x.m8i", str(ctx.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
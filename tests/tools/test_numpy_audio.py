@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for the NumPy ChainBuilder backend."""
+
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from m8.tools.chain_builder import ChainBuilder
+
+try:
+    import numpy as np
+    from m8.tools import numpy_audio
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def _data_chunk(wav_bytes):
+    """Return the payload of the `data` chunk."""
+    pos = 12
+    while pos < len(wav_bytes):
+        chunk_id, size = struct.unpack('<4sI', wav_bytes[pos:pos + 8])
+        if chunk_id == b'data':
+            return wav_bytes[pos + 8:pos + 8 + size]
+        pos += 8 + size + (size & 1)
+    raise AssertionError("no data chunk")
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestNumpyAudio(unittest.TestCase):
+    """Array helpers."""
+
+    def test_pcm_round_trip(self):
+        for width in (1, 2, 3, 4):
+            x = np.array([[0.0], [0.5], [-0.5], [0.25]], dtype=np.float32)
+            raw = numpy_audio.to_pcm(x, width)
+            self.assertEqual(len(raw), 4 * width)
+            back = numpy_audio._pcm_to_float(raw, width, 1)
+            np.testing.assert_allclose(back, x, atol=2.0 / (1 << (8 * width - 1)) + 1e-6)
+
+    def test_resample_length(self):
+        x = np.zeros((22050, 2), dtype=np.float32)
+        self.assertEqual(len(numpy_audio.resample(x, 22050, 44100)), 44100)
+
+    def test_fades(self):
+        x = np.ones((100, 1), dtype=np.float32)
+        faded = numpy_audio.apply_fades(x, 10)
+        self.assertEqual(faded[0, 0], 0.0)
+        self.assertEqual(faded[50, 0], 1.0)
+        self.assertLess(faded[-1, 0], 0.2)
+        no_out = numpy_audio.apply_fades(x, 10, fade_out=False)
+        self.assertEqual(no_out[-1, 0], 1.0)
+
+    def test_set_channels(self):
+        mono = np.ones((4, 1), dtype=np.float32)
+        self.assertEqual(numpy_audio.set_channels(mono, 2).shape, (4, 2))
+        stereo = np.ones((4, 2), dtype=np.float32)
+        self.assertEqual(numpy_audio.set_channels(stereo, 1).shape, (4, 1))
+
+    def test_read_wav_matches_pydub(self):
+        seg = Sine(440).to_audio_segment(duration=50).set_frame_rate(44100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sine.wav"
+            seg.export(str(path), format="wav").close()
+            samples, rate, width = numpy_audio.read_wav(path)
+        self.assertEqual(rate, 44100)
+        self.assertEqual(width, seg.sample_width)
+        self.assertEqual(numpy_audio.to_pcm(samples, width), seg.raw_data)
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestNumpyChainBuilder(unittest.TestCase):
+    """ChainBuilder(backend="numpy") output."""
+
+    def setUp(self):
+        self.samples = [
+            Sine(440).to_audio_segment(duration=150),
+            Sine(880).to_audio_segment(duration=50),
+        ]
+
+    def test_same_layout_as_pydub(self):
+        pydub_wav, pydub_map = ChainBuilder(100).build_chain(self.samples)
+        numpy_wav, numpy_map = ChainBuilder(100, backend="numpy").build_chain(self.samples)
+        pydub_bytes, numpy_bytes = pydub_wav.getvalue(), numpy_wav.getvalue()
+        self.assertEqual(pydub_map, numpy_map)
+        self.assertEqual(len(pydub_bytes), len(numpy_bytes))
+        # Headers and cue chunks are identical; only PCM rounding may differ
+        self.assertEqual(pydub_bytes[:44], numpy_bytes[:44])
+        a = np.frombuffer(_data_chunk(pydub_bytes), dtype='<i2').astype(np.int32)
+        b = np.frombuffer(_data_chunk(numpy_bytes), dtype='<i2').astype(np.int32)
+        self.assertLess(np.abs(a - b).max(), 600)
+
+    def test_wav_paths_use_stdlib_decoder(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.wav"
+            self.samples[0].set_frame_rate(22050).export(str(path), format="wav").close()
+            wav, _ = ChainBuilder(100, backend="numpy").build_chain([path])
+        result = AudioSegment.from_wav(wav)
+        self.assertEqual(result.frame_rate, 44100)
+        self.assertEqual(result.frame_count(), 4410)
+
+    def test_write_chain_matches_build_chain(self):
+        builder = ChainBuilder(100, backend="numpy")
+        wav, _ = builder.build_chain(self.samples)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "chain.wav"
+            builder.write_chain(self.samples, path)
+            self.assertEqual(path.read_bytes(), wav.getvalue())
+
+    def test_invalid_sample_type(self):
+        with self.assertRaises(TypeError):
+            ChainBuilder(100, backend="numpy").build_chain([123])
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            ChainBuilder(100, backend="scipy")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for OnsetSlicer."""
+
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+try:
+    import numpy as np
+    from m8.tools.onset_slicer import OnsetSlicer
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from m8.tools.wav_cues import read_cues
+
+FRAME_RATE = 44100
+ONSETS = [0, 11025, 30000, 52000, 80000]
+
+
+def _write_hits(path, onsets, total, channels=1):
+    """Decaying noise bursts at `onsets` over silence."""
+    rng = np.random.default_rng(1)
+    signal = np.zeros(total, dtype=np.float32)
+    decay = np.exp(-np.arange(4000) / 600.0).astype(np.float32)
+    for pos in onsets:
+        n = min(len(decay), total - pos)
+        signal[pos:pos + n] += 0.8 * decay[:n] * rng.uniform(-1, 1, n).astype(np.float32)
+    pcm = np.round(np.repeat(signal[:, None], channels, axis=1) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(FRAME_RATE)
+        w.writeframes(pcm.tobytes())
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestOnsetSlicer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "hits.wav"
+        _write_hits(self.path, ONSETS, 100000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertNear(self, points, expected, tolerance=256):
+        self.assertEqual(len(points), len(expected), points)
+        for p, e in zip(points, expected):
+            self.assertLessEqual(abs(p - e), tolerance, (points, expected))
+
+    def test_detects_hits(self):
+        self.assertNear(OnsetSlicer().detect(self.path), ONSETS)
+
+    def test_block_size_does_not_change_result(self):
+        big = OnsetSlicer(block_frames=1 << 20).detect(self.path)
+        small = OnsetSlicer(block_frames=1000).detect(self.path)
+        self.assertEqual(big, small)
+
+    def test_stereo(self):
+        stereo = Path(self.tmp.name) / "stereo.wav"
+        _write_hits(stereo, ONSETS, 100000, channels=2)
+        self.assertNear(OnsetSlicer().detect(stereo), ONSETS)
+
+    def test_min_gap(self):
+        points = OnsetSlicer(min_gap_ms=500).detect(self.path)
+        self.assertNear(points, [0, 30000, 52000, 80000])
+
+    def test_max_slices_keeps_start(self):
+        points = OnsetSlicer(max_slices=3).detect(self.path)
+        self.assertEqual(len(points), 3)
+        self.assertEqual(points[0], 0)
+        self.assertEqual(points, sorted(points))
+
+    def test_silence(self):
+        silent = Path(self.tmp.name) / "silent.wav"
+        _write_hits(silent, [], 20000)
+        self.assertEqual(OnsetSlicer().detect(silent), [0])
+        self.assertEqual(OnsetSlicer(include_start=False).detect(silent), [])
+
+    def test_slice_file_writes_cues(self):
+        out = Path(self.tmp.name) / "out.wav"
+        points = OnsetSlicer().slice_file(self.path, out)
+        info = read_cues(out)
+        self.assertEqual(info.standard_points, points)
+        self.assertEqual(info.m8_points, points)
+        self.assertEqual(info.frames, 100000)
+
+    def test_slice_file_in_place(self):
+        points = OnsetSlicer().slice_file(self.path)
+        self.assertEqual(read_cues(self.path).slice_points, points)
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            OnsetSlicer(frame_size=256, hop=512)
+
+
+if __name__ == '__main__':
+    unittest.main()
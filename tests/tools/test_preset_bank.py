@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the packed preset bank."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from m8.api.instrument import M8Instrument, M8InstrumentType
+from m8.api.instruments.fmsynth import M8FMSynth
+from m8.api.instruments.sampler import M8Sampler
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.version import M8Version
+from m8.tools.preset_bank import PresetBank, write_bank
+
+
+class TestPresetBank(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "bank.m8bank"
+        self.presets = {
+            "KICK 01": M8Sampler(name="KICK", sample_path="kick.wav"),
+            "LEAD": M8Wavsynth(name="LEAD"),
+            "BELL": M8FMSynth(name="BELL"),
+            "ÉCHO": M8Wavsynth(name="ECHO"),
+        }
+        write_bank(self.path, self.presets,
+                   tags={"KICK 01": ["drum", "808"], "BELL": ["808"]},
+                   version=M8Version(4, 1, 0))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_by_key(self):
+        with PresetBank(self.path) as bank:
+            self.assertEqual(len(bank), 4)
+            self.assertEqual(bank.keys(), sorted(self.presets, key=lambda k: k.encode()))
+            for key, instrument in self.presets.items():
+                self.assertIn(key, bank)
+                self.assertEqual(bank.block(key), bytes(instrument.write()))
+                self.assertEqual(bank.instrument(key).to_dict(), instrument.to_dict())
+            self.assertNotIn("MISSING", bank)
+            with self.assertRaises(KeyError):
+                bank.instrument("MISSING")
+
+    def test_instrument_dispatches_on_type(self):
+        with PresetBank(self.path) as bank:
+            self.assertIsInstance(bank.instrument("BELL"), M8FMSynth)
+            self.assertEqual(bank.version("BELL").write(), M8Version(4, 1, 0).write())
+            copy = bank.instrument("LEAD")
+            copy.name = "EDITED"
+            self.assertEqual(bank.instrument("LEAD").name, "LEAD")
+
+    def test_type_and_tag_index(self):
+        with PresetBank(self.path) as bank:
+            self.assertEqual(bank.type_id("BELL"), int(M8InstrumentType.FMSYNTH))
+            self.assertEqual(bank.of_type(M8InstrumentType.WAVSYNTH), ["LEAD", "ÉCHO"])
+            self.assertEqual(bank.tags("KICK 01"), ["drum", "808"])
+            self.assertEqual(bank.tags("LEAD"), [])
+            self.assertEqual(bank.with_tag("808"), ["BELL", "KICK 01"])
+
+    def test_mixed_firmware_versions(self):
+        old = M8Wavsynth(name="OLD")
+        old.version = M8Version(4, 0, 33)
+        new = M8FMSynth(name="NEW")
+        new.version = M8Version(6, 2, 1)
+        write_bank(self.path, {"OLD": old, "NEW": new})
+        with PresetBank(self.path) as bank:
+            self.assertEqual(bank.version("OLD"), (4, 0, 33))
+            self.assertEqual(bank.instrument("OLD").version, (4, 0, 33))
+            self.assertEqual(bank.instrument("NEW").version, (6, 2, 1))
+
+    def test_invalid_keys_rejected(self):
+        with self.assertRaises(ValueError):
+            write_bank(self.path, {"X" * 33: M8Wavsynth()})
+        with self.assertRaises(ValueError):
+            write_bank(self.path, [("A", M8Wavsynth()), ("A", M8Sampler())])
+        with self.assertRaises(ValueError):
+            write_bank(self.path, {"A": M8Wavsynth()}, tags={"A": ["a,b"]})
+        # The existing bank is left untouched
+        with PresetBank(self.path) as bank:
+            self.assertEqual(len(bank), 4)
+
+    def test_not_a_bank(self):
+        other = Path(self.tmp.name) / "other.m8bank"
+        other.write_bytes(b"M8VERSION\x00" + b"\x00" * 64)
+        with self.assertRaises(ValueError):
+            PresetBank(other)
+
+    def test_base_read_dispatches(self):
+        data = bytes(M8FMSynth(name="FM").write())
+        self.assertIsInstance(M8Instrument.read(data), M8FMSynth)
+        with self.assertRaises(ValueError):
+            M8Instrument.read(b"\xEE" + data[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests for the reference-integrity checker."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from m8.api.chain import M8ChainStep
+from m8.api.fx import M8FXTuple, M8MixerFX, M8SequenceFX
+from m8.api.instruments.sampler import M8Sampler
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.phrase import M8Note, M8PhraseStep
+from m8.api.project import M8Project
+from m8.tools.reference_check import (
+    DEFAULT_EQ_REF, DEFAULT_TABLE_REF, EMPTY_CHAIN_REF, EMPTY_INSTRUMENT_REF_KIND,
+    EMPTY_PHRASE_REF, FX_TYPE, check_library, check_references,
+)
+
+
+def _project():
+    """Song row 0 col 0 → chain 0 → phrase 0 → wavsynth 0."""
+    project = M8Project.initialise()
+    project.instruments[0] = M8Wavsynth(name="W")
+    project.phrases[0][0] = M8PhraseStep(note=M8Note.C_4, velocity=0x60, instrument=0)
+    project.chains[0][0] = M8ChainStep(phrase=0)
+    project.song[0][0] = 0
+    return project
+
+
+class TestCheckReferences(unittest.TestCase):
+
+    def test_clean_project(self):
+        self.assertEqual(check_references(_project()), [])
+
+    def test_empty_targets(self):
+        p = _project()
+        p.song[1][2] = 9                              # chain 9 is empty
+        p.chains[0][1] = M8ChainStep(phrase=5)         # phrase 5 is empty
+        p.phrases[0][1] = M8PhraseStep(note=M8Note.C_4, velocity=0x60, instrument=7)
+        issues = check_references(p)
+        self.assertEqual(
+            [(i.kind, i.location, i.target) for i in issues],
+            [
+                (EMPTY_CHAIN_REF, "song row 1 col 2", 9),
+                (EMPTY_PHRASE_REF, "chain 0 step 1", 5),
+                (EMPTY_INSTRUMENT_REF_KIND, "phrase 0 step 1", 7),
+            ],
+        )
+
+    def test_unreachable_content_ignored(self):
+        p = _project()
+        p.chains[3][0] = M8ChainStep(phrase=40)        # chain 3 not in the song
+        self.assertEqual(check_references(p), [])
+
+    def test_fx_reference_targets(self):
+        p = _project()
+        fx = p.phrases[0][0].fx
+        fx[0] = M8FXTuple(key=int(M8SequenceFX.TBL), value=50)
+        fx[1] = M8FXTuple(key=int(M8MixerFX.EQI), value=20)
+        fx[2] = M8FXTuple(key=int(M8MixerFX.INS), value=3)
+        kinds = [(i.kind, i.location, i.target) for i in check_references(p)]
+        self.assertEqual(kinds, [
+            (DEFAULT_TABLE_REF, "phrase 0 step 0 fx1", 50),
+            (DEFAULT_EQ_REF, "phrase 0 step 0 fx2", 20),
+            (EMPTY_INSTRUMENT_REF_KIND, "phrase 0 step 0 fx3", 3),
+        ])
+
+        p.tables[50][0].transpose = 12
+        p.instruments[3] = M8Sampler(name="S")
+        self.assertEqual([i.kind for i in check_references(p)], [DEFAULT_EQ_REF])
+
+    def test_fx_type_uses_playing_instrument(self):
+        p = _project()
+        # Step 2 has no instrument: its FX belong to the wavsynth from step 0
+        p.phrases[0][2].fx[0] = M8FXTuple(key=0xB0, value=1)
+        # Instrument 0's table is checked against instrument 0
+        p.tables[0][0].fx[0] = M8FXTuple(key=0xC0, value=1)
+        p.phrases[0][3].fx[0] = M8FXTuple(key=0x8C, value=1)   # LIM: fine
+        issues = check_references(p)
+        self.assertEqual([(i.kind, i.location) for i in issues], [
+            (FX_TYPE, "phrase 0 step 2 fx1"),
+            (FX_TYPE, "table 0 step 0 fx1"),
+        ])
+        self.assertIn("wavsynth instrument 0", issues[0].message)
+
+
+class TestCheckLibrary(unittest.TestCase):
+
+    def test_summary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            clean = Path(tmp) / "clean.m8s"
+            broken = Path(tmp) / "broken.m8s"
+            bad = Path(tmp) / "bad.m8s"
+            _project().write_to_file(str(clean))
+            p = _project()
+            p.song[0][1] = 4
+            p.song[0][2] = 5
+            p.write_to_file(str(broken))
+            bad.write_bytes(b"not a project")
+
+            report = check_library([clean, broken, bad])
+            self.assertEqual(report.checked, 3)
+            self.assertEqual(report.issues[clean], [])
+            self.assertEqual(len(report.issues[broken]), 2)
+            self.assertIn(bad, report.errors)
+            self.assertEqual(report.counts()[EMPTY_CHAIN_REF], 2)
+            self.assertEqual(report.projects_with(EMPTY_CHAIN_REF), [broken])
+            summary = report.summary()
+            self.assertIn("3 projects checked, 1 with issues, 1 unreadable", summary)
+            self.assertIn("empty-chain", summary)
+
+            parallel = check_library([clean, broken, bad], workers=2)
+            self.assertEqual(parallel.issues, report.issues)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Tests for the project sample bundler."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from m8.api.instruments.sampler import M8Sampler
+from m8.api.instruments.wavsynth import M8Wavsynth
+from m8.api.project import M8Project
+from m8.tools.sample_bundle import (
+    bundle_samples, collect_sample_refs, project_base_dir, resolve_sample_path,
+)
+
+
+class TestSampleBundle(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.card = Path(self.tmp.name) / "card"
+        self.bundle = Path(self.tmp.name) / "bundle"
+        song_dir = self.card / "Songs" / "live"
+        (self.card / "Samples" / "drums").mkdir(parents=True)
+        (song_dir / "samples").mkdir(parents=True)
+        (self.card / "Samples" / "drums" / "kick.wav").write_bytes(b"kick")
+        (self.card / "Samples" / "drums" / "snare.wav").write_bytes(b"snare")
+        (song_dir / "samples" / "kick.wav").write_bytes(b"other kick")
+        (song_dir / "samples" / "kick-copy.wav").write_bytes(b"kick")
+
+        self.p1 = M8Project.initialise()
+        self.p1.metadata.directory = "/Songs/live/"
+        self.p1.instruments[0] = M8Sampler(name="K", sample_path="/Samples/drums/kick.wav")
+        self.p1.instruments[1] = M8Sampler(name="K2", sample_path="samples/kick.wav")
+        self.p1.instruments[2] = M8Wavsynth(name="W")
+        self.p1.instruments[3] = M8Sampler(name="X", sample_path="/Samples/gone.wav")
+
+        self.p2 = M8Project.initialise()
+        self.p2.metadata.directory = "/Songs/live/"
+        self.p2.instruments[0] = M8Sampler(name="S", sample_path="/Samples/drums/snare.wav")
+        self.p2.instruments[5] = M8Sampler(name="K3", sample_path="samples/kick-copy.wav")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resolve(self):
+        self.assertEqual(resolve_sample_path("/Samples/a.wav", "base", self.card),
+                         self.card / "Samples" / "a.wav")
+        self.assertEqual(resolve_sample_path("a.wav", Path("base")), Path("base") / "a.wav")
+        self.assertIsNone(resolve_sample_path("/Samples/a.wav", "base"))
+        self.assertEqual(project_base_dir(self.p1, self.card), self.card / "Songs" / "live")
+
+    def test_collect(self):
+        refs = collect_sample_refs([self.p1, self.p2], card_root=self.card)
+        self.assertEqual([(r.project, r.instrument) for r in refs],
+                         [(0, 0), (0, 1), (0, 3), (1, 0), (1, 5)])
+        self.assertEqual(refs[1].source, self.card / "Songs" / "live" / "samples" / "kick.wav")
+
+    def test_bundle_copies_each_content_once(self):
+        result = bundle_samples([self.p1, self.p2], self.bundle, card_root=self.card,
+                                sample_prefix="/Samples/bundle", workers=4)
+        names = sorted(p.name for p in self.bundle.iterdir())
+        # kick.wav and kick-copy.wav share content; the song's own kick.wav
+        # clashes by name and gets a hash suffix
+        self.assertEqual(len(names), 3)
+        self.assertIn("kick.wav", names)
+        self.assertIn("snare.wav", names)
+        self.assertEqual(len(result.files), 3)
+        self.assertEqual([(r.project, r.instrument) for r in result.missing], [(0, 3)])
+
+        self.assertEqual(self.p1.instruments[0].sample_path, "/Samples/bundle/kick.wav")
+        self.assertEqual(self.p2.instruments[5].sample_path, "/Samples/bundle/kick.wav")
+        other = self.p1.instruments[1].sample_path
+        self.assertTrue(other.startswith("/Samples/bundle/kick-"))
+        self.assertEqual((self.bundle / Path(other).name).read_bytes(), b"other kick")
+        self.assertEqual(self.p1.instruments[3].sample_path, "/Samples/gone.wav")
+        self.assertEqual(result.rewritten, 4)
+
+    def test_bundle_from_files_and_hardlinks(self):
+        path = self.card / "Songs" / "live" / "set.m8s"
+        self.p1.metadata.directory = ""
+        self.p1.write_to_file(str(path))
+        result = bundle_samples([path], self.bundle, card_root=self.card, link=True)
+        self.assertEqual(result.project_paths, [path])
+        bundled = self.bundle / "kick.wav"
+        self.assertEqual(os.stat(bundled).st_ino,
+                         os.stat(self.card / "Samples" / "drums" / "kick.wav").st_ino)
+        # Without sample_prefix nothing is rewritten
+        self.assertEqual(result.rewritten, 0)
+
+    def test_rerun_does_not_reuse_stale_file(self):
+        self.bundle.mkdir()
+        (self.bundle / "snare.wav").write_bytes(b"an older snare")
+        bundle_samples([self.p2], self.bundle, card_root=self.card,
+                       sample_prefix="/Samples/bundle")
+        new_name = Path(self.p2.instruments[0].sample_path).name
+        self.assertNotEqual(new_name, "snare.wav")
+        self.assertEqual((self.bundle / new_name).read_bytes(), b"snare")
+        self.assertEqual((self.bundle / "snare.wav").read_bytes(), b"an older snare")
+
+    def test_path_too_long(self):
+        with self.assertRaises(ValueError):
+            bundle_samples([self.p1], self.bundle, card_root=self.card,
+                           sample_prefix="/" + "x" * 130)
+        self.assertEqual(list(self.bundle.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Tests for SampleCache."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pydub.generators import Sine
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from m8.tools.chain_builder import ChainBuilder, PydubSlices
+from m8.tools.sample_cache import SampleCache
+
+
+class TestSampleCache(unittest.TestCase):
+    """Entry storage, keys and eviction."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.cache = SampleCache(self.root / "cache")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _wav(self, name, freq=440, duration=50):
+        path = self.root / name
+        Sine(freq).to_audio_segment(duration=duration).export(str(path), format="wav").close()
+        return path
+
+    def test_put_get_round_trip(self):
+        raw = bytes(range(256)) * 4
+        self.cache.put("ab" * 32, raw, 44100, 2, 2)
+        self.assertIn("ab" * 32, self.cache)
+        self.assertEqual(self.cache.get("ab" * 32), (raw, 44100, 2, 2))
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.get("cd" * 32))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_key_depends_on_content_and_params(self):
+        a = self._wav("a.wav", 440)
+        b = self._wav("b.wav", 440)
+        c = self._wav("c.wav", 880)
+        self.assertEqual(self.cache.key(a, 44100, 100), self.cache.key(b, 44100, 100))
+        self.assertNotEqual(self.cache.key(a, 44100, 100), self.cache.key(c, 44100, 100))
+        self.assertNotEqual(self.cache.key(a, 44100, 100), self.cache.key(a, 48000, 100))
+
+    def test_segment_key(self):
+        seg = Sine(440).to_audio_segment(duration=20)
+        self.assertEqual(self.cache.key(seg, 1), self.cache.key(seg[:], 1))
+        with self.assertRaises(TypeError):
+            self.cache.key(123, 1)
+
+    def test_lru_eviction(self):
+        cache = SampleCache(self.root / "small", max_bytes=2500)
+        keys = [f"{i:02x}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, bytes(1000), 44100, 1, 2)
+            path = cache._path(key)
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+            if i == 1:
+                # Touch the first entry so the second becomes the oldest
+                cache.get(keys[0])
+        self.assertIn(keys[0], cache)
+        self.assertNotIn(keys[1], cache)
+        self.assertIn(keys[2], cache)
+        self.assertLessEqual(cache.total_bytes(), 2500)
+
+    def test_clear(self):
+        self.cache.put("ef" * 32, bytes(100), 44100, 1, 2)
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertEqual(self.cache.total_bytes(), 0)
+
+
+class TestChainBuilderCache(unittest.TestCase):
+    """ChainBuilder(cache=...) integration."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.paths = []
+        for i, freq in enumerate((220, 330, 440)):
+            path = self.root / f"s{i}.wav"
+            Sine(freq).to_audio_segment(duration=80).export(str(path), format="wav").close()
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_build_skips_decoding(self):
+        cache = SampleCache(self.root / "cache")
+        uncached, _ = ChainBuilder(slice_duration_ms=50).build_chain(self.paths)
+        first, _ = ChainBuilder(slice_duration_ms=50, cache=cache).build_chain(self.paths)
+        self.assertEqual(cache.misses, 3)
+
+        with mock.patch.object(PydubSlices, "prepare", side_effect=AssertionError("decoded")):
+            second, _ = ChainBuilder(slice_duration_ms=50, cache=cache).build_chain(self.paths)
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(first.getvalue(), uncached.getvalue())
+        self.assertEqual(second.getvalue(), uncached.getvalue())
+
+    @unittest.skipUnless(numpy is not None, "numpy not installed")
+    def test_numpy_hit_matches_miss_for_8bit(self):
+        paths = []
+        for i, path in enumerate(self.paths):
+            path8 = self.root / f"s{i}-8bit.wav"
+            Sine(110 * (i + 1), sample_rate=22050).to_audio_segment(duration=80) \
+                .set_sample_width(1).export(str(path8), format="wav").close()
+            paths.append(path8)
+        cache = SampleCache(self.root / "cache")
+
+        def build(**kwargs):
+            builder = ChainBuilder(slice_duration_ms=50, backend="numpy", **kwargs)
+            return builder.build_chain(paths)[0].getvalue()
+
+        uncached = build()
+        miss = build(cache=cache)
+        hit = build(cache=cache)
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(miss, uncached)
+        self.assertEqual(hit, miss)
+
+    def test_params_are_part_of_key(self):
+        cache = SampleCache(self.root / "cache")
+        ChainBuilder(slice_duration_ms=50, cache=cache).build_chain(self.paths)
+        ChainBuilder(slice_duration_ms=60, cache=cache).build_chain(self.paths)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
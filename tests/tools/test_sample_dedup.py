@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for perceptual sample deduplication."""
+
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+from pydub import AudioSegment
+
+try:
+    import numpy as np
+    from m8.tools.sample_dedup import (
+        dedupe, dedupe_project_samples, find_duplicates, fingerprint, group_fingerprints,
+    )
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from m8.api.instruments.sampler import M8Sampler
+from m8.api.project import M8Project
+from m8.tools.chain_builder import ChainBuilder
+
+
+def _kick(freq=55.0, seconds=0.3, rate=44100, seed=0):
+    t = np.arange(int(seconds * rate)) / rate
+    sweep = freq * (1 + 3 * np.exp(-t * 40))
+    rng = np.random.default_rng(seed)
+    click = rng.uniform(-1, 1, len(t)) * np.exp(-t * 300) * 0.3
+    return (np.sin(2 * np.pi * np.cumsum(sweep) / rate) * np.exp(-t * 8) + click) * 0.8
+
+
+def _hat(seconds=0.1, rate=44100, seed=1):
+    t = np.arange(int(seconds * rate)) / rate
+    noise = np.random.default_rng(seed).uniform(-1, 1, len(t))
+    return np.diff(noise, prepend=0.0) * np.exp(-t * 40) * 0.4
+
+
+def _write(path, signal, rate=44100, width=2, channels=1, lead_silence=0):
+    signal = np.concatenate([np.zeros(lead_silence), signal])
+    scale = float(1 << (8 * width - 1)) - 1
+    ints = np.round(np.repeat(signal[:, None], channels, axis=1) * scale)
+    if width == 2:
+        raw = ints.astype('<i2').tobytes()
+    else:
+        raw = ints.astype('<i4').reshape(-1).view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        w.writeframes(raw)
+    return path
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestSampleDedup(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.root = root
+        self.kick = _write(root / "kick.wav", _kick())
+        # Same sound: quieter, 48 kHz, 24-bit stereo, with leading silence
+        kick_48k = _kick(rate=48000) * 0.5
+        self.kick_variant = _write(root / "BD 01.wav", kick_48k, rate=48000, width=3,
+                                   channels=2, lead_silence=200)
+        self.kick_copy = root / "kick copy.wav"
+        self.kick_copy.write_bytes(self.kick.read_bytes())
+        self.other_kick = _write(root / "kick2.wav", _kick(freq=90, seconds=0.25, seed=5))
+        self.hat = _write(root / "hat.wav", _hat())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fingerprint_invariant_to_format(self):
+        a, b = fingerprint(self.kick), fingerprint(self.kick_variant)
+        self.assertLessEqual(a.distance(b), 4)
+        self.assertAlmostEqual(a.duration, b.duration, delta=0.01)
+
+    def test_different_sounds_far_apart(self):
+        a = fingerprint(self.kick)
+        self.assertGreater(a.distance(fingerprint(self.other_kick)), 20)
+        similar = _write(self.root / "kick3.wav", _kick(freq=60, seed=3))
+        self.assertGreater(a.distance(fingerprint(similar)), 20)
+        self.assertGreater(a.distance(fingerprint(self.hat)), 20)
+
+    def test_fingerprint_segment(self):
+        seg = AudioSegment.from_wav(str(self.kick))
+        self.assertEqual(fingerprint(seg), fingerprint(self.kick))
+
+    def test_dedupe(self):
+        samples = [self.kick, self.hat, self.kick_variant, self.other_kick, self.kick_copy]
+        unique, index_map = dedupe(samples)
+        self.assertEqual(unique, [self.kick, self.hat, self.other_kick])
+        self.assertEqual(index_map, {0: 0, 1: 1, 2: 0, 3: 2, 4: 0})
+
+    def test_dedupe_parallel(self):
+        samples = [self.kick, self.hat, self.kick_variant, self.other_kick]
+        self.assertEqual(dedupe(samples, workers=2), dedupe(samples))
+
+    def test_find_duplicates(self):
+        groups = find_duplicates([self.hat, self.kick, self.kick_variant])
+        self.assertEqual(groups, [[self.kick, self.kick_variant]])
+
+    def test_max_distance_limit(self):
+        with self.assertRaises(ValueError):
+            group_fingerprints([], max_distance=16)
+
+    def test_chain_builder_dedupe(self):
+        samples = [self.kick, self.hat, self.kick_variant]
+        builder = ChainBuilder(slice_duration_ms=100, dedupe=True)
+        wav, mapping = builder.build_chain(samples)
+        self.assertEqual(mapping, {0: 0, 1: 1, 2: 0})
+        self.assertEqual(AudioSegment.from_wav(wav).frame_count(), 2 * 4410)
+
+    def test_dedupe_project_samples(self):
+        project = M8Project.initialise()
+        project.instruments[0] = M8Sampler(name="K0", sample_path="kick.wav")
+        project.instruments[1] = M8Sampler(name="K1", sample_path="BD 01.wav")
+        project.instruments[2] = M8Sampler(name="H0", sample_path="hat.wav")
+        project.instruments[3] = M8Sampler(name="X", sample_path="missing.wav")
+        project.instruments[4] = M8Sampler(name="K2", sample_path="/Samples/kick.wav")
+        changes = dedupe_project_samples(project, base_dir=self.root)
+        self.assertEqual(changes, {1: ("BD 01.wav", "kick.wav")})
+        self.assertEqual(project.instruments[1].sample_path, "kick.wav")
+        self.assertEqual(project.instruments[3].sample_path, "missing.wav")
+
+        # Absolute M8 paths resolve under the card root
+        card = self.root / "card"
+        (card / "Samples").mkdir(parents=True)
+        (card / "Samples" / "kick.wav").write_bytes(self.kick.read_bytes())
+        changes = dedupe_project_samples(project, base_dir=self.root, card_root=card)
+        self.assertEqual(changes, {4: ("/Samples/kick.wav", "kick.wav")})
+
+
+if __name__ == '__main__':
+    unittest.main()
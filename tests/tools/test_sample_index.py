@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Tests for SampleIndex."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+try:
+    import numpy as np
+    from m8.tools import sample_index
+    from m8.tools.sample_index import SampleIndex, classify
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+FRAME_RATE = 44100
+
+
+def _write_tone(path, freq, seconds, amplitude=0.5, noise=False):
+    t = np.arange(int(seconds * FRAME_RATE)) / FRAME_RATE
+    if noise:
+        signal = np.random.default_rng(0).uniform(-1, 1, len(t)) * amplitude
+    else:
+        signal = amplitude * np.sin(2 * np.pi * freq * t)
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(FRAME_RATE)
+        w.writeframes(np.round(signal * 32767).astype('<i2').tobytes())
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestSampleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "lib"
+        (self.root / "drums").mkdir(parents=True)
+        _write_tone(self.root / "drums" / "kick_low.wav", 60, 0.2)
+        _write_tone(self.root / "drums" / "BD_high.wav", 400, 0.25)
+        _write_tone(self.root / "drums" / "kick_long.wav", 80, 0.6)
+        _write_tone(self.root / "drums" / "hh_open.wav", 0, 0.1, amplitude=0.3, noise=True)
+        _write_tone(self.root / "pad.wav", 220, 0.5)
+        self.index = SampleIndex(Path(self.tmp.name) / "index.sqlite")
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_classify(self):
+        self.assertEqual(classify("909 Kick.wav"), "kick")
+        self.assertEqual(classify("CL_01.wav"), "snare")
+        self.assertIsNone(classify("pad.wav"))
+
+    def test_refresh_and_features(self):
+        stats = self.index.refresh(self.root)
+        self.assertEqual(stats['added'], 5)
+        self.assertEqual(stats['analysed'], 5)
+        self.assertEqual(len(self.index), 5)
+        pad = self.index.query(category=None, order_by='path')[-1]
+        self.assertEqual(pad.path.name, "pad.wav")
+        self.assertAlmostEqual(pad.duration, 0.5, places=3)
+        self.assertAlmostEqual(pad.peak, 0.5, places=2)
+        self.assertAlmostEqual(pad.rms, 0.5 / np.sqrt(2), places=2)
+        self.assertAlmostEqual(pad.pitch, 220, delta=3)
+        hat = self.index.query(category="hat")[0]
+        self.assertIsNone(hat.pitch)
+        self.assertGreater(hat.centroid, 5000)
+
+    def test_query_darkest_short_kicks(self):
+        self.index.refresh(self.root)
+        kicks = self.index.query(category="kick", max_duration=0.3, order_by="centroid", limit=50)
+        self.assertEqual([k.path.name for k in kicks], ["kick_low.wav", "BD_high.wav"])
+        brightest = self.index.query(category="kick", order_by="centroid", descending=True, limit=1)
+        self.assertEqual(brightest[0].path.name, "BD_high.wav")
+        self.assertEqual(self.index.categories(), {"kick": 3, "hat": 1, None: 1})
+
+    def test_query_under_and_invalid_order(self):
+        self.index.refresh(self.root)
+        self.assertEqual(len(self.index.query(under=self.root / "drums")), 4)
+        with self.assertRaises(ValueError):
+            self.index.query(order_by="duration; DROP TABLE files")
+
+    def test_incremental_refresh(self):
+        self.index.refresh(self.root)
+        with mock.patch.object(sample_index, "analyse", side_effect=AssertionError("re-analysed")):
+            stats = self.index.refresh(self.root)
+        self.assertEqual(stats['unchanged'], 5)
+
+        # A copy under a new name reuses the features of the same content
+        shutil.copy(self.root / "pad.wav", self.root / "pad_copy.wav")
+        with mock.patch.object(sample_index, "analyse", side_effect=AssertionError("re-analysed")):
+            stats = self.index.refresh(self.root)
+        self.assertEqual((stats['added'], stats['analysed']), (1, 0))
+
+        os.remove(self.root / "pad_copy.wav")
+        _write_tone(self.root / "pad.wav", 440, 0.5)
+        stats = self.index.refresh(self.root)
+        self.assertEqual((stats['removed'], stats['updated'], stats['analysed']), (1, 1, 1))
+        pad = [s for s in self.index.query() if s.path.name == "pad.wav"][0]
+        self.assertAlmostEqual(pad.pitch, 440, delta=5)
+
+    def test_parallel_refresh(self):
+        stats = self.index.refresh(self.root, workers=2)
+        self.assertEqual(stats['analysed'], 5)
+
+    def test_undecodable_file_recorded(self):
+        (self.root / "broken.wav").write_bytes(b"RIFF----WAVEjunk")
+        self.index.refresh(self.root)
+        self.assertEqual(len(self.index), 5)
+        self.assertIn(self.root.resolve() / "broken.wav", self.index.errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@ import shutil
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 
@@ -19,6 +20,7 @@ from unittest import mock
 _SYNC_PATH = pathlib.Path(__file__).parent.parent.parent / "tools" / "sync.py"
 _spec = importlib.util.spec_from_file_location("sync", _SYNC_PATH)
 sync = importlib.util.module_from_spec(_spec)
+sys.modules["sync"] = sync  # dataclasses resolve annotations via sys.modules
 _spec.loader.exec_module(sync)
 
 
@@ -136,18 +138,64 @@ class TestPush(SyncTestBase):
         self.assertTrue((target / "samples" / "kick.wav").exists())
         self.assertTrue((target / "samples" / "snare.wav").exists())
 
-    def test_skips_existing(self):
+    def test_updates_existing_without_clobbering(self):
         self.make_local_demo("acid_909_sampler")
-        # Pre-existing remote entry should not be overwritten
+        # Stale remote copy gets updated; unknown files survive without --delete
         existing = self.make_remote_demo("acid-909-sampler")
         sentinel = existing / "sentinel.txt"
         sentinel.write_text("preserved")
 
         with contextlib.redirect_stdout(io.StringIO()) as out:
             sync.push(pattern=None, force=True, test_mode=True)
-        self.assertIn("already on device", out.getvalue())
+        self.assertIn("1 copied", out.getvalue())
+        self.assertEqual((existing / "acid_909_sampler.m8s").read_bytes(), b"\x00" * 16)
         self.assertTrue(sentinel.exists(), "push must not clobber existing target")
 
+    def test_second_push_copies_nothing(self):
+        self.make_local_demo("acid_909_sampler", wavs=["kick.wav"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.push(pattern=None, force=True, test_mode=True)
+
+        with mock.patch.object(sync, "copy_file") as copy_file, \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.push(pattern=None, force=True, test_mode=True)
+        copy_file.assert_not_called()
+        self.assertIn("up to date", out.getvalue())
+
+    def test_changed_file_is_pushed(self):
+        local = self.make_local_demo("acid_909_sampler", wavs=["kick.wav", "snare.wav"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.push(pattern=None, force=True, test_mode=True)
+
+        (local / "samples" / "kick.wav").write_bytes(b"RIFF\x01\x00\x00\x00WAVE")
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.push(pattern=None, force=True, test_mode=True)
+        self.assertIn("1 copied, 2 unchanged", out.getvalue())
+
+        target = self.test_volume / sync.REMOTE_SUBPATH / "acid-909-sampler"
+        self.assertEqual((target / "samples" / "kick.wav").read_bytes(),
+                         b"RIFF\x01\x00\x00\x00WAVE")
+        manifest = sync.load_manifest(target)
+        self.assertEqual(sorted(manifest),
+                         ["acid_909_sampler.m8s", "samples/kick.wav", "samples/snare.wav"])
+
+    def test_delete_removes_stale_files(self):
+        local = self.make_local_demo("acid_909_sampler", wavs=["kick.wav", "snare.wav"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.push(pattern=None, force=True, test_mode=True)
+        (local / "samples" / "snare.wav").unlink()
+        target = self.test_volume / sync.REMOTE_SUBPATH / "acid-909-sampler"
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.push(pattern=None, force=True, test_mode=True)
+        self.assertIn("1 stale", out.getvalue())
+        self.assertTrue((target / "samples" / "snare.wav").exists())
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.push(pattern=None, force=True, test_mode=True, delete=True)
+        self.assertFalse((target / "samples" / "snare.wav").exists())
+        self.assertNotIn("samples/snare.wav", sync.load_manifest(target))
+
     def test_pattern_filter(self):
         self.make_local_demo("acid_303_wavsynth")
         self.make_local_demo("euclid_sampler")
@@ -159,6 +207,242 @@ class TestPush(SyncTestBase):
         self.assertTrue((self.test_volume / sync.REMOTE_SUBPATH / "euclid-sampler").exists())
 
 
+class TestCopyEngine(SyncTestBase):
+    """Chunked, atomic, resumable copies (COPY_CHUNK_SIZE shrunk to 4 bytes)."""
+
+    def setUp(self):
+        super().setUp()
+        chunk = mock.patch.object(sync, "COPY_CHUNK_SIZE", 4)
+        chunk.start()
+        self.patches.append(chunk)
+        self.src = self.tmpdir / "src.wav"
+        self.src.write_bytes(bytes(range(40)))
+        self.target = self.tmpdir / "remote"
+        self.target.mkdir()
+        self.dst = self.target / "samples" / "src.wav"
+
+    def test_copy_is_atomic_and_reports_throughput(self):
+        journal = sync.PushJournal(self.target)
+        result = sync.copy_file(self.src, self.dst, "abc", journal)
+        self.assertEqual(self.dst.read_bytes(), self.src.read_bytes())
+        self.assertFalse(self.dst.with_name("src.wav.part").exists())
+        self.assertFalse((self.target / sync.JOURNAL_NAME).exists())
+        self.assertEqual((result.size, result.written), (40, 40))
+        self.assertIn("MB/s", result.describe())
+
+    def test_resumes_interrupted_copy(self):
+        part = self.dst.with_name("src.wav.part")
+        part.parent.mkdir()
+        part.write_bytes(bytes(range(22)))      # 5 whole chunks + a torn one
+        sync.PushJournal(self.target).begin(self.dst, "abc")
+
+        result = sync.copy_file(self.src, self.dst, "abc", sync.PushJournal(self.target))
+        self.assertEqual(self.dst.read_bytes(), self.src.read_bytes())
+        self.assertTrue(result.resumed)
+        self.assertEqual(result.written, 20)
+        self.assertIn("resumed", result.describe())
+
+    def test_part_of_other_content_is_discarded(self):
+        part = self.dst.with_name("src.wav.part")
+        part.parent.mkdir()
+        part.write_bytes(b"\xff" * 20)
+        sync.PushJournal(self.target).begin(self.dst, "old-hash")
+
+        result = sync.copy_file(self.src, self.dst, "abc", sync.PushJournal(self.target))
+        self.assertEqual(self.dst.read_bytes(), self.src.read_bytes())
+        self.assertFalse(result.resumed)
+
+    def test_corrupt_tail_restarts(self):
+        part = self.dst.with_name("src.wav.part")
+        part.parent.mkdir()
+        part.write_bytes(bytes(range(16)) + b"\x00" * 4)
+        sync.PushJournal(self.target).begin(self.dst, "abc")
+
+        result = sync.copy_file(self.src, self.dst, "abc", sync.PushJournal(self.target))
+        self.assertEqual(self.dst.read_bytes(), self.src.read_bytes())
+        self.assertEqual(result.written, 40)
+
+    def test_push_resumes_after_failure(self):
+        self.make_local_demo("acid_909_sampler", wavs=["kick.wav", "snare.wav"])
+        target = self.test_volume / sync.REMOTE_SUBPATH / "acid-909-sampler"
+        real_copy = sync.copy_file
+
+        def flaky(src, dst, *args):
+            if src.name == "snare.wav":
+                raise OSError("device disconnected")
+            return real_copy(src, dst, *args)
+
+        with mock.patch.object(sync, "copy_file", flaky), \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.push(pattern=None, force=True, test_mode=True)
+        self.assertIn("1 FAILED", out.getvalue())
+        self.assertIn("samples/kick.wav", sync.load_manifest(target))
+        self.assertNotIn("samples/snare.wav", sync.load_manifest(target))
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.push(pattern=None, force=True, test_mode=True)
+        self.assertIn("1 copied, 2 unchanged", out.getvalue())
+        self.assertIn("MB/s", out.getvalue())
+        self.assertTrue((target / "samples" / "snare.wav").exists())
+
+
+class TestWatch(SyncTestBase):
+    def make_valid_demo(self, name, *, wavs=()):
+        from m8.api.project import M8Project
+        d = self.make_local_demo(name, wavs=wavs)
+        M8Project.initialise().write_to_file(str(d / f"{name}.m8s"))
+        return d
+
+    def test_poll_debounces_changes(self):
+        demo = self.make_local_demo("acid_909_sampler", wavs=["kick.wav"])
+        watcher = sync.DemoWatcher(debounce=2.0)
+        self.assertEqual(watcher.poll(0.0), [])
+        self.assertEqual(watcher.poll(1.0), [])
+        self.assertEqual(watcher.poll(2.5), [demo])
+        self.assertEqual(watcher.poll(10.0), [])
+
+        (demo / "samples" / "kick.wav").write_bytes(b"RIFF\x00\x00\x00\x00WAVEmore")
+        self.assertEqual(watcher.poll(11.0), [])
+        (demo / "samples" / "kick.wav").write_bytes(b"RIFF\x00\x00\x00\x00WAVEmore!")
+        self.assertEqual(watcher.poll(12.0), [])      # still changing: timer restarts
+        self.assertEqual(watcher.poll(14.5), [demo])
+
+    def test_invalid_project_is_not_pushed(self):
+        demo = self.make_local_demo("acid_909_sampler")   # 16 zero bytes
+        watcher = sync.DemoWatcher(debounce=0)
+        self.assertEqual(watcher.poll(0.0), [demo])
+        root = self.test_volume / sync.REMOTE_SUBPATH
+        with ThreadPoolExecutor(1) as pool, \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertFalse(sync.sync_changed(watcher, demo, root, pool))
+        self.assertIn("invalid, not pushed", out.getvalue())
+        self.assertFalse((root / "acid-909-sampler").exists())
+
+    def test_pushes_only_changed_files(self):
+        demo = self.make_valid_demo("acid_909_sampler", wavs=["kick.wav", "snare.wav"])
+        root = self.test_volume / sync.REMOTE_SUBPATH
+        watcher = sync.DemoWatcher(debounce=0)
+        with ThreadPoolExecutor(1) as pool, contextlib.redirect_stdout(io.StringIO()):
+            for d in watcher.poll(0.0):
+                self.assertTrue(sync.sync_changed(watcher, d, root, pool))
+        self.assertTrue((root / "acid-909-sampler" / "samples" / "snare.wav").exists())
+
+        (demo / "samples" / "kick.wav").write_bytes(b"RIFF\x01\x00\x00\x00WAVE")
+        ready = watcher.poll(1.0)
+        self.assertEqual(ready, [demo])
+        self.assertEqual(watcher.changed_projects(demo), [])
+        with ThreadPoolExecutor(1) as pool, \
+                mock.patch.object(sync, "validate_project") as validate, \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertTrue(sync.sync_changed(watcher, demo, root, pool))
+        validate.assert_not_called()
+        self.assertIn("1 copied, 2 unchanged", out.getvalue())
+
+    def test_failed_push_is_retried(self):
+        demo = self.make_valid_demo("acid_909_sampler", wavs=["kick.wav"])
+        root = self.test_volume / sync.REMOTE_SUBPATH
+        watcher = sync.DemoWatcher(debounce=0)
+        self.assertEqual(watcher.poll(0.0), [demo])
+        with ThreadPoolExecutor(1) as pool, contextlib.redirect_stdout(io.StringIO()) as out:
+            with mock.patch.object(sync, "push_demo", return_value=False):
+                self.assertFalse(sync.sync_changed(watcher, demo, root, pool, now=0.0))
+            self.assertIn("retrying in 5s", out.getvalue())
+            self.assertEqual(watcher.poll(1.0), [])                 # backing off
+            self.assertEqual(watcher.poll(sync.RETRY_DELAY), [demo])
+            self.assertTrue(sync.sync_changed(watcher, demo, root, pool, now=sync.RETRY_DELAY))
+        self.assertTrue((root / "acid-909-sampler" / "samples" / "kick.wav").exists())
+        self.assertEqual(watcher.failures, {})
+        self.assertEqual(watcher.poll(100.0), [])
+
+    def test_retry_backoff_doubles(self):
+        watcher = sync.DemoWatcher(debounce=0)
+        demo = self.local_root / "x"
+        delays = [watcher.retry_later(demo, 0.0) for _ in range(6)]
+        self.assertEqual(delays, [5.0, 10.0, 20.0, 40.0, 60.0, 60.0])
+
+    def test_watch_loop_pushes_until_interrupted(self):
+        self.make_valid_demo("euclid_sampler")
+        with mock.patch.object(sync.time, "sleep", side_effect=KeyboardInterrupt), \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.watch(pattern=None, test_mode=True, debounce=0)
+        self.assertIn("stopped watching", out.getvalue())
+        target = self.test_volume / sync.REMOTE_SUBPATH / "euclid-sampler"
+        self.assertTrue((target / "euclid_sampler.m8s").exists())
+
+
+class TestSamplePool(SyncTestBase):
+    KICK = b"RIFF\x00\x00\x00\x00WAVEkick"
+
+    def make_sampler_demo(self, name, samples):
+        """Demo whose project has one sampler per {relpath: bytes} sample."""
+        from m8.api.instruments.sampler import M8Sampler
+        from m8.api.project import M8Project
+        d = self.local_root / name
+        project = M8Project.initialise()
+        for i, (rel, data) in enumerate(sorted(samples.items())):
+            (d / rel).parent.mkdir(parents=True, exist_ok=True)
+            (d / rel).write_bytes(data)
+            project.instruments[i] = M8Sampler(name=f"S{i}", sample_path=rel)
+        project.write_to_file(str(d / f"{name}.m8s"))
+        return d
+
+    def remote_sample_paths(self, name):
+        from m8.api.project import M8Project
+        project = M8Project.read_from_file(
+            str(self.test_volume / sync.REMOTE_SUBPATH / name / f"{name.replace('-', '_')}.m8s"))
+        return [i.sample_path for i in project.instruments if getattr(i, "sample_path", "")]
+
+    def push_pooled(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            sync.push(pattern=None, force=True, test_mode=True, use_pool=True, **kwargs)
+        return out.getvalue()
+
+    def test_shared_samples_written_once(self):
+        self.make_sampler_demo("acid_909_sampler", {"samples/kick.wav": self.KICK,
+                                                    "samples/snare.wav": b"RIFFsnare"})
+        self.make_sampler_demo("euclid_sampler", {"samples/bd.wav": self.KICK})
+        out = self.push_pooled()
+        self.assertIn("2 pooled", out)
+        self.assertIn("1 copied, 0 unchanged", out)   # euclid: kick already pooled
+
+        root = self.test_volume / sync.REMOTE_SUBPATH
+        pool = sorted(p.name for p in (root / sync.POOL_DIR).glob("*.wav"))
+        self.assertEqual(len(pool), 2)
+        self.assertFalse((root / "acid-909-sampler" / "samples").exists())
+        kick_path = sync.pool_sample_path(sync.file_sha256(
+            self.local_root / "euclid_sampler" / "samples" / "bd.wav")[:16] + ".wav")
+        self.assertEqual(self.remote_sample_paths("euclid-sampler"), [kick_path])
+        self.assertIn(kick_path, self.remote_sample_paths("acid-909-sampler"))
+        self.assertEqual([d.name for d in sync.find_remote(test_mode=True)],
+                         ["acid-909-sampler", "euclid-sampler"])
+
+        self.assertEqual(self.push_pooled().count("up to date"), 2)
+
+    def test_switching_to_pool_leaves_old_samples_stale(self):
+        self.make_sampler_demo("acid_909_sampler", {"samples/kick.wav": self.KICK})
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.push(pattern=None, force=True, test_mode=True)
+        self.assertIn("1 stale", self.push_pooled())
+        self.push_pooled(delete=True)
+        target = self.test_volume / sync.REMOTE_SUBPATH / "acid-909-sampler"
+        self.assertFalse((target / "samples" / "kick.wav").exists())
+
+    def test_clean_remote_prunes_unreferenced_pool_samples(self):
+        self.make_sampler_demo("acid_909_sampler", {"samples/kick.wav": self.KICK,
+                                                    "samples/snare.wav": b"RIFFsnare"})
+        self.make_sampler_demo("euclid_sampler", {"samples/bd.wav": self.KICK})
+        self.push_pooled()
+        pool = self.test_volume / sync.REMOTE_SUBPATH / sync.POOL_DIR
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.clean_remote(pattern="acid", force=True, test_mode=True)
+        self.assertEqual(len(list(pool.glob("*.wav"))), 1)   # kick still used
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync.clean_remote(pattern="euclid", force=True, test_mode=True)
+        self.assertEqual(list(pool.glob("*.wav")), [])
+
+
 class TestCleanLocal(SyncTestBase):
     def test_removes_matched_demo(self):
         self.make_local_demo("acid_303_wavsynth")
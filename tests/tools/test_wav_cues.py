@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Tests for the WAV cue reader and in-place editor."""
+
+import tempfile
+import unittest
+from io import BytesIO
+from pathlib import Path
+
+from pydub.generators import Sine
+
+from m8.tools.wav_cues import read_cues, rewrite_cues_in_place, scan_cues
+from m8.tools.wav_slicer import WAVSlicer
+
+
+class _NoDataRead(BytesIO):
+    """File object that fails if the data chunk payload is read."""
+
+    def __init__(self, data, data_offset):
+        super().__init__(data)
+        self.data_offset = data_offset
+
+    def read(self, size=-1):
+        pos = self.tell()
+        if pos <= self.data_offset + 8 < pos + (size if size >= 0 else 1 << 62):
+            raise AssertionError("audio data was read")
+        return super().read(size)
+
+
+class TestWAVCues(unittest.TestCase):
+
+    def setUp(self):
+        self.slicer = WAVSlicer()
+        tone = Sine(440).to_audio_segment(duration=100).set_frame_rate(44100)
+        buf = BytesIO()
+        tone.export(buf, format="wav")
+        self.plain = buf.getvalue()
+        self.sliced = self.slicer.add_slice_points(self.plain, [0, 1000, 2000]).getvalue()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_read_sliced(self):
+        info = read_cues(BytesIO(self.sliced))
+        self.assertEqual((info.frame_rate, info.channels, info.sample_width), (44100, 1, 2))
+        self.assertEqual(info.frames, 4410)
+        self.assertEqual([c.chunk_id for c in info.cues], [b'data', b'atad'])
+        self.assertEqual(info.standard_points, [0, 1000, 2000])
+        self.assertEqual(info.m8_points, [0, 1000, 2000])
+        self.assertEqual(info.slice_points, [0, 1000, 2000])
+        self.assertTrue(info.consistent)
+
+    def test_read_skips_audio_data(self):
+        data_offset = self.sliced.find(b'data', 12 + 8 + 16 + 12 + 24 * 3)
+        read_cues(_NoDataRead(self.sliced, data_offset))
+
+    def test_read_plain(self):
+        info = read_cues(BytesIO(self.plain))
+        self.assertEqual(info.cues, [])
+        self.assertEqual(info.slice_points, [])
+        self.assertIsNone(info.m8_points)
+
+    def test_not_a_wav(self):
+        with self.assertRaises(ValueError):
+            read_cues(BytesIO(b'NOT A WAV FILE'))
+
+    def test_inconsistent(self):
+        path = self.root / "a.wav"
+        path.write_bytes(self.slicer.add_slice_points(self.plain, [0, 9999]).getvalue())
+        self.assertFalse(read_cues(path).consistent)
+
+    def test_rewrite_in_place(self):
+        path = self.root / "a.wav"
+        path.write_bytes(self.sliced)
+        self.assertTrue(rewrite_cues_in_place(path, [5, 6, 7]))
+        self.assertEqual(path.read_bytes(),
+                         self.slicer.add_slice_points(self.plain, [5, 6, 7]).getvalue())
+
+    def test_rewrite_refuses_size_change(self):
+        path = self.root / "a.wav"
+        path.write_bytes(self.sliced)
+        self.assertFalse(rewrite_cues_in_place(path, [5, 6]))
+        self.assertEqual(path.read_bytes(), self.sliced)
+
+    def test_rewrite_rejects_out_of_range(self):
+        path = self.root / "a.wav"
+        path.write_bytes(self.sliced)
+        with self.assertRaises(ValueError):
+            rewrite_cues_in_place(path, [0, 1, 5000])
+        self.assertEqual(path.read_bytes(), self.sliced)
+
+    def test_scan(self):
+        good = self.root / "good.wav"
+        good.write_bytes(self.sliced)
+        bad = self.root / "bad.wav"
+        bad.write_bytes(b'junk')
+        results = dict(scan_cues([good, bad], workers=2))
+        self.assertEqual(results[good].slice_points, [0, 1000, 2000])
+        self.assertIsInstance(results[bad], ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """Tests for WAVSlicer."""
 
+import os
 import struct
+import tempfile
 import unittest
 from io import BytesIO
+from pathlib import Path
 from pydub import AudioSegment
 from pydub.generators import Sine
 
-from m8.tools.wav_slicer import WAVSlicer
+from m8.tools.wav_slicer import WAVSlicer, iter_chunks
 
 
 class TestWAVSlicer(unittest.TestCase):
@@ -141,5 +144,105 @@ class TestWAVSlicer(unittest.TestCase):
         self.assertEqual(num_cues, 1)
 
 
+class TestWAVSlicerBuildWav(unittest.TestCase):
+    """build_wav() emits header and cue chunks once around raw PCM."""
+
+    def setUp(self):
+        self.slicer = WAVSlicer()
+        self.tone = Sine(440).to_audio_segment(duration=250)
+
+    def test_matches_add_slice_points(self):
+        slice_points = [0, 2205, 4410]
+        wav_buffer = BytesIO()
+        self.tone.export(wav_buffer, format="wav")
+        expected = self.slicer.add_slice_points(wav_buffer.getvalue(), slice_points)
+
+        built = self.slicer.build_wav(
+            self.tone.raw_data, self.tone.frame_rate, self.tone.channels,
+            self.tone.sample_width, slice_points,
+        )
+        self.assertEqual(built.getvalue(), expected.getvalue())
+
+    def test_odd_data_size_is_padded(self):
+        built = self.slicer.build_wav(b'\x01\x02\x03', 8000, 1, 1, [0]).getvalue()
+        riff_size = struct.unpack('<I', built[4:8])[0]
+        self.assertEqual(riff_size, len(built) - 8)
+        self.assertEqual(len(built) % 2, 0)
+
+    def test_no_slice_points(self):
+        built = self.slicer.build_wav(self.tone.raw_data, 44100, 1, 2, []).getvalue()
+        self.assertNotIn(b'cue ', built)
+        self.assertEqual(AudioSegment.from_wav(BytesIO(built)).raw_data, self.tone.raw_data)
+
+
+class TestWAVSlicerFiles(unittest.TestCase):
+    """Streaming writes and in-place cue updates."""
+
+    def setUp(self):
+        self.slicer = WAVSlicer()
+        wav_buffer = BytesIO()
+        Sine(440).to_audio_segment(duration=250).export(wav_buffer, format="wav")
+        self.plain = wav_buffer.getvalue()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "tone.wav"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cue_points(self, data):
+        f = BytesIO(data)
+        points = []
+        for chunk_id, offset, size in iter_chunks(f):
+            if chunk_id == b'cue ':
+                count = struct.unpack_from('<I', data, offset + 8)[0]
+                points.append([
+                    struct.unpack_from('<I', data, offset + 12 + 24 * i + 4)[0]
+                    for i in range(count)
+                ])
+        return points
+
+    def test_iter_chunks(self):
+        ids = [c[0] for c in iter_chunks(BytesIO(self.plain))]
+        self.assertEqual(ids, [b'fmt ', b'data'])
+        with self.assertRaises(ValueError):
+            list(iter_chunks(BytesIO(b'NOT A WAV FILE')))
+
+    def test_write_sliced_matches_add_slice_points(self):
+        expected = self.slicer.add_slice_points(self.plain, [0, 100, 200]).getvalue()
+        self.path.write_bytes(self.plain)
+        out_path = self.path.with_name("out.wav")
+        with open(self.path, 'rb') as src, open(out_path, 'wb') as dst:
+            self.slicer.write_sliced(src, dst, [0, 100, 200])
+        self.assertEqual(out_path.read_bytes(), expected)
+
+    def test_write_sliced_in_memory_replaces_cues(self):
+        sliced = self.slicer.add_slice_points(self.plain, [0, 50]).getvalue()
+        out = BytesIO()
+        self.slicer.write_sliced(BytesIO(sliced), out, [0, 100, 200])
+        expected = self.slicer.add_slice_points(self.plain, [0, 100, 200]).getvalue()
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_update_in_place_same_count(self):
+        self.path.write_bytes(self.slicer.add_slice_points(self.plain, [0, 50]).getvalue())
+        inode = os.stat(self.path).st_ino
+        self.slicer.update_slice_points(self.path, [10, 60])
+        data = self.path.read_bytes()
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+        self.assertEqual(data, self.slicer.add_slice_points(self.plain, [10, 60]).getvalue())
+        self.assertEqual(self._cue_points(data), [[10, 60], [10, 60]])
+
+    def test_update_rewrites_on_count_change(self):
+        self.path.write_bytes(self.slicer.add_slice_points(self.plain, [0, 50]).getvalue())
+        self.slicer.update_slice_points(self.path, [0, 25, 50])
+        data = self.path.read_bytes()
+        self.assertEqual(data, self.slicer.add_slice_points(self.plain, [0, 25, 50]).getvalue())
+        self.assertEqual(list(Path(self.tmp.name).glob("*.part")), [])
+
+    def test_update_removes_slices(self):
+        self.path.write_bytes(self.slicer.add_slice_points(self.plain, [0, 50]).getvalue())
+        self.slicer.update_slice_points(self.path, [])
+        self.assertEqual(self.path.read_bytes(), self.plain)
+
+
 if __name__ == '__main__':
     unittest.main()
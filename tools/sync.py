@@ -7,7 +7,9 @@ tools/copy_demos_to_m8.py / clean_demos_from_m8.py / clean_local_demos.py.
 Subcommands:
 
     sync.py                              # default = status
-    sync.py push  [pattern] [-f] [--test]
+    sync.py push  [pattern] [-f] [--test] [--delete] [--jobs N] [--pool]
+    sync.py watch [pattern] [--test] [--delete] [--jobs N] [--pool]
+                  [--interval S] [--debounce S]
     sync.py clean local  [pattern] [-f]
     sync.py clean remote [pattern] [-f] [--test]
     sync.py status [--test]
@@ -16,6 +18,21 @@ Local source:  tmp/demos/<demo_name>/
 Remote target: /Volumes/M8/Songs/pym8-demos/<demo-name>/
                 (underscores become hyphens; or tmp/virtual-m8/ when --test)
 
+Push is incremental: a manifest (`.pym8-manifest.json`: size, mtime and
+sha256 per file) on both sides means only changed files are copied;
+`--delete` also removes remote files that no longer exist locally. Files
+are written in chunks to `<name>.part` and renamed when complete; a
+journal (`.pym8-journal.json`) lets an interrupted push resume.
+
+`--pool` stores each distinct sample once, content-addressed, in
+Songs/pym8-demos/_pool/<sha256[:16]>.wav and ships the demos' .m8s files
+with sampler paths rewritten to point there (staged in tmp/sync-staging).
+`clean remote` prunes pooled samples no remaining project references.
+
+`watch` polls tmp/demos and, once a demo's files have been quiet for the
+debounce period, validates its changed .m8s files (M8Project.read_from_file
++ validate) and pushes just that demo.
+
 Per-item prompts (`y/N`) gate every destructive op when run on a TTY. On a
 non-interactive stdin (piped, CI, agent-driven) the prompts auto-confirm —
 the verb itself remains the deliberate choice. `-f` skips prompts entirely.
@@ -23,16 +40,42 @@ the verb itself remains the deliberate choice. `-f` skips prompts entirely.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import pathlib
+import posixpath
 import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Optional
 
+try:
+    from m8.tools.content_hash import file_sha256
+except ImportError:
+    # Run from a checkout without pym8 installed
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+    from m8.tools.content_hash import file_sha256
 
 LOCAL_ROOT = pathlib.Path("tmp/demos")
 M8_VOLUME = pathlib.Path("/Volumes/M8")
 TEST_VOLUME = pathlib.Path("tmp/virtual-m8")
 REMOTE_SUBPATH = pathlib.Path("Songs/pym8-demos")
+MANIFEST_NAME = ".pym8-manifest.json"
+DEFAULT_JOBS = 4
+JOURNAL_NAME = ".pym8-journal.json"
+PART_SUFFIX = ".part"
+COPY_CHUNK_SIZE = 1024 * 1024
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 2.0
+RETRY_DELAY = 5.0           # first retry after a failed push; doubles per failure
+RETRY_MAX_DELAY = 60.0
+POOL_DIR = "_pool"
+POOL_HASH_CHARS = 16
+STAGING_SUBDIR = "sync-staging"
 
 
 def remote_root(test_mode: bool) -> pathlib.Path:
@@ -63,7 +106,7 @@ def find_remote(test_mode: bool, pattern: Optional[str] = None) -> list[pathlib.
     root = remote_root(test_mode)
     if not root.exists():
         return []
-    dirs = sorted(d for d in root.iterdir() if d.is_dir())
+    dirs = sorted(d for d in root.iterdir() if d.is_dir() and d.name != POOL_DIR)
     if pattern:
         pl = pattern.lower()
         dirs = [d for d in dirs if pl in d.name.lower()]
@@ -107,7 +150,415 @@ def _ensure_remote_root(test_mode: bool) -> None:
             cur.mkdir()
 
 
-def push(pattern: Optional[str], force: bool, test_mode: bool) -> None:
+def demo_files(demo_dir: pathlib.Path) -> list[str]:
+    """Relative paths a push ships: *.m8s plus samples/*.wav."""
+    files = [p.name for p in demo_dir.glob("*.m8s")]
+    samples = demo_dir / "samples"
+    if samples.exists():
+        files += [f"samples/{p.name}" for p in samples.glob("*.wav")]
+    return sorted(files)
+
+
+def load_manifest(directory: pathlib.Path) -> dict:
+    """{relpath: {"size", "mtime_ns", "sha256"}} or {} if missing/corrupt."""
+    try:
+        data = json.loads((directory / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if isinstance(data, dict) else {}
+
+
+def save_manifest(directory: pathlib.Path, entries: dict) -> None:
+    """Write atomically so an interrupted push never leaves a torn manifest."""
+    path = directory / MANIFEST_NAME
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"version": 1, "files": entries}, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def file_entry(path: pathlib.Path, cached: Optional[dict] = None) -> dict:
+    """Size/mtime/hash of `path`; the hash is reused if size and mtime match."""
+    st = path.stat()
+    if cached and cached.get("size") == st.st_size and cached.get("mtime_ns") == st.st_mtime_ns:
+        return cached
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": file_sha256(path)}
+
+
+def scan_local(demo_dir: pathlib.Path) -> dict:
+    """Manifest entries for the files a push ships from `demo_dir`.
+
+    Hashes are cached in the demo's own manifest, so only files whose size
+    or mtime changed are re-read.
+    """
+    local_cache = load_manifest(demo_dir)
+    local = {rel: file_entry(demo_dir / rel, local_cache.get(rel)) for rel in demo_files(demo_dir)}
+    if local != local_cache:
+        save_manifest(demo_dir, local)
+    return local
+
+
+def plan_push(local: dict, target: pathlib.Path):
+    """Compare the entries to ship with the remote copy in `target`.
+
+    Returns (remote_entries, to_copy, stale): `to_copy` lists relpaths
+    whose content differs or is missing remotely; `stale` lists remote
+    files not in `local`. Remote files are only hashed when the remote
+    manifest can't vouch for them (first push over a legacy copy, or a file
+    changed behind our back) and their size matches the local file.
+    """
+    remote_cache = load_manifest(target) if target.exists() else {}
+    remote = {}
+    to_copy = []
+    for rel, entry in local.items():
+        dst = target / rel
+        if not dst.exists():
+            to_copy.append(rel)
+            continue
+        st = dst.stat()
+        cached = remote_cache.get(rel)
+        if st.st_size != entry["size"]:
+            to_copy.append(rel)
+            continue
+        if not (cached and cached.get("size") == st.st_size and cached.get("mtime_ns") == st.st_mtime_ns):
+            cached = file_entry(dst)
+        remote[rel] = cached
+        if cached["sha256"] != entry["sha256"]:
+            to_copy.append(rel)
+
+    present = set(demo_files(target)) if target.exists() else set()
+    stale = sorted(present - set(local))
+    for rel in stale:
+        if rel in remote_cache:
+            remote[rel] = remote_cache[rel]
+    return remote, to_copy, stale
+
+
+# ---- sample pool ----
+
+def pool_sample_path(name: str) -> str:
+    """Absolute M8 path of a pooled sample, as written into sample_path."""
+    return f"/{(REMOTE_SUBPATH / POOL_DIR).as_posix()}/{name}"
+
+
+def staging_dir(demo_dir: pathlib.Path) -> pathlib.Path:
+    """Where pool-rewritten .m8s copies are staged (outside tmp/demos)."""
+    return LOCAL_ROOT.parent / STAGING_SUBDIR / m8_name(demo_dir)
+
+
+def stage_pooled(demo_dir: pathlib.Path, local: dict):
+    """Rewrite a demo's projects to use the shared sample pool.
+
+    Every M8Sampler whose (relative) sample_path names a sample shipped with
+    the demo is pointed at `_pool/<sha256[:16]>.wav`; the rewritten .m8s is
+    staged under tmp/sync-staging (rewritten only if its bytes changed, so
+    its mtime stays stable). Projects that fail to read are shipped as-is.
+
+    Returns:
+        (pooled, staged): {pool file name: sample relpath} and
+        {m8s relpath: (staged path, manifest entry)}
+    """
+    M8Project = _project_class()
+    from m8.api.instruments.sampler import M8Sampler
+
+    staging = staging_dir(demo_dir)
+    pooled, staged = {}, {}
+    for rel in local:
+        if not rel.endswith(".m8s"):
+            continue
+        try:
+            project = M8Project.read_from_file(str(demo_dir / rel))
+        except Exception as e:  # ship unreadable projects untouched
+            print(f"    {rel}: not rewritten for the pool ({type(e).__name__}: {e})")
+            continue
+        for instrument in project.instruments:
+            if not isinstance(instrument, M8Sampler) or not instrument.sample_path:
+                continue
+            sample_rel = posixpath.normpath(instrument.sample_path)
+            entry = local.get(sample_rel)
+            if entry is None:
+                continue  # absolute path or not shipped with the demo
+            name = entry["sha256"][:POOL_HASH_CHARS] + pathlib.PurePosixPath(sample_rel).suffix.lower()
+            pooled[name] = sample_rel
+            instrument.sample_path = pool_sample_path(name)
+
+        data = project.write()
+        path = staging / rel
+        if not path.exists() or path.read_bytes() != data:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        st = path.stat()
+        staged[rel] = (path, {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                              "sha256": hashlib.sha256(data).hexdigest()})
+    return pooled, staged
+
+
+def prune_pool(root: pathlib.Path) -> int:
+    """Delete pooled samples no remote project references; returns the count."""
+    pool_dir = root / POOL_DIR
+    if not pool_dir.exists():
+        return 0
+    M8Project = _project_class()
+    prefix = pool_sample_path("")
+    referenced = set()
+    for m8s in root.glob("*/*.m8s"):
+        if m8s.parent == pool_dir:
+            continue
+        try:
+            project = M8Project.read_from_file(str(m8s))
+        except Exception:  # keep everything if we can't tell what's used
+            return 0
+        for instrument in project.instruments:
+            path = getattr(instrument, "sample_path", "")
+            if path.startswith(prefix):
+                referenced.add(path[len(prefix):])
+    removed = 0
+    for sample in pool_dir.glob("*.wav"):
+        if sample.name not in referenced:
+            sample.unlink()
+            removed += 1
+    return removed
+
+
+# ---- copy engine ----
+
+class PushJournal:
+    """In-flight copies into one remote demo directory.
+
+    Maps relpath -> sha256 of the source being written to `<file>.part`.
+    It is persisted before a copy starts and cleared once the file is
+    renamed into place, so after an interrupted push a rerun knows which
+    `.part` files hold a prefix of the right content and can resume them.
+    """
+
+    def __init__(self, target: pathlib.Path):
+        self.target = target
+        self.path = target / JOURNAL_NAME
+        self._lock = threading.Lock()
+        try:
+            entries = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            entries = {}
+        self.entries = entries if isinstance(entries, dict) else {}
+
+    def _key(self, dst: pathlib.Path) -> str:
+        return dst.relative_to(self.target).as_posix()
+
+    def _save(self) -> None:
+        if not self.entries:
+            self.path.unlink(missing_ok=True)
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self.entries, indent=1, sort_keys=True))
+        os.replace(tmp, self.path)
+
+    def begin(self, dst: pathlib.Path, sha256: str) -> bool:
+        """Record a copy; True if an earlier one of the same content was cut short."""
+        key = self._key(dst)
+        with self._lock:
+            resumable = self.entries.get(key) == sha256
+            if not resumable:
+                self.entries[key] = sha256
+                self._save()
+            return resumable
+
+    def done(self, dst: pathlib.Path) -> None:
+        with self._lock:
+            if self.entries.pop(self._key(dst), None) is not None:
+                self._save()
+
+
+@dataclass
+class CopyResult:
+    path: pathlib.Path
+    size: int
+    written: int       # bytes actually written (less than size when resumed)
+    seconds: float
+
+    @property
+    def resumed(self) -> bool:
+        return self.written < self.size
+
+    def describe(self) -> str:
+        rate = self.written / self.seconds / 1e6 if self.seconds > 0 else float("inf")
+        text = f"{self.size / 1e6:.2f} MB in {self.seconds:.2f}s ({rate:.1f} MB/s)"
+        if self.resumed:
+            text += f", resumed at {(self.size - self.written) / 1e6:.2f} MB"
+        return text
+
+
+def _resume_offset(src: pathlib.Path, part: pathlib.Path) -> int:
+    """Where to continue writing `part`, or 0 to start over.
+
+    Drops any partially written chunk, then checks the last whole chunk
+    against the source — a torn or zero-filled tail restarts the copy.
+    """
+    offset = min(part.stat().st_size, src.stat().st_size)
+    offset -= offset % COPY_CHUNK_SIZE
+    if offset == 0:
+        return 0
+    with open(src, "rb") as a, open(part, "rb") as b:
+        a.seek(offset - COPY_CHUNK_SIZE)
+        b.seek(offset - COPY_CHUNK_SIZE)
+        if a.read(COPY_CHUNK_SIZE) != b.read(COPY_CHUNK_SIZE):
+            return 0
+    return offset
+
+
+def copy_file(src: pathlib.Path, dst: pathlib.Path, sha256: Optional[str] = None,
+              journal: Optional[PushJournal] = None) -> CopyResult:
+    """Copy in COPY_CHUNK_SIZE writes to `dst.part`, then rename into place.
+
+    A reader (or the M8) never sees a half-written file. With a journal
+    and the source hash, an interrupted copy resumes from its `.part`.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    part = dst.with_name(dst.name + PART_SUFFIX)
+    start = 0
+    if journal is not None and sha256 is not None:
+        if journal.begin(dst, sha256) and part.exists():
+            start = _resume_offset(src, part)
+
+    t0 = time.monotonic()
+    written = 0
+    with open(src, "rb") as fin, open(part, "r+b" if start else "wb") as fout:
+        fin.seek(start)
+        fout.seek(start)
+        fout.truncate()
+        buf = bytearray(COPY_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = fin.readinto(buf)
+            if not n:
+                break
+            fout.write(view[:n])
+            written += n
+        fout.flush()
+        os.fsync(fout.fileno())
+    shutil.copystat(src, part)
+    os.replace(part, dst)
+    if journal is not None:
+        journal.done(dst)
+    return CopyResult(dst, start + written, written, time.monotonic() - t0)
+
+
+def _copy_all(pool: ThreadPoolExecutor, jobs: dict, target: pathlib.Path,
+              journal: PushJournal, on_copied=None) -> list[str]:
+    """Run {relpath: (src, sha256)} copies into `target`; returns failed relpaths.
+
+    `on_copied(rel, result)` is called as each copy lands.
+    """
+    futures = {
+        pool.submit(copy_file, src, target / rel, sha256, journal): rel
+        for rel, (src, sha256) in jobs.items()
+    }
+    failed = []
+    for future in as_completed(futures):
+        rel = futures[future]
+        try:
+            result = future.result()
+        except OSError as e:
+            failed.append(rel)
+            print(f"    {rel}: FAILED ({e})")
+            continue
+        if on_copied is not None:
+            on_copied(rel, result)
+        print(f"    {rel}: {result.describe()}")
+    return failed
+
+
+def push_demo(demo_dir: pathlib.Path, root: pathlib.Path, pool: ThreadPoolExecutor,
+              force: bool, delete: bool = False, use_pool: bool = False) -> Optional[bool]:
+    """Incrementally push one demo into `root`.
+
+    With `use_pool`, samples its projects reference go to the shared
+    `_pool/` directory (each content once, across all demos) and the
+    projects are shipped with their sample paths rewritten to match.
+
+    Returns None if there was nothing to do (or the prompt was declined),
+    True if files were copied/deleted cleanly, False if any copy failed.
+    """
+    name = m8_name(demo_dir)
+    target = root / name
+    local = scan_local(demo_dir)
+    sources = {rel: demo_dir / rel for rel in local}
+    pool_missing = {}
+    if use_pool:
+        pooled, staged = stage_pooled(demo_dir, local)
+        for pool_name, sample_rel in pooled.items():
+            if not (root / POOL_DIR / pool_name).exists():
+                pool_missing[pool_name] = (sources[sample_rel], local[sample_rel]["sha256"])
+        for sample_rel in set(pooled.values()):
+            del local[sample_rel]
+        for rel, (path, entry) in staged.items():
+            local[rel], sources[rel] = entry, path
+
+    remote, to_copy, stale = plan_push(local, target)
+    removing = stale if delete else []
+    note = f", {len(stale)} stale (use --delete)" if stale and not delete else ""
+    if not to_copy and not removing and not pool_missing:
+        print(f"  {name} (up to date{note})")
+        if remote != load_manifest(target):
+            save_manifest(target, remote)
+        return None
+    action = "update" if target.exists() else "copy"
+    if not confirm(f"  {action} {name}? [y/N] ", force):
+        return None
+
+    if pool_missing:
+        # Samples first: a project must never reference a missing pool file
+        pool_dir = root / POOL_DIR
+        pool_dir.mkdir(exist_ok=True)
+        failed = _copy_all(pool, pool_missing, pool_dir, PushJournal(pool_dir))
+        if failed:
+            print(f"  {name} -> {len(failed)} pool sample(s) FAILED (rerun to resume)")
+            return False
+
+    target.mkdir(parents=True, exist_ok=True)
+
+    def record(rel, result):
+        st = result.path.stat()
+        # Record the remote stat: FAT mtimes don't match the source's
+        remote[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                       "sha256": local[rel]["sha256"]}
+
+    jobs = {rel: (sources[rel], local[rel]["sha256"]) for rel in to_copy}
+    failed = []
+    try:
+        failed = _copy_all(pool, jobs, target, PushJournal(target), record)
+    finally:
+        # Keep what landed even if interrupted; the journal covers the rest
+        save_manifest(target, remote)
+
+    if removing:
+        for rel in removing:
+            (target / rel).unlink(missing_ok=True)
+            remote.pop(rel, None)
+        save_manifest(target, remote)
+
+    unchanged = len(local) - len(to_copy)
+    copied = len(to_copy) - len(failed)
+    summary = f"{copied} copied, {unchanged} unchanged{note}"
+    if pool_missing:
+        summary += f", {len(pool_missing)} pooled"
+    if removing:
+        summary += f", {len(removing)} deleted"
+    if failed:
+        summary += f", {len(failed)} FAILED (rerun to resume)"
+    print(f"  {name} -> {summary}")
+    return not failed
+
+
+def push(pattern: Optional[str], force: bool, test_mode: bool,
+         delete: bool = False, jobs: int = DEFAULT_JOBS, use_pool: bool = False) -> None:
+    """Incremental push: copy only files whose content changed.
+
+    Each side keeps a manifest (size, mtime, sha256 per file): locally it
+    saves re-hashing unchanged files, remotely it records what was pushed
+    so unchanged files are recognised without reading them back. Stale
+    remote files are removed only with `delete`. Copies run on a pool of
+    `jobs` threads through `copy_file` (chunked, atomic, resumable); an
+    interrupted push picks up where it stopped on the next run.
+    """
     demos = find_local(pattern)
     if not demos:
         print("no local demos found in tmp/demos")
@@ -116,30 +567,146 @@ def push(pattern: Optional[str], force: bool, test_mode: bool) -> None:
     _ensure_remote_root(test_mode)
     root = remote_root(test_mode)
     print(f"found {len(demos)} demo(s); target: {root}")
-    copied = 0
-    for demo_dir in demos:
-        name = m8_name(demo_dir)
-        target = root / name
-        if target.exists():
-            print(f"  {name} (already on device, skipping)")
-            continue
-        if not confirm(f"  copy {name}? [y/N] ", force):
-            continue
-        target.mkdir(parents=True, exist_ok=True)
-        n_m8s = n_wav = 0
-        for m8s in demo_dir.glob("*.m8s"):
-            shutil.copy2(m8s, target / m8s.name)
-            n_m8s += 1
-        samples_src = demo_dir / "samples"
-        if samples_src.exists():
-            samples_dst = target / "samples"
-            samples_dst.mkdir(exist_ok=True)
-            for wav in samples_src.glob("*.wav"):
-                shutil.copy2(wav, samples_dst / wav.name)
-                n_wav += 1
-        print(f"  {name} -> {n_m8s} .m8s, {n_wav} .wav")
-        copied += 1
-    print(f"\ncopied {copied} demo(s) to {root}")
+    pushed = 0
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for demo_dir in demos:
+            pushed += bool(push_demo(demo_dir, root, pool, force, delete, use_pool))
+    print(f"\npushed {pushed} demo(s) to {root}")
+
+
+# ---- watch ----
+
+def _project_class():
+    """M8Project, importing from the repo checkout if pym8 isn't installed."""
+    try:
+        from m8.api.project import M8Project
+    except ImportError:
+        sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+        from m8.api.project import M8Project
+    return M8Project
+
+
+def validate_project(path: pathlib.Path) -> Optional[str]:
+    """None if `path` reads and validates as an M8 project, else the error."""
+    try:
+        _project_class().read_from_file(str(path)).validate()
+    except Exception as e:  # corrupt files fail in many ways; report, don't crash
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+class DemoWatcher:
+    """Polls tmp/demos and reports demos whose files settled after a change.
+
+    A demo is ready once none of its shipped files (size, mtime) changed for
+    `debounce` seconds, so a demo script still writing samples isn't pushed
+    half-done. Everything counts as changed on the first poll; that first
+    push is incremental, so an up-to-date device costs only a manifest check.
+    A demo whose push fails is queued again with exponential backoff.
+    """
+
+    def __init__(self, pattern: Optional[str] = None, debounce: float = DEFAULT_DEBOUNCE):
+        self.pattern = pattern
+        self.debounce = debounce
+        self.snapshot: dict = {}
+        self.pushed: dict = {}     # demo dir -> snapshot entry at last push
+        self.pending: dict = {}    # demo dir -> time of the last change seen
+        self.failures: dict = {}   # demo dir -> consecutive failed pushes
+
+    def scan(self) -> dict:
+        """{demo dir: {relpath: (size, mtime_ns)}} for every local demo."""
+        state = {}
+        for demo_dir in find_local(self.pattern):
+            files = {}
+            for rel in demo_files(demo_dir):
+                try:
+                    st = (demo_dir / rel).stat()
+                except FileNotFoundError:
+                    continue  # removed between glob and stat
+                files[rel] = (st.st_size, st.st_mtime_ns)
+            state[demo_dir] = files
+        return state
+
+    def poll(self, now: float) -> list[pathlib.Path]:
+        """Rescan; return the demos that changed and have since settled."""
+        current = self.scan()
+        for demo_dir, files in current.items():
+            if files != self.snapshot.get(demo_dir):
+                self.pending[demo_dir] = now
+        for demo_dir in set(self.pending) - set(current):
+            del self.pending[demo_dir]
+        self.snapshot = current
+        ready = sorted(d for d, t in self.pending.items() if now - t >= self.debounce)
+        for demo_dir in ready:
+            del self.pending[demo_dir]
+        return ready
+
+    def changed_projects(self, demo_dir: pathlib.Path) -> list[str]:
+        """.m8s files of `demo_dir` modified since it was last pushed."""
+        before = self.pushed.get(demo_dir, {})
+        return [rel for rel, st in self.snapshot.get(demo_dir, {}).items()
+                if rel.endswith(".m8s") and before.get(rel) != st]
+
+    def mark_pushed(self, demo_dir: pathlib.Path) -> None:
+        self.pushed[demo_dir] = self.snapshot.get(demo_dir, {})
+        self.failures.pop(demo_dir, None)
+
+    def retry_later(self, demo_dir: pathlib.Path, now: float) -> float:
+        """Requeue a demo whose push failed; returns the backoff delay."""
+        failures = self.failures[demo_dir] = self.failures.get(demo_dir, 0) + 1
+        delay = min(RETRY_DELAY * 2 ** (failures - 1), RETRY_MAX_DELAY)
+        # poll() releases a demo `debounce` seconds after its pending time
+        self.pending[demo_dir] = now + delay - self.debounce
+        return delay
+
+
+def sync_changed(watcher: DemoWatcher, demo_dir: pathlib.Path, root: pathlib.Path,
+                 pool: ThreadPoolExecutor, delete: bool = False,
+                 use_pool: bool = False, now: Optional[float] = None) -> bool:
+    """Validate a settled demo's changed projects, then push it.
+
+    An invalid .m8s holds back the whole demo until it is saved again; a
+    failed push (device gone, copy error) is retried by a later poll.
+    Returns True if the device is now up to date with the demo.
+    """
+    valid = True
+    for rel in watcher.changed_projects(demo_dir):
+        err = validate_project(demo_dir / rel)
+        if err is not None:
+            print(f"  {m8_name(demo_dir)}/{rel}: invalid, not pushed ({err})")
+            valid = False
+    if not valid:
+        return False
+    if push_demo(demo_dir, root, pool, True, delete, use_pool) is False:
+        delay = watcher.retry_later(demo_dir, time.monotonic() if now is None else now)
+        print(f"  {m8_name(demo_dir)}: push failed, retrying in {delay:g}s")
+        return False
+    watcher.mark_pushed(demo_dir)
+    return True
+
+
+def watch(pattern: Optional[str], test_mode: bool, interval: float = DEFAULT_INTERVAL,
+          debounce: float = DEFAULT_DEBOUNCE, delete: bool = False,
+          jobs: int = DEFAULT_JOBS, use_pool: bool = False) -> None:
+    """Poll tmp/demos every `interval` seconds and push demos as they change.
+
+    Runs until interrupted. Starting `watch` is the deliberate choice, so
+    pushes don't prompt.
+    """
+    _ensure_remote_root(test_mode)
+    root = remote_root(test_mode)
+    watcher = DemoWatcher(pattern, debounce)
+    print(f"watching {LOCAL_ROOT} -> {root} "
+          f"(poll {interval:g}s, debounce {debounce:g}s); Ctrl-C to stop")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        try:
+            while True:
+                now = time.monotonic()
+                for demo_dir in watcher.poll(now):
+                    sync_changed(watcher, demo_dir, root, pool, delete, use_pool, now)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\nstopped watching")
 
 
 # ---- clean ----
@@ -178,6 +745,10 @@ def clean_remote(pattern: Optional[str], force: bool, test_mode: bool) -> None:
         shutil.rmtree(d)
         removed += 1
     print(f"\nremoved {removed} of {len(demos)} demo(s).")
+    if removed:
+        pruned = prune_pool(root)
+        if pruned:
+            print(f"pruned {pruned} unused sample(s) from {POOL_DIR}/")
 
 
 # ---- status ----
@@ -227,6 +798,29 @@ def build_parser() -> argparse.ArgumentParser:
     add_pattern_and_force(push_p)
     push_p.add_argument("--test", action="store_true",
                         help="use tmp/virtual-m8 instead of /Volumes/M8")
+    push_p.add_argument("--delete", action="store_true",
+                        help="remove remote files that no longer exist locally")
+    push_p.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"parallel file copies (default {DEFAULT_JOBS})")
+    push_p.add_argument("--pool", action="store_true",
+                        help=f"store samples once in the shared {POOL_DIR}/ directory")
+
+    watch_p = sub.add_parser("watch", help="push demos to the M8 as they change")
+    watch_p.add_argument("pattern", nargs="?", default=None,
+                         help="filter demos by substring match on the M8 name")
+    watch_p.add_argument("--test", action="store_true",
+                         help="use tmp/virtual-m8 instead of /Volumes/M8")
+    watch_p.add_argument("--delete", action="store_true",
+                         help="remove remote files that no longer exist locally")
+    watch_p.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                         help=f"parallel file copies (default {DEFAULT_JOBS})")
+    watch_p.add_argument("--pool", action="store_true",
+                         help=f"store samples once in the shared {POOL_DIR}/ directory")
+    watch_p.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                         help=f"seconds between scans (default {DEFAULT_INTERVAL:g})")
+    watch_p.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                         help=f"seconds a demo must be unchanged before pushing "
+                              f"(default {DEFAULT_DEBOUNCE:g})")
 
     clean_p = sub.add_parser("clean", help="remove local or remote demos")
     clean_sub = clean_p.add_subparsers(dest="clean_what", required=True)
@@ -250,7 +844,11 @@ def main(argv=None):
     cmd = args.cmd or "status"
 
     if cmd == "push":
-        push(args.pattern, args.force, args.test)
+        push(args.pattern, args.force, args.test, delete=args.delete, jobs=args.jobs,
+             use_pool=args.pool)
+    elif cmd == "watch":
+        watch(args.pattern, args.test, interval=args.interval, debounce=args.debounce,
+              delete=args.delete, jobs=args.jobs, use_pool=args.pool)
     elif cmd == "status":
         status(getattr(args, "test", False))
     elif cmd == "clean":